@@ -1,18 +1,24 @@
 # app.py
 
-import json
 import time
+# [新增] 启动计时起点，放在所有导入之前，用于统计导入耗时
+STARTUP_T0 = time.perf_counter()
+
+import json
 import threading
 import os
 import sys
 import uuid
 import shutil
 import signal
-import webbrowser  # [新增]
+import socket
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime, timedelta
-from flask import Flask, request, jsonify, send_from_directory  # [修改] 新增 send_from_directory
+from flask import Flask, request, jsonify, send_from_directory, Response  # [修改] 新增 send_from_directory
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from flask_cors import CORS
 from flask_jwt_extended import (
     JWTManager,
@@ -25,23 +31,55 @@ from flask_jwt_extended import (
 from werkzeug.security import generate_password_hash, check_password_hash
 from dotenv import load_dotenv
 
+# ================= 启动耗时统计 =================
+# [(阶段名, 耗时秒)]，启动完成后统一打印，便于发现冷启动回归
+startup_timings = []
+_startup_last_mark = STARTUP_T0
+
+def mark_startup(stage):
+    """记录从上一个阶段结束到现在的耗时"""
+    global _startup_last_mark
+    now = time.perf_counter()
+    startup_timings.append((stage, now - _startup_last_mark))
+    _startup_last_mark = now
+
+def print_startup_timings():
+    print("启动耗时统计：", flush=True)
+    for stage, seconds in startup_timings:
+        print(f"  {stage:<12} {seconds * 1000:8.1f} ms", flush=True)
+    print(f"  {'总计':<12} {(time.perf_counter() - STARTUP_T0) * 1000:8.1f} ms", flush=True)
+
+mark_startup("模块导入")
+
 # 读取 .env 文件
 load_dotenv()
 FLASK_ENV = os.getenv("FLASK_ENV", "production") 
+# 定时增量备份间隔（小时），0 表示不开启
+try:
+    BACKUP_INTERVAL_HOURS = float(os.getenv("BACKUP_INTERVAL_HOURS", "0"))
+except ValueError:
+    print(f"BACKUP_INTERVAL_HOURS 配置无效: {os.getenv('BACKUP_INTERVAL_HOURS')!r}，已关闭定时备份", flush=True)
+    BACKUP_INTERVAL_HOURS = 0
 
 # 判断运行环境
 if getattr(sys, 'frozen', False):  # exe 打包环境
     dist_path = os.path.join(sys._MEIPASS, "dist")
-    sql_path = f"sqlite:///{os.path.join(sys._MEIPASS, 'db.sqlite')}"
+    # 数据库放在 exe 旁边：--onefile 模式下 _MEIPASS 是每次启动新建、退出即删除的临时目录，
+    # 放在那里既会丢数据，也会让 schema 版本检查每次都失效
+    sql_path = f"sqlite:///{os.path.join(os.path.dirname(sys.executable), 'db.sqlite')}"
+    jobs_sql_path = f"sqlite:///{os.path.join(os.path.dirname(sys.executable), 'jobs.sqlite')}"
 else:  # 开发环境
     dist_path = "../frontend/dist"
     sql_path = 'sqlite:///db.sqlite'
+    jobs_sql_path = 'sqlite:///jobs.sqlite'
 
 # static_url_path 设置为空字符串或特定路径，避免与 SPA 路由冲突，这里设为 /static 也可以，但配合下面 serve_react 使用 / 也没问题
 app = Flask(__name__, static_folder=dist_path, static_url_path="/")
 
 # 配置
 app.config['SQLALCHEMY_DATABASE_URI'] = sql_path
+# 后台任务队列使用独立的数据库文件，重置主数据库时任务记录不受影响
+app.config['SQLALCHEMY_BINDS'] = {'jobs': jobs_sql_path}
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['JWT_SECRET_KEY'] = 'super-secret-key-change-this-in-production' 
 
@@ -56,10 +94,20 @@ app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
 
+# 定时备份输出目录 (exe 环境下放在可执行文件旁边，避免随临时解压目录一起被清理)
+if getattr(sys, 'frozen', False):
+    BACKUP_FOLDER = os.path.join(os.path.dirname(sys.executable), 'backups')
+else:
+    BACKUP_FOLDER = os.path.join(app.root_path, 'backups')
+
 db = SQLAlchemy(app)
 CORS(app)
 jwt = JWTManager(app)
 
+# [新增] 数据库 schema 版本，记录在 SQLite 文件头的 user_version 中。
+# 修改模型或默认数据时递增此值，下次启动会重新执行建表和初始化。
+SCHEMA_VERSION = 2
+
 def clear_upload_folder():
     """
     清空上传图片目录 static/images
@@ -113,6 +161,41 @@ class Item(db.Model):
     item_type = db.relationship('ItemType', backref='items')
     owner = db.relationship('User', backref='items')
 
+class ItemFacet(db.Model):
+    """
+    物品分面计数汇总表：按 类型 / 状态 / 发布者 维护物品数量。
+    由增删改物品的接口在同一事务内增量更新，查询时无需扫描 item 表。
+    """
+    dimension = db.Column(db.String(20), primary_key=True)  # 'type_id' / 'status' / 'owner_id'
+    value = db.Column(db.String(50), primary_key=True)
+    item_count = db.Column(db.Integer, nullable=False, default=0)
+
+class Job(db.Model):
+    """后台任务记录，存放在独立的 jobs 数据库中，进程重启后可继续执行"""
+    __bind_key__ = 'jobs'
+    id = db.Column(db.String(32), primary_key=True)
+    kind = db.Column(db.String(50), nullable=False)        # 'delete_user' / 'reset_db' / 'incremental_backup'
+    payload = db.Column(db.Text, nullable=False, default='{}')
+    status = db.Column(db.String(20), nullable=False, default='pending')  # pending / running / done / failed / cancelled
+    progress = db.Column(db.Integer, nullable=False, default=0)
+    total = db.Column(db.Integer, nullable=False, default=0)
+    message = db.Column(db.Text)
+    created_by = db.Column(db.Integer)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": self.progress,
+            "total": self.total,
+            "message": self.message,
+            "created_at": self.created_at.strftime('%Y-%m-%d %H:%M:%S'),
+            "updated_at": self.updated_at.strftime('%Y-%m-%d %H:%M:%S')
+        }
+
 # ================= 辅助函数 =================
 def create_admin():
     if not User.query.filter_by(username='admin').first():
@@ -136,6 +219,504 @@ def create_admin():
         db.session.commit()
         print("Admin user and default types created.")
 
+def adjust_facets(type_id, status, owner_id, delta):
+    """
+    对一组 (类型, 状态, 发布者) 的分面计数加上 delta。
+    只加入当前 session，不提交，由调用方与物品的修改一起 commit。
+    """
+    stmt = sqlite_insert(ItemFacet).values([
+        {"dimension": "type_id", "value": str(type_id), "item_count": delta},
+        {"dimension": "status", "value": str(status), "item_count": delta},
+        {"dimension": "owner_id", "value": str(owner_id), "item_count": delta},
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=['dimension', 'value'],
+        set_={"item_count": ItemFacet.item_count + stmt.excluded.item_count}
+    )
+    db.session.execute(stmt)
+
+def rebuild_facets():
+    """从 item 表全量重建分面计数"""
+    ItemFacet.query.delete()
+    for dimension, column in (("type_id", Item.type_id), ("status", Item.status), ("owner_id", Item.owner_id)):
+        for value, count in db.session.query(column, db.func.count(Item.id)).group_by(column):
+            db.session.add(ItemFacet(dimension=dimension, value=str(value), item_count=count))
+    db.session.commit()
+
+def init_database():
+    """
+    启动时的数据库初始化。
+    user_version 与 SCHEMA_VERSION 一致且 user 表存在时说明建表和默认数据已完成，直接跳过，
+    避免每次启动都执行 create_all 和 create_admin 中的多次查询。
+    任务队列在独立的 jobs 数据库中，只在 job 表缺失时建表。
+    返回是否实际执行了初始化。
+    """
+    with db.engines['jobs'].connect() as conn:
+        has_job_table = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='job'"
+        ).first() is not None
+    if not has_job_table:
+        db.create_all(bind_key='jobs')
+
+    with db.engine.connect() as conn:
+        version = conn.exec_driver_sql("PRAGMA user_version").scalar()
+        has_tables = conn.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='user'"
+        ).first() is not None
+    if version == SCHEMA_VERSION and has_tables:
+        return False
+
+    db.create_all()
+    create_admin()
+    rebuild_facets()
+    set_schema_version(SCHEMA_VERSION)
+    return True
+
+def set_schema_version(version):
+    with db.engine.begin() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {int(version)}")
+
+def remove_uploaded_image(image_path):
+    """根据物品的 image_path (/static/images/xxx.jpg) 删除对应的图片文件"""
+    file_path = os.path.join(app.config['UPLOAD_FOLDER'], os.path.basename(image_path))
+    try:
+        if os.path.isfile(file_path):
+            os.unlink(file_path)
+    except Exception as e:
+        print(f"Failed to delete {file_path}: {e}", flush=True)
+
+# ================= 数据备份与恢复 (Backup & Restore) =================
+# sqlite3 / tarfile / tempfile 只在备份与恢复时用到，在函数内延迟导入，不占用冷启动时间
+BACKUP_DB_NAME = 'db.sqlite'      # 备份包中数据库文件的名称
+BACKUP_PAGES_PER_STEP = 64        # 在线备份每步复制的页数
+BACKUP_STEP_SLEEP = 0.01          # 每步之间释放锁的时间（秒），让其他连接的读写可以继续
+BACKUP_KEEP = 5                   # 定时备份保留的数据库快照数量
+BACKUP_READ_SIZE = 64 * 1024      # 生成备份包时每次读取文件的字节数
+TAR_BLOCK_SIZE = 512
+
+def get_sqlite_path():
+    """主数据库文件的实际路径（相对路径已由 Flask-SQLAlchemy 解析到 instance 目录）"""
+    return db.engine.url.database
+
+def snapshot_database(dest_path):
+    """用 SQLite 在线备份 API 分步复制主数据库，备份期间不阻塞其他读写"""
+    import sqlite3
+    src = sqlite3.connect(get_sqlite_path())
+    dst = sqlite3.connect(dest_path)
+    try:
+        src.backup(dst, pages=BACKUP_PAGES_PER_STEP, sleep=BACKUP_STEP_SLEEP)
+    finally:
+        dst.close()
+        src.close()
+
+def snapshot_image_names(snapshot_path):
+    """从快照中读取物品引用的图片文件名，保证图片与数据库内容一致"""
+    import sqlite3
+    conn = sqlite3.connect(snapshot_path)
+    try:
+        rows = conn.execute("SELECT image_path FROM item WHERE image_path IS NOT NULL").fetchall()
+    finally:
+        conn.close()
+    return sorted({os.path.basename(row[0]) for row in rows if row[0]})
+
+def tar_file_chunks(path, arcname):
+    """按 tar 格式逐块生成单个文件：头部、按固定大小读取的内容、补齐到 512 字节的 NUL 填充"""
+    import tarfile
+    info = tarfile.TarInfo(arcname)
+    stat = os.stat(path)
+    info.size = stat.st_size
+    info.mtime = int(stat.st_mtime)
+    yield info.tobuf()
+
+    remaining = info.size
+    with open(path, 'rb') as f:
+        while remaining > 0:
+            chunk = f.read(min(BACKUP_READ_SIZE, remaining))
+            if not chunk:
+                # 文件在读取期间变短，用 NUL 补足头部声明的长度，保持包结构完整
+                chunk = b"\0" * min(BACKUP_READ_SIZE, remaining)
+            remaining -= len(chunk)
+            yield chunk
+    padding = -info.size % TAR_BLOCK_SIZE
+    if padding:
+        yield b"\0" * padding
+
+def stream_backup_archive(snapshot_path, image_names):
+    """把数据库快照和图片逐块生成为 tar 流，内存占用与文件大小无关（临时快照由调用方在响应关闭时删除）"""
+    yield from tar_file_chunks(snapshot_path, BACKUP_DB_NAME)
+    for name in image_names:
+        image_path = os.path.join(app.config['UPLOAD_FOLDER'], name)
+        if os.path.isfile(image_path):
+            yield from tar_file_chunks(image_path, f"images/{name}")
+    # tar 结束标记：两个全零块
+    yield b"\0" * (TAR_BLOCK_SIZE * 2)
+
+def extract_backup_archive(stream, staging_dir):
+    """
+    从上传的备份包中取出数据库快照和图片到 staging_dir。
+    只接受 db.sqlite 和 images/<文件名> 形式的普通文件，忽略其他成员（防止路径穿越）。
+    返回 (快照路径, 图片目录)。
+    """
+    import tarfile
+    snapshot_path = os.path.join(staging_dir, BACKUP_DB_NAME)
+    image_dir = os.path.join(staging_dir, 'images')
+    os.makedirs(image_dir)
+    found_db = False
+
+    with tarfile.open(fileobj=stream, mode='r|') as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            if member.name == BACKUP_DB_NAME:
+                target = snapshot_path
+                found_db = True
+            elif member.name.startswith('images/'):
+                name = member.name[len('images/'):]
+                if name in ('', '.', '..') or name != os.path.basename(name):
+                    continue
+                target = os.path.join(image_dir, name)
+            else:
+                continue
+            with tar.extractfile(member) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+
+    if not found_db:
+        raise ValueError("Backup archive does not contain db.sqlite")
+    return snapshot_path, image_dir
+
+def validate_snapshot(snapshot_path):
+    import sqlite3
+    conn = sqlite3.connect(snapshot_path)
+    try:
+        if conn.execute("PRAGMA integrity_check").fetchone()[0] != 'ok':
+            raise ValueError("Snapshot failed integrity check")
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        if not {'user', 'item_type', 'item'} <= tables:
+            raise ValueError("Snapshot is not an item management database")
+    finally:
+        conn.close()
+
+def write_database_from(snapshot_path):
+    """用备份 API 一次性 (pages=-1) 把快照写回主数据库，在单个事务内完成，其他连接只会看到旧库或新库"""
+    import sqlite3
+    db.session.remove()
+    src = sqlite3.connect(snapshot_path)
+    dst = sqlite3.connect(get_sqlite_path(), timeout=30)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+    db.engine.dispose()
+
+def restore_snapshot(snapshot_path, image_dir):
+    """
+    用快照替换当前数据库和图片目录，任一步失败都回滚到恢复前的状态。
+    顺序：先备份当前数据库用于回滚，再把旧图片目录移开（Windows 下有图片文件被占用时在这一步失败，
+    此时尚未做任何修改），然后写回数据库、放入新图片目录。
+    """
+    folder = app.config['UPLOAD_FOLDER']
+    old_folder = folder + '.old'
+    rollback_path = os.path.join(os.path.dirname(snapshot_path), 'rollback.sqlite')
+    snapshot_database(rollback_path)
+
+    if os.path.exists(old_folder):
+        shutil.rmtree(old_folder)
+    os.replace(folder, old_folder)
+
+    db_written = False
+    try:
+        write_database_from(snapshot_path)
+        db_written = True
+        os.replace(image_dir, folder)
+    except Exception as e:
+        try:
+            if db_written:
+                write_database_from(rollback_path)
+            os.replace(old_folder, folder)
+        except Exception as rollback_error:
+            raise RuntimeError(
+                f"{e}; rollback failed ({rollback_error}), "
+                f"database {'is from the snapshot' if db_written else 'is unchanged'}, "
+                f"previous images are in {old_folder}"
+            ) from e
+        raise
+
+    shutil.rmtree(old_folder, ignore_errors=True)
+
+def run_incremental_backup():
+    """
+    定时增量备份：数据库每次做一份在线快照，图片只复制上次备份之后新增的文件。
+    返回 (快照路径, 本次复制的图片数量)。
+    """
+    image_backup_dir = os.path.join(BACKUP_FOLDER, 'images')
+    os.makedirs(image_backup_dir, exist_ok=True)
+    state_path = os.path.join(BACKUP_FOLDER, 'last_backup.json')
+    last_time = 0
+    if os.path.exists(state_path):
+        with open(state_path) as f:
+            last_time = json.load(f).get('time', 0)
+
+    started = time.time()
+    snapshot_path = os.path.join(BACKUP_FOLDER, f"db-{datetime.now().strftime('%Y%m%d-%H%M%S')}.sqlite")
+    snapshot_database(snapshot_path)
+
+    copied = 0
+    folder = app.config['UPLOAD_FOLDER']
+    for name in os.listdir(folder):
+        src = os.path.join(folder, name)
+        dst = os.path.join(image_backup_dir, name)
+        if os.path.isfile(src) and os.path.getmtime(src) >= last_time and not os.path.exists(dst):
+            shutil.copy2(src, dst)
+            copied += 1
+
+    with open(state_path, 'w') as f:
+        json.dump({"time": started}, f)
+
+    # 只保留最近的若干份数据库快照；图片目录是累积的，不做清理
+    snapshots = sorted(n for n in os.listdir(BACKUP_FOLDER) if n.startswith('db-') and n.endswith('.sqlite'))
+    for name in snapshots[:-BACKUP_KEEP]:
+        os.unlink(os.path.join(BACKUP_FOLDER, name))
+
+    return snapshot_path, copied
+
+def backup_scheduler(interval_hours):
+    """后台线程：按间隔提交增量备份任务，由任务队列执行"""
+    with app.app_context():
+        while True:
+            time.sleep(interval_hours * 3600)
+            try:
+                enqueue_job('incremental_backup', {})
+            except Exception as e:
+                db.session.rollback()
+                print(f"Failed to schedule backup: {e}", flush=True)
+            finally:
+                db.session.remove()
+
+# ================= 后台任务队列 (Job Queue) =================
+# 耗时的管理操作（级联删除用户、重置数据库）不在请求线程内执行，
+# 而是写入 jobs 数据库，由后台工作线程领取执行，接口立即返回任务 ID。
+JOB_WORKER_COUNT = 2
+JOB_BATCH_SIZE = 200       # 级联删除时每批删除的物品数量
+JOB_POLL_INTERVAL = 1      # 工作线程空闲时的轮询间隔（秒）
+job_wakeup = threading.Event()
+
+class SharedExclusiveLock:
+    """
+    简单的读写锁：普通任务和备份共享持有，重置/恢复主数据库时独占，
+    避免 drop_all 或快照写回与批量删除、备份同时进行。
+    有独占请求在等待时不再放行新的共享请求，防止重置被一直推迟。
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._shared = 0
+        self._exclusive = False
+        self._exclusive_waiting = 0
+
+    @contextmanager
+    def shared(self):
+        with self._cond:
+            while self._exclusive or self._exclusive_waiting:
+                self._cond.wait()
+            self._shared += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._shared -= 1
+                self._cond.notify_all()
+
+    @contextmanager
+    def exclusive(self):
+        with self._cond:
+            self._exclusive_waiting += 1
+            while self._exclusive or self._shared:
+                self._cond.wait()
+            self._exclusive_waiting -= 1
+            self._exclusive = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._exclusive = False
+                self._cond.notify_all()
+
+main_db_lock = SharedExclusiveLock()
+EXCLUSIVE_JOB_KINDS = {'reset_db'}
+
+def is_deleting_user(user_id):
+    """用户正在被删除（或已删除）时返回 True；其 token 在过期前仍有效，写操作需要拒绝"""
+    user = db.session.get(User, int(user_id))
+    return user is None or user.status == 'deleting'
+
+def enqueue_job(kind, payload, created_by=None):
+    job = Job(id=uuid.uuid4().hex, kind=kind, payload=json.dumps(payload), created_by=created_by)
+    db.session.add(job)
+    db.session.commit()
+    job_wakeup.set()
+    return job
+
+def cancel_pending_jobs(kinds, reason):
+    """
+    重置或恢复主数据库时取消尚未执行的任务：
+    删除用户任务的用户 ID 之后可能被复用，不能再按旧 ID 删除；
+    排队中的重置任务若在恢复之后执行，会清空刚恢复的数据。
+    只加入当前 session，由调用方提交。
+    """
+    return Job.query.filter(Job.kind.in_(kinds), Job.status == 'pending') \
+        .update({"status": "cancelled", "message": reason}, synchronize_session=False)
+
+def get_target_user(payload):
+    """取删除任务的目标用户；ID 已被其他用户复用或用户不再处于 deleting 状态时返回 None"""
+    user = db.session.get(User, payload['user_id'])
+    if user and user.username == payload.get('username') and user.status == 'deleting':
+        return user
+    return None
+
+def delete_item_batch(items, owner_id):
+    """删除同一用户的一批物品并扣减分面计数（不提交），返回需要在提交后删除的图片路径"""
+    if not items:
+        return []
+    groups = Counter((item.type_id, item.status) for item in items)
+    for (type_id, status), count in groups.items():
+        adjust_facets(type_id, status, owner_id, -count)
+    Item.query.filter(Item.id.in_([item.id for item in items])).delete(synchronize_session=False)
+    return [item.image_path for item in items if item.image_path]
+
+def run_delete_user_job(job, payload):
+    """分批删除用户的物品（连同图片文件和分面计数），最后删除用户本身"""
+    user = get_target_user(payload)
+    if user is None:
+        job.status = 'cancelled'
+        job.message = "Target user no longer exists or has been replaced"
+        return
+    owner_id = user.id
+    # 中断后恢复时 progress 保留了已删除的数量
+    job.total = job.progress + Item.query.filter_by(owner_id=owner_id).count()
+    db.session.commit()
+
+    while True:
+        batch = Item.query.filter_by(owner_id=owner_id).limit(JOB_BATCH_SIZE).all()
+        if not batch:
+            break
+        image_paths = delete_item_batch(batch, owner_id)
+        job.progress += len(batch)
+        db.session.commit()
+
+        # 数据库提交成功后再删除图片文件
+        for image_path in image_paths:
+            remove_uploaded_image(image_path)
+
+    # 最后一批之后仍可能有并发写入的物品，与用户本身放在同一事务中删除，避免留下没有发布者的物品
+    remaining = Item.query.filter_by(owner_id=owner_id).all()
+    image_paths = delete_item_batch(remaining, owner_id)
+    job.progress += len(remaining)
+    db.session.delete(user)
+    ItemFacet.query.filter_by(dimension='owner_id', value=str(owner_id)).delete()
+    db.session.commit()
+    for image_path in image_paths:
+        remove_uploaded_image(image_path)
+
+def run_reset_db_job(job, payload):
+    """重置主数据库，各步骤均可重复执行，中断后从头重跑即可"""
+    steps = [
+        clear_upload_folder,
+        # 先清除 schema 版本，重置中途失败时下次启动会重新建表
+        lambda: set_schema_version(0),
+        lambda: db.drop_all(bind_key=None),
+        lambda: db.create_all(bind_key=None),
+        create_admin,
+        lambda: set_schema_version(SCHEMA_VERSION),
+    ]
+    job.progress, job.total = 0, len(steps)
+    db.session.commit()
+    for step in steps:
+        step()
+        job.progress += 1
+        db.session.commit()
+
+def restore_user_status(job, payload):
+    """删除任务失败时把用户恢复为删除前的状态，管理员可以重新发起删除"""
+    user = get_target_user(payload)
+    if user:
+        user.status = payload['previous_status']
+
+def run_incremental_backup_job(job, payload):
+    job.progress, job.total = 0, 1
+    db.session.commit()
+    snapshot_path, copied = run_incremental_backup()
+    job.progress = 1
+    job.message = f"{os.path.basename(snapshot_path)}, {copied} new images"
+
+JOB_HANDLERS = {
+    'delete_user': run_delete_user_job,
+    'reset_db': run_reset_db_job,
+    'incremental_backup': run_incremental_backup_job,
+}
+
+# 任务失败后的补偿处理
+JOB_FAILURE_HANDLERS = {
+    'delete_user': restore_user_status,
+}
+
+def claim_next_job():
+    """领取最早的待执行任务；用条件更新保证多个工作线程不会领取同一个任务"""
+    job = Job.query.filter_by(status='pending').order_by(Job.created_at).first()
+    if not job:
+        return None
+    claimed = Job.query.filter_by(id=job.id, status='pending').update({"status": "running"})
+    db.session.commit()
+    return job if claimed else None
+
+def run_job(job):
+    payload = json.loads(job.payload)
+    lock = main_db_lock.exclusive() if job.kind in EXCLUSIVE_JOB_KINDS else main_db_lock.shared()
+    with lock:
+        try:
+            JOB_HANDLERS[job.kind](job, payload)
+            if job.status == 'running':
+                job.status = 'done'
+        except Exception as e:
+            db.session.rollback()
+            job.status = 'failed'
+            job.message = str(e)
+            print(f"Job {job.id} ({job.kind}) failed: {e}", flush=True)
+            if job.kind in JOB_FAILURE_HANDLERS:
+                try:
+                    JOB_FAILURE_HANDLERS[job.kind](job, payload)
+                except Exception as e:
+                    db.session.rollback()
+                    job.status, job.message = 'failed', f"{job.message}; recovery failed: {e}"
+        db.session.commit()
+
+def job_worker():
+    with app.app_context():
+        while True:
+            job_wakeup.wait(JOB_POLL_INTERVAL)
+            job_wakeup.clear()
+            try:
+                while (job := claim_next_job()) is not None:
+                    run_job(job)
+            except Exception as e:
+                db.session.rollback()
+                print(f"Job worker error: {e}", flush=True)
+            finally:
+                db.session.remove()
+
+def start_job_workers():
+    """
+    启动后台工作线程（需在 app context 中调用，且在 init_database 之后）。
+    上次进程退出时仍处于 running 的任务会重新置为 pending，由工作线程继续执行。
+    """
+    resumed = Job.query.filter_by(status='running').update({"status": "pending"})
+    db.session.commit()
+    if resumed:
+        print(f"恢复 {resumed} 个未完成的后台任务", flush=True)
+
+    for _ in range(JOB_WORKER_COUNT):
+        threading.Thread(target=job_worker, daemon=True).start()
+    job_wakeup.set()
+
 # ================= 修复图片访问路由 ================= [新增/修改]
 # 注意：把这个放在 serve_react 之前，或者放在路由部分的任何位置
 
@@ -289,6 +870,7 @@ def delete_type(type_id):
         return jsonify({"msg": "Cannot delete type: It is being used by existing items."}), 400
         
     db.session.delete(item_type)
+    ItemFacet.query.filter_by(dimension='type_id', value=str(type_id)).delete()
     db.session.commit()
     return jsonify({"msg": "Type deleted successfully"}), 200
 
@@ -298,6 +880,8 @@ def delete_type(type_id):
 def add_item():
     current_user_id = get_jwt_identity()
     user = User.query.get(int(current_user_id))
+    if user is None or user.status == 'deleting':
+        return jsonify({"msg": "Account is being deleted"}), 403
     data = request.json
     
     new_item = Item(
@@ -314,6 +898,7 @@ def add_item():
         status='available'
     )
     db.session.add(new_item)
+    adjust_facets(new_item.type_id, new_item.status, new_item.owner_id, 1)
     db.session.commit()
     return jsonify({"msg": "Item added successfully"}), 201
 
@@ -362,18 +947,31 @@ def get_items():
         })
     return jsonify(result)
 
+@app.route('/items/facets', methods=['GET'])
+def get_item_facets():
+    """返回按 类型 / 状态 / 发布者 统计的物品数量，直接读取汇总表"""
+    result = {"type_id": {}, "status": {}, "owner_id": {}}
+    for facet in ItemFacet.query.filter(ItemFacet.item_count > 0):
+        result[facet.dimension][facet.value] = facet.item_count
+    return jsonify(result)
+
 @app.route('/items/<int:item_id>', methods=['DELETE'])
 @jwt_required()
 def delete_item(item_id):
     current_user_id = int(get_jwt_identity()) # 获取 ID
     identity = get_jwt()
+    if is_deleting_user(current_user_id):
+        return jsonify({"msg": "Account is being deleted"}), 403
     item = Item.query.get_or_404(item_id)
     
     # 允许所有者或管理员删除
     if item.owner_id != current_user_id and identity['role'] != 'admin':
         return jsonify({"msg": "Permission denied"}), 403
         
-    db.session.delete(item)
+    # 按影响行数判断：并发删除同一物品时只有一个请求会扣减分面计数
+    deleted = Item.query.filter_by(id=item_id).delete()
+    if deleted == 1:
+        adjust_facets(item.type_id, item.status, item.owner_id, -1)
     db.session.commit()
     return jsonify({"msg": "Item deleted"}), 200
 
@@ -383,6 +981,8 @@ def delete_item(item_id):
 def update_item(item_id):
     current_user_id = int(get_jwt_identity())
     identity = get_jwt()
+    if is_deleting_user(current_user_id):
+        return jsonify({"msg": "Account is being deleted"}), 403
     item = Item.query.get_or_404(item_id)
     
     # 权限验证：只有所有者或管理员可以修改
@@ -403,8 +1003,15 @@ def update_item(item_id):
     # 更新状态 (Mark as Taken)
     if 'status' in data:
         # 限制状态只能是 available 或 taken
-        if data['status'] in ['available', 'taken']:
-            item.status = data['status']
+        if data['status'] in ['available', 'taken'] and data['status'] != item.status:
+            # 条件更新：只有状态仍是读取时的旧值才修改，并发请求中只有一个会命中，
+            # 命中时再同步调整分面计数（类型和发布者不变，先减后加相互抵消）
+            old_status = item.status
+            changed = Item.query.filter_by(id=item.id, status=old_status) \
+                .update({"status": data['status']})
+            if changed == 1:
+                adjust_facets(item.type_id, old_status, item.owner_id, -1)
+                adjust_facets(item.type_id, data['status'], item.owner_id, 1)
             
     # 更新动态属性
     if 'attributes' in data:
@@ -467,18 +1074,28 @@ def delete_user(user_id):
     if str(user.id) == get_jwt_identity():
         return jsonify({"msg": "Cannot delete yourself"}), 400
 
+    return start_delete_user_job(user)
+    
+def start_delete_user_job(user):
+    """
+    提交级联删除用户的后台任务，立即返回任务 ID。
+    先把用户状态置为 deleting，阻止其再次登录。
+    """
+    active_jobs = Job.query.filter(Job.kind == 'delete_user', Job.status.in_(['pending', 'running'])).all()
+    if any(json.loads(job.payload)['user_id'] == user.id for job in active_jobs):
+        return jsonify({"msg": "User deletion is already in progress"}), 400
+
+    # 已是 deleting 但没有进行中的任务（例如任务被取消），说明删除前的状态已丢失，按 approved 处理
+    previous_status = user.status if user.status != 'deleting' else 'approved'
+    payload = {"user_id": user.id, "username": user.username, "previous_status": previous_status}
     try:
-        # 手动级联删除：先删除该用户发布的所有物品
-        Item.query.filter_by(owner_id=user.id).delete()
-        
-        # 删除用户
-        db.session.delete(user)
-        db.session.commit()
-        return jsonify({"msg": "User and their items deleted successfully"}), 200
+        user.status = 'deleting'
+        job = enqueue_job('delete_user', payload, created_by=int(get_jwt_identity()))
+        return jsonify({"msg": "User deletion started", "job_id": job.id}), 202
     except Exception as e:
         db.session.rollback()
         return jsonify({"msg": f"Delete failed: {str(e)}"}), 500
-    
+
 # 注销用户接口
 @app.route('/users/<int:user_id>', methods=['DELETE'])
 @jwt_required()
@@ -487,17 +1104,7 @@ def delete_self(user_id):
     if user_id != current_user_id:
         return jsonify({"msg": "Permission denied"}), 403
     user = User.query.get_or_404(user_id)
-    try:
-        # 手动级联删除：先删除该用户发布的所有物品
-        Item.query.filter_by(owner_id=user.id).delete()
-        
-        # 删除用户
-        db.session.delete(user)
-        db.session.commit()
-        return jsonify({"msg": "User and their items deleted successfully"}), 200
-    except Exception as e:
-        db.session.rollback()
-        return jsonify({"msg": f"Delete failed: {str(e)}"}), 500
+    return start_delete_user_job(user)
     
 @app.route('/admin/promote/<int:user_id>', methods=['POST'])
 @jwt_required()
@@ -552,6 +1159,20 @@ def approve_user(user_id):
     db.session.commit()
     return jsonify({"msg": f"User {action}d"}), 200
 
+@app.route('/admin/facets/rebuild', methods=['POST'])
+@jwt_required()
+def rebuild_item_facets():
+    identity = get_jwt()
+    if identity['role'] != 'admin':
+        return jsonify({"msg": "Admin only"}), 403
+
+    try:
+        rebuild_facets()
+        return jsonify({"msg": "Facet counts rebuilt"}), 200
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"msg": f"Rebuild failed: {str(e)}"}), 500
+
 # 4.1 修改个人信息 (User Profile Update)
 @app.route('/users/<int:user_id>', methods=['PUT'])
 @jwt_required()
@@ -563,6 +1184,8 @@ def update_user_profile(user_id):
         return jsonify({"msg": "Permission denied"}), 403
         
     user = User.query.get_or_404(user_id)
+    if user.status == 'deleting':
+        return jsonify({"msg": "Account is being deleted"}), 403
     data = request.json
     
     if 'phone' in data: user.phone = data['phone']
@@ -597,6 +1220,9 @@ def get_user_detail(user_id):
 @app.route('/upload', methods=['POST'])
 @jwt_required()
 def upload_image():
+    if is_deleting_user(get_jwt_identity()):
+        return jsonify({"msg": "Account is being deleted"}), 403
+
     if 'file' not in request.files:
         return jsonify({"msg": "No file part"}), 400
     
@@ -628,21 +1254,96 @@ def reset_database():
         return jsonify({"msg": "Critical Error: Unauthorized access. Only the superuser 'admin' can perform this action."}), 403
 
     try:
-        # 清空图片上传目录
-        clear_upload_folder()
-        # 1. 删除所有表
-        db.drop_all()
-        # 2. 重新创建所有表
-        db.create_all()
-        # 3. 重新运行初始化函数（创建默认admin和物品类型）
-        create_admin()
-        
-        return jsonify({"msg": "Database has been reset to initial state."}), 200
+        # 清空图片目录、删表、建表、创建默认数据，均由后台任务执行
+        cancel_pending_jobs(['delete_user'], "Cancelled by database reset")
+        job = enqueue_job('reset_db', {}, created_by=int(get_jwt_identity()))
+        return jsonify({"msg": "Database reset started", "job_id": job.id}), 202
     except Exception as e:
-        # 发生错误尝试回滚，虽然 drop_all 很难回滚，但是个好习惯
         db.session.rollback()
         return jsonify({"msg": f"Reset failed: {str(e)}"}), 500
 
+@app.route('/jobs/<job_id>', methods=['GET'])
+@jwt_required()
+def get_job_status(job_id):
+    identity = get_jwt()
+    job = Job.query.get_or_404(job_id)
+
+    # 允许 admin 查看任何任务，或用户查看自己提交的任务
+    if job.created_by != int(get_jwt_identity()) and identity['role'] != 'admin':
+        return jsonify({"msg": "Permission denied"}), 403
+
+    return jsonify(job.to_dict())
+
+@app.route('/admin/backup', methods=['GET'])
+@jwt_required()
+def backup_database():
+    """在线备份数据库，并与引用到的图片一起以 tar 流的形式下载"""
+    identity = get_jwt()
+    if identity['role'] != 'admin':
+        return jsonify({"msg": "Admin only"}), 403
+
+    import tempfile
+    fd, snapshot_path = tempfile.mkstemp(suffix='.sqlite')
+    os.close(fd)
+    try:
+        with main_db_lock.shared():
+            snapshot_database(snapshot_path)
+        image_names = snapshot_image_names(snapshot_path)
+    except Exception as e:
+        os.unlink(snapshot_path)
+        return jsonify({"msg": f"Backup failed: {str(e)}"}), 500
+
+    filename = f"ims-backup-{datetime.now().strftime('%Y%m%d-%H%M%S')}.tar"
+    response = Response(
+        stream_backup_archive(snapshot_path, image_names),
+        mimetype='application/x-tar',
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+    def remove_snapshot():
+        if os.path.exists(snapshot_path):
+            os.unlink(snapshot_path)
+
+    # 无论是否开始发送（客户端可能提前断开），响应关闭时都删除临时快照
+    response.call_on_close(remove_snapshot)
+    return response
+
+@app.route('/admin/restore', methods=['POST'])
+@jwt_required()
+def restore_database():
+    identity = get_jwt()
+    # 与重置数据库相同，只有超级管理员 'admin' 可以执行
+    if identity['role'] != 'admin' or identity.get('username') != 'admin':
+        return jsonify({"msg": "Critical Error: Unauthorized access. Only the superuser 'admin' can perform this action."}), 403
+
+    if 'file' not in request.files:
+        return jsonify({"msg": "No file part"}), 400
+
+    import sqlite3
+    import tarfile
+    import tempfile
+    # 暂存目录与图片目录在同一磁盘上，保证图片目录可以直接重命名替换
+    staging_dir = tempfile.mkdtemp(dir=os.path.dirname(app.config['UPLOAD_FOLDER']))
+    try:
+        try:
+            snapshot_path, image_dir = extract_backup_archive(request.files['file'].stream, staging_dir)
+            validate_snapshot(snapshot_path)
+        except (tarfile.TarError, sqlite3.DatabaseError, ValueError, OSError) as e:
+            return jsonify({"msg": f"Invalid backup: {str(e)}"}), 400
+
+        try:
+            with main_db_lock.exclusive():
+                cancel_pending_jobs(['delete_user', 'reset_db'], "Cancelled by database restore")
+                db.session.commit()
+                restore_snapshot(snapshot_path, image_dir)
+                # 快照可能来自旧版本，按需补齐表结构和默认数据
+                init_database()
+            return jsonify({"msg": "Database has been restored from backup."}), 200
+        except Exception as e:
+            db.session.rollback()
+            return jsonify({"msg": f"Restore failed: {str(e)}"}), 500
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
 
 # 全局变量记录最后一次心跳时间
 last_heartbeat_time = time.time()
@@ -719,26 +1420,57 @@ if FLASK_ENV == "production" or getattr(sys, 'frozen', False):
 
 def open_browser():
     """[新增] 自动打开浏览器"""
+    # 延迟导入：webbrowser 只在启动完成后用到一次，不占用首个请求之前的时间
+    import webbrowser
     webbrowser.open("http://127.0.0.1:5000")
 
+def wait_for_server(port, auto_open_browser, timeout=30):
+    """
+    后台线程：轮询端口，直到服务器真正开始接受连接，
+    然后打印启动耗时统计，并按需打开浏览器（替代固定延时的 Timer）。
+    """
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                break
+        except OSError:
+            time.sleep(0.02)
+    else:
+        print(f"等待服务器启动超时 ({timeout} 秒)", flush=True)
+        return
+
+    mark_startup("服务器就绪")
+    print_startup_timings()
+    if auto_open_browser:
+        open_browser()
+
 if __name__ == '__main__':
     # 启动监控线程
     monitor_thread = threading.Thread(target=monitor_shutdown, daemon=True)
     monitor_thread.start()
+    mark_startup("应用配置")
     
-    # 数据库初始化
+    # 数据库初始化 (schema 版本一致时跳过)
     with app.app_context():
-        db.create_all()
-        create_admin()
+        initialized = init_database()
+        start_job_workers()
+    if BACKUP_INTERVAL_HOURS > 0:
+        threading.Thread(target=backup_scheduler, args=(BACKUP_INTERVAL_HOURS,), daemon=True).start()
+    mark_startup("数据库初始化" if initialized else "数据库检查")
     
     # [新增] 根据环境决定是否自动打开浏览器和开启 Debug
     if FLASK_ENV == "production" or getattr(sys, 'frozen', False):
-        # 生产环境/exe环境：自动打开浏览器，关闭 Debug
-        threading.Timer(1, open_browser).start()
+        # 生产环境/exe环境：端口就绪后自动打开浏览器，关闭 Debug
+        auto_open_browser = True
         debug_mode = False
     else:
         # 开发环境：开启 Debug
+        auto_open_browser = False
         debug_mode = True
 
+    port = 5000
+    threading.Thread(target=wait_for_server, args=(port, auto_open_browser), daemon=True).start()
+
     # 启动 Flask (注意：use_reloader=False 必须保持，否则心跳线程会失效)
-    app.run(debug=debug_mode, port=5000, use_reloader=False)
\ No newline at end of file
+    app.run(debug=debug_mode, port=port, use_reloader=False)
\ No newline at end of file
@@ -70,7 +70,7 @@ Please change the parent <Route path="${Z}"> to <Route path="${Z==="/"?"*":`${Z}
 `)}getSetCookie(){return this.get("set-cookie")||[]}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(r){return r instanceof this?r:new this(r)}static concat(r,...i){const o=new this(r);return i.forEach(c=>o.set(c)),o}static accessor(r){const o=(this[xm]=this[xm]={accessors:{}}).accessors,c=this.prototype;function d(h){const v=ai(h);o[v]||(Kb(c,h),o[v]=!0)}return U.isArray(r)?r.forEach(d):d(r),this}};yt.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]);U.reduceDescriptors(yt.prototype,({value:l},r)=>{let i=r[0].toUpperCase()+r.slice(1);return{get:()=>l,set(o){this[i]=o}}});U.freezeMethods(yt);function To(l,r){const i=this||fi,o=r||i,c=yt.from(o.headers);let d=o.data;return U.forEach(l,function(v){d=v.call(i,d,c.normalize(),r?r.status:void 0)}),c.normalize(),d}function Sp(l){return!!(l&&l.__CANCEL__)}function ul(l,r,i){he.call(this,l??"canceled",he.ERR_CANCELED,r,i),this.name="CanceledError"}U.inherits(ul,he,{__CANCEL__:!0});function xp(l,r,i){const o=i.config.validateStatus;!i.status||!o||o(i.status)?l(i):r(new he("Request failed with status code "+i.status,[he.ERR_BAD_REQUEST,he.ERR_BAD_RESPONSE][Math.floor(i.status/100)-4],i.config,i.request,i))}function Jb(l){const r=/^([-+\w]{1,25})(:?\/\/|:)/.exec(l);return r&&r[1]||""}function kb(l,r){l=l||10;const i=new Array(l),o=new Array(l);let c=0,d=0,h;return r=r!==void 0?r:1e3,function(y){const p=Date.now(),S=o[d];h||(h=p),i[c]=y,o[c]=p;let b=d,R=0;for(;b!==c;)R+=i[b++],b=b%l;if(c=(c+1)%l,c===d&&(d=(d+1)%l),p-h<r)return;const M=S&&p-S;return M?Math.round(R*1e3/M):void 0}}function $b(l,r){let i=0,o=1e3/r,c,d;const h=(p,S=Date.now())=>{i=S,c=null,d&&(clearTimeout(d),d=null),l(...p)};return[(...p)=>{const S=Date.now(),b=S-i;b>=o?h(p,S):(c=p,d||(d=setTimeout(()=>{d=null,h(c)},o-b)))},()=>c&&h(c)]}const Yu=(l,r,i=3)=>{let o=0;const c=kb(50,250);return $b(d=>{const h=d.loaded,v=d.lengthComputable?d.total:void 0,y=h-o,p=c(y),S=h<=v;o=h;const b={loaded:h,total:v,progress:v?h/v:void 0,bytes:y,rate:p||void 0,estimated:p&&v&&S?(v-h)/p:void 0,event:d,lengthComputable:v!=null,[r?"download":"upload"]:!0};l(b)},i)},Em=(l,r)=>{const i=l!=null;return[o=>r[0]({lengthComputable:i,total:l,loaded:o}),r[1]]},Cm=l=>(...r)=>U.asap(()=>l(...r)),Fb=ut.hasStandardBrowserEnv?((l,r)=>i=>(i=new URL(i,ut.origin),l.protocol===i.protocol&&l.host===i.host&&(r||l.port===i.port)))(new URL(ut.origin),ut.navigator&&/(msie|trident)/i.test(ut.navigator.userAgent)):()=>!0,Wb=ut.hasStandardBrowserEnv?{write(l,r,i,o,c,d,h){if(typeof document>"u")return;const v=[`${l}=${encodeURIComponent(r)}`];U.isNumber(i)&&v.push(`expires=${new Date(i).toUTCString()}`),U.isString(o)&&v.push(`path=${o}`),U.isString(c)&&v.push(`domain=${c}`),d===!0&&v.push("secure"),U.isString(h)&&v.push(`SameSite=${h}`),document.cookie=v.join("; ")},read(l){if(typeof document>"u")return null;const r=document.cookie.match(new RegExp("(?:^|; )"+l+"=([^;]*)"));return r?decodeURIComponent(r[1]):null},remove(l){this.write(l,"",Date.now()-864e5,"/")}}:{write(){},read(){return null},remove(){}};function Pb(l){return/^([a-z][a-z\d+\-.]*:)?\/\//i.test(l)}function Ib(l,r){return r?l.replace(/\/?\/$/,"")+"/"+r.replace(/^\/+/,""):l}function Ep(l,r,i){let o=!Pb(r);return l&&(o||i==!1)?Ib(l,r):r}const Rm=l=>l instanceof yt?{...l}:l;function ha(l,r){r=r||{};const i={};function o(p,S,b,R){return U.isPlainObject(p)&&U.isPlainObject(S)?U.merge.call({caseless:R},p,S):U.isPlainObject(S)?U.merge({},S):U.isArray(S)?S.slice():S}function c(p,S,b,R){if(U.isUndefined(S)){if(!U.isUndefined(p))return o(void 0,p,b,R)}else return o(p,S,b,R)}function d(p,S){if(!U.isUndefined(S))return o(void 0,S)}function h(p,S){if(U.isUndefined(S)){if(!U.isUndefined(p))return o(void 0,p)}else return o(void 0,S)}function v(p,S,b){if(b in r)return o(p,S);if(b in l)return o(void 0,p)}const y={url:d,method:d,data:d,baseURL:h,transformRequest:h,transformResponse:h,paramsSerializer:h,timeout:h,timeoutMessage:h,withCredentials:h,withXSRFToken:h,adapter:h,responseType:h,xsrfCookieName:h,xsrfHeaderName:h,onUploadProgress:h,onDownloadProgress:h,decompress:h,maxContentLength:h,maxBodyLength:h,beforeRedirect:h,transport:h,httpAgent:h,httpsAgent:h,cancelToken:h,socketPath:h,responseEncoding:h,validateStatus:v,headers:(p,S,b)=>c(Rm(p),Rm(S),b,!0)};return U.forEach(Object.keys({...l,...r}),function(S){const b=y[S]||c,R=b(l[S],r[S],S);U.isUndefined(R)&&b!==v||(i[S]=R)}),i}const Cp=l=>{const r=ha({},l);let{data:i,withXSRFToken:o,xsrfHeaderName:c,xsrfCookieName:d,headers:h,auth:v}=r;if(r.headers=h=yt.from(h),r.url=vp(Ep(r.baseURL,r.url,r.allowAbsoluteUrls),l.params,l.paramsSerializer),v&&h.set("Authorization","Basic "+btoa((v.username||"")+":"+(v.password?unescape(encodeURIComponent(v.password)):""))),U.isFormData(i)){if(ut.hasStandardBrowserEnv||ut.hasStandardBrowserWebWorkerEnv)h.setContentType(void 0);else if(U.isFunction(i.getHeaders)){const y=i.getHeaders(),p=["content-type","content-length"];Object.entries(y).forEach(([S,b])=>{p.includes(S.toLowerCase())&&h.set(S,b)})}}if(ut.hasStandardBrowserEnv&&(o&&U.isFunction(o)&&(o=o(r)),o||o!==!1&&Fb(r.url))){const y=c&&d&&Wb.read(d);y&&h.set(c,y)}return r},e1=typeof XMLHttpRequest<"u",t1=e1&&function(l){return new Promise(function(i,o){const c=Cp(l);let d=c.data;const h=yt.from(c.headers).normalize();let{responseType:v,onUploadProgress:y,onDownloadProgress:p}=c,S,b,R,M,T;function D(){M&&M(),T&&T(),c.cancelToken&&c.cancelToken.unsubscribe(S),c.signal&&c.signal.removeEventListener("abort",S)}let j=new XMLHttpRequest;j.open(c.method.toUpperCase(),c.url,!0),j.timeout=c.timeout;function L(){if(!j)return;const Q=yt.from("getAllResponseHeaders"in j&&j.getAllResponseHeaders()),ee={data:!v||v==="text"||v==="json"?j.responseText:j.response,status:j.status,statusText:j.statusText,headers:Q,config:l,request:j};xp(function(V){i(V),D()},function(V){o(V),D()},ee),j=null}"onloadend"in j?j.onloadend=L:j.onreadystatechange=function(){!j||j.readyState!==4||j.status===0&&!(j.responseURL&&j.responseURL.indexOf("file:")===0)||setTimeout(L)},j.onabort=function(){j&&(o(new he("Request aborted",he.ECONNABORTED,l,j)),j=null)},j.onerror=function(P){const ee=P&&P.message?P.message:"Network Error",ae=new he(ee,he.ERR_NETWORK,l,j);ae.event=P||null,o(ae),j=null},j.ontimeout=function(){let P=c.timeout?"timeout of "+c.timeout+"ms exceeded":"timeout exceeded";const ee=c.transitional||gp;c.timeoutErrorMessage&&(P=c.timeoutErrorMessage),o(new he(P,ee.clarifyTimeoutError?he.ETIMEDOUT:he.ECONNABORTED,l,j)),j=null},d===void 0&&h.setContentType(null),"setRequestHeader"in j&&U.forEach(h.toJSON(),function(P,ee){j.setRequestHeader(ee,P)}),U.isUndefined(c.withCredentials)||(j.withCredentials=!!c.withCredentials),v&&v!=="json"&&(j.responseType=c.responseType),p&&([R,T]=Yu(p,!0),j.addEventListener("progress",R)),y&&j.upload&&([b,M]=Yu(y),j.upload.addEventListener("progress",b),j.upload.addEventListener("loadend",M)),(c.cancelToken||c.signal)&&(S=Q=>{j&&(o(!Q||Q.type?new ul(null,l,j):Q),j.abort(),j=null)},c.cancelToken&&c.cancelToken.subscribe(S),c.signal&&(c.signal.aborted?S():c.signal.addEventListener("abort",S)));const Z=Jb(c.url);if(Z&&ut.protocols.indexOf(Z)===-1){o(new he("Unsupported protocol "+Z+":",he.ERR_BAD_REQUEST,l));return}j.send(d||null)})},n1=(l,r)=>{const{length:i}=l=l?l.filter(Boolean):[];if(r||i){let o=new AbortController,c;const d=function(p){if(!c){c=!0,v();const S=p instanceof Error?p:this.reason;o.abort(S instanceof he?S:new ul(S instanceof Error?S.message:S))}};let h=r&&setTimeout(()=>{h=null,d(new he(`timeout ${r} of ms exceeded`,he.ETIMEDOUT))},r);const v=()=>{l&&(h&&clearTimeout(h),h=null,l.forEach(p=>{p.unsubscribe?p.unsubscribe(d):p.removeEventListener("abort",d)}),l=null)};l.forEach(p=>p.addEventListener("abort",d));const{signal:y}=o;return y.unsubscribe=()=>U.asap(v),y}},a1=function*(l,r){let i=l.byteLength;if(i<r){yield l;return}let o=0,c;for(;o<i;)c=o+r,yield l.slice(o,c),o=c},l1=async function*(l,r){for await(const i of i1(l))yield*a1(i,r)},i1=async function*(l){if(l[Symbol.asyncIterator]){yield*l;return}const r=l.getReader();try{for(;;){const{done:i,value:o}=await r.read();if(i)break;yield o}}finally{await r.cancel()}},Tm=(l,r,i,o)=>{const c=l1(l,r);let d=0,h,v=y=>{h||(h=!0,o&&o(y))};return new ReadableStream({async pull(y){try{const{done:p,value:S}=await c.next();if(p){v(),y.close();return}let b=S.byteLength;if(i){let R=d+=b;i(R)}y.enqueue(new Uint8Array(S))}catch(p){throw v(p),p}},cancel(y){return v(y),c.return()}},{highWaterMark:2})},Am=64*1024,{isFunction:wu}=U,u1=(({Request:l,Response:r})=>({Request:l,Response:r}))(U.global),{ReadableStream:jm,TextEncoder:_m}=U.global,Nm=(l,...r)=>{try{return!!l(...r)}catch{return!1}},r1=l=>{l=U.merge.call({skipUndefined:!0},u1,l);const{fetch:r,Request:i,Response:o}=l,c=r?wu(r):typeof fetch=="function",d=wu(i),h=wu(o);if(!c)return!1;const v=c&&wu(jm),y=c&&(typeof _m=="function"?(T=>D=>T.encode(D))(new _m):async T=>new Uint8Array(await new i(T).arrayBuffer())),p=d&&v&&Nm(()=>{let T=!1;const D=new i(ut.origin,{body:new jm,method:"POST",get duplex(){return T=!0,"half"}}).headers.has("Content-Type");return T&&!D}),S=h&&v&&Nm(()=>U.isReadableStream(new o("").body)),b={stream:S&&(T=>T.body)};c&&["text","arrayBuffer","blob","formData","stream"].forEach(T=>{!b[T]&&(b[T]=(D,j)=>{let L=D&&D[T];if(L)return L.call(D);throw new he(`Response type '${T}' is not supported`,he.ERR_NOT_SUPPORT,j)})});const R=async T=>{if(T==null)return 0;if(U.isBlob(T))return T.size;if(U.isSpecCompliantForm(T))return(await new i(ut.origin,{method:"POST",body:T}).arrayBuffer()).byteLength;if(U.isArrayBufferView(T)||U.isArrayBuffer(T))return T.byteLength;if(U.isURLSearchParams(T)&&(T=T+""),U.isString(T))return(await y(T)).byteLength},M=async(T,D)=>{const j=U.toFiniteNumber(T.getContentLength());return j??R(D)};return async T=>{let{url:D,method:j,data:L,signal:Z,cancelToken:Q,timeout:P,onDownloadProgress:ee,onUploadProgress:ae,responseType:V,headers:oe,withCredentials:J="same-origin",fetchOptions:le}=Cp(T),me=r||fetch;V=V?(V+"").toLowerCase():"text";let ge=n1([Z,Q&&Q.toAbortSignal()],P),Le=null;const re=ge&&ge.unsubscribe&&(()=>{ge.unsubscribe()});let we;try{if(ae&&p&&j!=="get"&&j!=="head"&&(we=await M(oe,L))!==0){let E=new i(D,{method:"POST",body:L,duplex:"half"}),Y;if(U.isFormData(L)&&(Y=E.headers.get("content-type"))&&oe.setContentType(Y),E.body){const[$,F]=Em(we,Yu(Cm(ae)));L=Tm(E.body,Am,$,F)}}U.isString(J)||(J=J?"include":"omit");const H=d&&"credentials"in i.prototype,k={...le,signal:ge,method:j.toUpperCase(),headers:oe.normalize().toJSON(),body:L,duplex:"half",credentials:H?J:void 0};Le=d&&new i(D,k);let ne=await(d?me(Le,le):me(D,k));const Ee=S&&(V==="stream"||V==="response");if(S&&(ee||Ee&&re)){const E={};["status","statusText","headers"].forEach(se=>{E[se]=ne[se]});const Y=U.toFiniteNumber(ne.headers.get("content-length")),[$,F]=ee&&Em(Y,Yu(Cm(ee),!0))||[];ne=new o(Tm(ne.body,Am,$,()=>{F&&F(),re&&re()}),E)}V=V||"text";let je=await b[U.findKey(b,V)||"text"](ne,T);return!Ee&&re&&re(),await new Promise((E,Y)=>{xp(E,Y,{data:je,headers:yt.from(ne.headers),status:ne.status,statusText:ne.statusText,config:T,request:Le})})}catch(H){throw re&&re(),H&&H.name==="TypeError"&&/Load failed|fetch/i.test(H.message)?Object.assign(new he("Network Error",he.ERR_NETWORK,T,Le),{cause:H.cause||H}):he.from(H,H&&H.code,T,Le)}}},s1=new Map,Rp=l=>{let r=l&&l.env||{};const{fetch:i,Request:o,Response:c}=r,d=[o,c,i];let h=d.length,v=h,y,p,S=s1;for(;v--;)y=d[v],p=S.get(y),p===void 0&&S.set(y,p=v?new Map:r1(r)),S=p;return p};Rp();const Fo={http:Tb,xhr:t1,fetch:{get:Rp}};U.forEach(Fo,(l,r)=>{if(l){try{Object.defineProperty(l,"name",{value:r})}catch{}Object.defineProperty(l,"adapterName",{value:r})}});const zm=l=>`- ${l}`,o1=l=>U.isFunction(l)||l===null||l===!1;function c1(l,r){l=U.isArray(l)?l:[l];const{length:i}=l;let o,c;const d={};for(let h=0;h<i;h++){o=l[h];let v;if(c=o,!o1(o)&&(c=Fo[(v=String(o)).toLowerCase()],c===void 0))throw new he(`Unknown adapter '${v}'`);if(c&&(U.isFunction(c)||(c=c.get(r))))break;d[v||"#"+h]=c}if(!c){const h=Object.entries(d).map(([y,p])=>`adapter ${y} `+(p===!1?"is not supported by the environment":"is not available in the build"));let v=i?h.length>1?`since :
 `+h.map(zm).join(`
 `):" "+zm(h[0]):"as no adapter specified";throw new he("There is no suitable adapter to dispatch the request "+v,"ERR_NOT_SUPPORT")}return c}const Tp={getAdapter:c1,adapters:Fo};function Ao(l){if(l.cancelToken&&l.cancelToken.throwIfRequested(),l.signal&&l.signal.aborted)throw new ul(null,l)}function wm(l){return Ao(l),l.headers=yt.from(l.headers),l.data=To.call(l,l.transformRequest),["post","put","patch"].indexOf(l.method)!==-1&&l.headers.setContentType("application/x-www-form-urlencoded",!1),Tp.getAdapter(l.adapter||fi.adapter,l)(l).then(function(o){return Ao(l),o.data=To.call(l,l.transformResponse,o),o.headers=yt.from(o.headers),o},function(o){return Sp(o)||(Ao(l),o&&o.response&&(o.response.data=To.call(l,l.transformResponse,o.response),o.response.headers=yt.from(o.response.headers))),Promise.reject(o)})}const Ap="1.13.2",ku={};["object","boolean","number","function","string","symbol"].forEach((l,r)=>{ku[l]=function(o){return typeof o===l||"a"+(r<1?"n ":" ")+l}});const Om={};ku.transitional=function(r,i,o){function c(d,h){return"[Axios v"+Ap+"] Transitional option '"+d+"'"+h+(o?". "+o:"")}return(d,h,v)=>{if(r===!1)throw new he(c(h," has been removed"+(i?" in "+i:"")),he.ERR_DEPRECATED);return i&&!Om[h]&&(Om[h]=!0,console.warn(c(h," has been deprecated since v"+i+" and will be removed in the near future"))),r?r(d,h,v):!0}};ku.spelling=function(r){return(i,o)=>(console.warn(`${o} is likely a misspelling of ${r}`),!0)};function f1(l,r,i){if(typeof l!="object")throw new he("options must be an object",he.ERR_BAD_OPTION_VALUE);const o=Object.keys(l);let c=o.length;for(;c-- >0;){const d=o[c],h=r[d];if(h){const v=l[d],y=v===void 0||h(v,d,l);if(y!==!0)throw new he("option "+d+" must be "+y,he.ERR_BAD_OPTION_VALUE);continue}if(i!==!0)throw new he("Unknown option "+d,he.ERR_BAD_OPTION)}}const Lu={assertOptions:f1,validators:ku},$t=Lu.validators;let da=class{constructor(r){this.defaults=r||{},this.interceptors={request:new Sm,response:new Sm}}async request(r,i){try{return await this._request(r,i)}catch(o){if(o instanceof Error){let c={};Error.captureStackTrace?Error.captureStackTrace(c):c=new Error;const d=c.stack?c.stack.replace(/^.+\n/,""):"";try{o.stack?d&&!String(o.stack).endsWith(d.replace(/^.+\n.+\n/,""))&&(o.stack+=`
-`+d):o.stack=d}catch{}}throw o}}_request(r,i){typeof r=="string"?(i=i||{},i.url=r):i=r||{},i=ha(this.defaults,i);const{transitional:o,paramsSerializer:c,headers:d}=i;o!==void 0&&Lu.assertOptions(o,{silentJSONParsing:$t.transitional($t.boolean),forcedJSONParsing:$t.transitional($t.boolean),clarifyTimeoutError:$t.transitional($t.boolean)},!1),c!=null&&(U.isFunction(c)?i.paramsSerializer={serialize:c}:Lu.assertOptions(c,{encode:$t.function,serialize:$t.function},!0)),i.allowAbsoluteUrls!==void 0||(this.defaults.allowAbsoluteUrls!==void 0?i.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:i.allowAbsoluteUrls=!0),Lu.assertOptions(i,{baseUrl:$t.spelling("baseURL"),withXsrfToken:$t.spelling("withXSRFToken")},!0),i.method=(i.method||this.defaults.method||"get").toLowerCase();let h=d&&U.merge(d.common,d[i.method]);d&&U.forEach(["delete","get","head","post","put","patch","common"],T=>{delete d[T]}),i.headers=yt.concat(h,d);const v=[];let y=!0;this.interceptors.request.forEach(function(D){typeof D.runWhen=="function"&&D.runWhen(i)===!1||(y=y&&D.synchronous,v.unshift(D.fulfilled,D.rejected))});const p=[];this.interceptors.response.forEach(function(D){p.push(D.fulfilled,D.rejected)});let S,b=0,R;if(!y){const T=[wm.bind(this),void 0];for(T.unshift(...v),T.push(...p),R=T.length,S=Promise.resolve(i);b<R;)S=S.then(T[b++],T[b++]);return S}R=v.length;let M=i;for(;b<R;){const T=v[b++],D=v[b++];try{M=T(M)}catch(j){D.call(this,j);break}}try{S=wm.call(this,M)}catch(T){return Promise.reject(T)}for(b=0,R=p.length;b<R;)S=S.then(p[b++],p[b++]);return S}getUri(r){r=ha(this.defaults,r);const i=Ep(r.baseURL,r.url,r.allowAbsoluteUrls);return vp(i,r.params,r.paramsSerializer)}};U.forEach(["delete","get","head","options"],function(r){da.prototype[r]=function(i,o){return this.request(ha(o||{},{method:r,url:i,data:(o||{}).data}))}});U.forEach(["post","put","patch"],function(r){function i(o){return function(d,h,v){return this.request(ha(v||{},{method:r,headers:o?{"Content-Type":"multipart/form-data"}:{},url:d,data:h}))}}da.prototype[r]=i(),da.prototype[r+"Form"]=i(!0)});let d1=class jp{constructor(r){if(typeof r!="function")throw new TypeError("executor must be a function.");let i;this.promise=new Promise(function(d){i=d});const o=this;this.promise.then(c=>{if(!o._listeners)return;let d=o._listeners.length;for(;d-- >0;)o._listeners[d](c);o._listeners=null}),this.promise.then=c=>{let d;const h=new Promise(v=>{o.subscribe(v),d=v}).then(c);return h.cancel=function(){o.unsubscribe(d)},h},r(function(d,h,v){o.reason||(o.reason=new ul(d,h,v),i(o.reason))})}throwIfRequested(){if(this.reason)throw this.reason}subscribe(r){if(this.reason){r(this.reason);return}this._listeners?this._listeners.push(r):this._listeners=[r]}unsubscribe(r){if(!this._listeners)return;const i=this._listeners.indexOf(r);i!==-1&&this._listeners.splice(i,1)}toAbortSignal(){const r=new AbortController,i=o=>{r.abort(o)};return this.subscribe(i),r.signal.unsubscribe=()=>this.unsubscribe(i),r.signal}static source(){let r;return{token:new jp(function(c){r=c}),cancel:r}}};function h1(l){return function(i){return l.apply(null,i)}}function m1(l){return U.isObject(l)&&l.isAxiosError===!0}const Lo={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511,WebServerIsDown:521,ConnectionTimedOut:522,OriginIsUnreachable:523,TimeoutOccurred:524,SslHandshakeFailed:525,InvalidSslCertificate:526};Object.entries(Lo).forEach(([l,r])=>{Lo[r]=l});function _p(l){const r=new da(l),i=ip(da.prototype.request,r);return U.extend(i,da.prototype,r,{allOwnKeys:!0}),U.extend(i,r,null,{allOwnKeys:!0}),i.create=function(c){return _p(ha(l,c))},i}const Ze=_p(fi);Ze.Axios=da;Ze.CanceledError=ul;Ze.CancelToken=d1;Ze.isCancel=Sp;Ze.VERSION=Ap;Ze.toFormData=Ju;Ze.AxiosError=he;Ze.Cancel=Ze.CanceledError;Ze.all=function(r){return Promise.all(r)};Ze.spread=h1;Ze.isAxiosError=m1;Ze.mergeConfig=ha;Ze.AxiosHeaders=yt;Ze.formToJSON=l=>bp(U.isHTMLForm(l)?new FormData(l):l);Ze.getAdapter=Tp.getAdapter;Ze.HttpStatusCode=Lo;Ze.default=Ze;const{Axios:lS,AxiosError:iS,CanceledError:uS,isCancel:rS,CancelToken:sS,VERSION:oS,all:cS,Cancel:fS,isAxiosError:dS,spread:hS,toFormData:mS,AxiosHeaders:pS,HttpStatusCode:yS,formToJSON:vS,getAdapter:gS,mergeConfig:bS}=Ze,Ce=Ze.create({baseURL:"http://localhost:5000"});Ce.interceptors.request.use(l=>{const r=sessionStorage.getItem("token");return r&&l.headers&&(l.headers.Authorization=`Bearer ${r}`),l},l=>Promise.reject(l));Ce.interceptors.response.use(l=>l,async l=>{const r=l.config;if(l.response&&l.response.status===401&&!r._retry){if(r.url==="/refresh")return sessionStorage.clear(),window.location.href="/login",Promise.reject(l);r._retry=!0;try{const i=sessionStorage.getItem("refresh_token");if(!i)throw new Error("No refresh token available");const o=await Ze.post("http://localhost:5000/refresh",{},{headers:{Authorization:`Bearer ${i}`}}),{token:c}=o.data;return sessionStorage.setItem("token",c),r.headers&&(r.headers.Authorization=`Bearer ${c}`),Ce(r)}catch(i){return console.error("Token refresh failed:",i),sessionStorage.clear(),window.location.pathname!=="/login"&&(alert("登录已过期，请重新登录"),window.location.href="/login"),Promise.reject(i)}}return Promise.reject(l)});const p1=()=>{const l=gn.c(17);let r;l[0]===Symbol.for("react.memo_cache_sentinel")?(r={username:"",password:""},l[0]=r):r=l[0];const[i,o]=A.useState(r),{login:c}=A.useContext(pa),d=ma();let h;l[1]!==i||l[2]!==c||l[3]!==d?(h=async D=>{D.preventDefault();try{const j=await Ce.post("/login",i);c(j.data),j.data.role==="admin"?d("/admin"):d("/")}catch(j){alert(j.response?.data?.msg||"Login failed")}},l[1]=i,l[2]=c,l[3]=d,l[4]=h):h=l[4];const v=h;let y;l[5]===Symbol.for("react.memo_cache_sentinel")?(y=m.jsx("h3",{children:"用户登录"}),l[5]=y):y=l[5];let p;l[6]===Symbol.for("react.memo_cache_sentinel")?(p=m.jsx("label",{children:"用户名/邮箱:"}),l[6]=p):p=l[6];let S;l[7]!==i?(S=m.jsxs("div",{className:"form-group",children:[p,m.jsx("input",{type:"text",className:"form-control",onChange:D=>o({...i,username:D.target.value})})]}),l[7]=i,l[8]=S):S=l[8];let b;l[9]===Symbol.for("react.memo_cache_sentinel")?(b=m.jsx("label",{children:"密码:"}),l[9]=b):b=l[9];let R;l[10]!==i?(R=m.jsxs("div",{className:"form-group",children:[b,m.jsx("input",{type:"password",className:"form-control",onChange:D=>o({...i,password:D.target.value})})]}),l[10]=i,l[11]=R):R=l[11];let M;l[12]===Symbol.for("react.memo_cache_sentinel")?(M=m.jsx("button",{type:"submit",style:{marginTop:"10px"},children:"登录"}),l[12]=M):M=l[12];let T;return l[13]!==v||l[14]!==S||l[15]!==R?(T=m.jsxs("form",{onSubmit:v,className:"page-container-narrow",children:[y,S,R,M]}),l[13]=v,l[14]=S,l[15]=R,l[16]=T):T=l[16],T},y1=()=>{const l=gn.c(30),r=ma();let i;l[0]===Symbol.for("react.memo_cache_sentinel")?(i={username:"",password:"",email:"",phone:"",address:""},l[0]=i):i=l[0];const[o,c]=A.useState(i);let d;l[1]!==o||l[2]!==r?(d=async ae=>{ae.preventDefault();try{await Ce.post("/register",o),alert("注册成功，请等待管理员审核"),r("/login")}catch(V){alert(V.response?.data?.msg||"Registration failed")}},l[1]=o,l[2]=r,l[3]=d):d=l[3];const h=d;let v;l[4]!==o?(v=ae=>{c({...o,[ae.target.name]:ae.target.value})},l[4]=o,l[5]=v):v=l[5];const y=v;let p;l[6]===Symbol.for("react.memo_cache_sentinel")?(p=m.jsx("h3",{children:"新用户注册"}),l[6]=p):p=l[6];let S;l[7]===Symbol.for("react.memo_cache_sentinel")?(S=m.jsx("label",{children:"用户名:"}),l[7]=S):S=l[7];let b;l[8]!==y?(b=m.jsxs("div",{className:"form-group",children:[S,m.jsx("input",{required:!0,name:"username",type:"text",onChange:y})]}),l[8]=y,l[9]=b):b=l[9];let R;l[10]===Symbol.for("react.memo_cache_sentinel")?(R=m.jsx("label",{children:"邮箱:"}),l[10]=R):R=l[10];let M;l[11]!==y?(M=m.jsxs("div",{className:"form-group",children:[R,m.jsx("input",{required:!0,name:"email",type:"email",onChange:y})]}),l[11]=y,l[12]=M):M=l[12];let T;l[13]===Symbol.for("react.memo_cache_sentinel")?(T=m.jsx("label",{children:"密码:"}),l[13]=T):T=l[13];let D;l[14]!==y?(D=m.jsxs("div",{className:"form-group",children:[T,m.jsx("input",{required:!0,name:"password",type:"password",onChange:y})]}),l[14]=y,l[15]=D):D=l[15];let j;l[16]===Symbol.for("react.memo_cache_sentinel")?(j=m.jsx("label",{children:"手机号:"}),l[16]=j):j=l[16];let L;l[17]!==y?(L=m.jsxs("div",{className:"form-group",children:[j,m.jsx("input",{name:"phone",type:"text",onChange:y})]}),l[17]=y,l[18]=L):L=l[18];let Z;l[19]===Symbol.for("react.memo_cache_sentinel")?(Z=m.jsx("label",{children:"住址:"}),l[19]=Z):Z=l[19];let Q;l[20]!==y?(Q=m.jsxs("div",{className:"form-group",children:[Z,m.jsx("input",{name:"address",type:"text",onChange:y})]}),l[20]=y,l[21]=Q):Q=l[21];let P;l[22]===Symbol.for("react.memo_cache_sentinel")?(P=m.jsx("button",{type:"submit",style:{marginTop:"20px"},children:"提交注册"}),l[22]=P):P=l[22];let ee;return l[23]!==h||l[24]!==L||l[25]!==Q||l[26]!==b||l[27]!==M||l[28]!==D?(ee=m.jsxs("form",{onSubmit:h,className:"page-container-narrow",children:[p,b,M,D,L,Q,P]}),l[23]=h,l[24]=L,l[25]=Q,l[26]=b,l[27]=M,l[28]=D,l[29]=ee):ee=l[29],ee},di=()=>{const l=gn.c(1);let r;return l[0]===Symbol.for("react.memo_cache_sentinel")?(r=m.jsxs("div",{className:"loading-container",children:[m.jsx("div",{className:"spinner"}),m.jsx("p",{children:"加载中，请稍候..."})]}),l[0]=r):r=l[0],r},jo="http://localhost:5000",Dm=l=>{const r=y=>{const p=Math.sin(l*9999*y)*1e4;return p-Math.floor(p)},i=Math.floor(r(1)*360),o=Math.floor(r(2)*20)+15,c=Math.floor(r(3)*13)+75,d=(i+45)%360,h=o+5,v=c+5;return`linear-gradient(135deg, hsl(${i}, ${o}%, ${c}%), hsl(${d}, ${h}%, ${v}%))`},Mm=l=>{const r=gn.c(3),{status:i}=l,o=i==="available",c=`status-tag ${o?"tag-available":"tag-taken"}`,d=o?"待领取":"已领走";let h;return r[0]!==c||r[1]!==d?(h=m.jsx("span",{className:c,children:d}),r[0]=c,r[1]=d,r[2]=h):h=r[2],h},v1=l=>new Promise(r=>{const i=new Image;i.src=l,i.onload=()=>r(!0),i.onerror=()=>r(!1)}),g1=()=>{const{user:l}=A.useContext(pa),r=ma(),[i,o]=A.useState([]),[c,d]=A.useState([]),[h,v]=A.useState({type_id:"",keyword:"",status:"available"}),[y,p]=A.useState(!1),[S,b]=A.useState(!0),[R,M]=A.useState(null);A.useEffect(()=>{(async()=>{b(!0);try{await Promise.all([T(),D(!1)])}catch(le){console.error("Initialization failed",le)}finally{b(!1)}})()},[]),A.useEffect(()=>{D(!0)},[y]);const T=async()=>{try{const J=await Ce.get("/types");d(J.data)}catch(J){console.error(J)}},D=async(J=!0)=>{J&&b(!0);try{const le={};h.type_id&&(le.type_id=h.type_id),h.keyword&&(le.keyword=h.keyword),h.status&&(le.status=h.status),y&&l?.id&&(le.owner_id=l.id);const me=await Ce.get("/items",{params:le});o(me.data);const ge=me.data.filter(Le=>Le.image_path).map(Le=>v1(`${jo}${Le.image_path}`));ge.length>0&&await Promise.all(ge)}catch(le){console.error(le)}finally{J&&b(!1)}},j=()=>{v({type_id:"",keyword:"",status:""}),p(!1)};A.useEffect(()=>{D(!0)},[h.type_id,h.status,y]);const[L,Z]=A.useState({minWidth:360,aspectRatio:1.33}),[Q,P]=A.useState(!1),ee=()=>D(!0),ae=async J=>{if(window.confirm("确认删除?"))try{await Ce.delete(`/items/${J}`),M(null),D(!0)}catch{alert("删除失败")}},V=J=>c.find(le=>le.name===J),oe=()=>{if(!R)return null;const J=V(R.type_name);return m.jsxs("div",{className:"modal-body-layout",children:[m.jsx("div",{className:"modal-left-col",children:R.image_path?m.jsx("img",{src:`${jo}${R.image_path}`,alt:R.name,className:"modal-image"}):m.jsx("div",{className:"modal-no-image",style:{background:Dm(R.id)}})}),m.jsxs("div",{className:"modal-right-col",children:[m.jsx("div",{className:"modal-header",children:m.jsxs("div",{className:"header-title-group",children:[m.jsx("h2",{children:R.name}),m.jsx(Mm,{status:R.status})]})}),m.jsxs("p",{className:"modal-category",children:["分类: ",R.type_name]}),m.jsx("div",{className:"modal-desc",children:R.description||"暂无描述"}),m.jsxs("div",{className:"modal-attributes",children:[J?J.attributes.map(le=>{const me=R.attributes[le.key];return me==null||me===""?null:m.jsxs("div",{className:"attr-row",children:[m.jsx("span",{className:"attr-label",children:le.label}),m.jsx("span",{className:"attr-value",children:String(me)})]},le.key)}):Object.entries(R.attributes).map(([le,me])=>m.jsxs("div",{className:"attr-row",children:[m.jsx("span",{className:"attr-label",children:le}),m.jsx("span",{className:"attr-value",children:String(me)})]},le)),m.jsxs("div",{className:"attr-row",children:[m.jsx("span",{className:"attr-label",children:"发布人"}),m.jsx("span",{className:"attr-value",children:R.owner})]}),m.jsxs("div",{className:"attr-row",children:[m.jsx("span",{className:"attr-label",children:"地址"}),m.jsx("span",{className:"attr-value",children:R.address})]}),m.jsxs("div",{className:"attr-row",children:[m.jsx("span",{className:"attr-label",children:"时间"}),m.jsx("span",{className:"attr-value",children:new Date(R.created_at).toLocaleDateString()})]})]}),l&&(l.username===R.owner||l.role==="admin")&&m.jsxs("div",{className:"modal-actions",children:[m.jsx("button",{onClick:()=>r(`/edit-item/${R.id}`),className:"btn-action btn-secondary",style:{flex:1},children:"编辑"}),m.jsx("button",{onClick:()=>ae(R.id),className:"btn-danger-outline",style:{flex:1},children:"删除"})]})]})]})};return S?m.jsx(di,{}):m.jsxs("div",{className:"page-container",children:[m.jsxs("div",{className:"filter-bar",children:[m.jsxs("select",{onChange:J=>v({...h,type_id:J.target.value}),className:"control-input",value:h.type_id,children:[m.jsx("option",{value:"",children:"所有分类"}),c.map(J=>m.jsx("option",{value:J.id,children:J.name},J.id))]}),m.jsxs("select",{onChange:J=>v({...h,status:J.target.value}),className:"control-input",value:h.status,style:{minWidth:"110px"},children:[m.jsx("option",{value:"",children:"全部状态"}),m.jsx("option",{value:"available",children:"待领取"}),m.jsx("option",{value:"taken",children:"已领走"})]}),m.jsx("div",{className:"search-group flex-grow",children:m.jsx("input",{type:"text",placeholder:"搜索物品名称、描述...",onChange:J=>v({...h,keyword:J.target.value}),onKeyDown:J=>J.key==="Enter"&&ee(),className:"control-input search-input",style:{width:"100%",margin:0},value:h.keyword})}),m.jsxs("div",{className:"filter-actions",children:[m.jsx("button",{onClick:ee,className:"btn-action btn-primary",children:"搜索"}),(h.type_id||h.status||h.keyword||y)&&m.jsx("button",{onClick:j,className:"btn-action btn-secondary",title:"重置所有筛选",children:"↺"}),l&&m.jsx("button",{onClick:()=>p(!y),className:`btn-action ${y?"btn-primary":"btn-secondary"}`,title:"只看我发布的",children:y?"我的物品":"全部物品"}),m.jsx("button",{onClick:()=>P(!Q),className:`btn-action ${Q?"btn-primary":"btn-secondary"}`,title:"调整视图布局",style:{padding:"0 10px"},children:m.jsx("svg",{width:"20",height:"20",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:m.jsx("path",{d:"M4 21v-7M4 10V3M12 21v-9M12 8V3M20 21v-5M20 12V3M1 14h6M9 8h6M17 16h6"})})})]})]}),Q&&m.jsxs("div",{style:{background:"#fff",padding:"15px 20px",marginBottom:"20px",borderRadius:"8px",boxShadow:"0 2px 8px rgba(0,0,0,0.05)",display:"flex",flexWrap:"wrap",gap:"30px",alignItems:"center",border:"1px solid #eee"},children:[m.jsxs("div",{style:{display:"flex",flexDirection:"column",gap:"5px"},children:[m.jsxs("label",{style:{fontSize:"12px",color:"#666",fontWeight:600},children:["卡片大小 (最小宽度): ",L.minWidth,"px"]}),m.jsx("input",{type:"range",min:"150",max:"500",step:"10",value:L.minWidth,onChange:J=>Z({...L,minWidth:Number(J.target.value)}),style:{width:"200px",cursor:"pointer"}})]}),m.jsxs("div",{style:{display:"flex",flexDirection:"column",gap:"5px"},children:[m.jsxs("label",{style:{fontSize:"12px",color:"#666",fontWeight:600},children:["长宽比 (Aspect Ratio): ",L.aspectRatio.toFixed(2)]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"10px"},children:[m.jsx("input",{type:"range",min:"0.5",max:"2.0",step:"0.01",value:L.aspectRatio,onChange:J=>Z({...L,aspectRatio:Number(J.target.value)}),style:{width:"200px",cursor:"pointer"}}),m.jsxs("div",{style:{display:"flex",gap:"5px"},children:[m.jsx("button",{onClick:()=>Z({...L,aspectRatio:9/16}),style:{fontSize:"10px",padding:"2px 6px",cursor:"pointer"},children:"9:16"}),m.jsx("button",{onClick:()=>Z({...L,aspectRatio:3/4}),style:{fontSize:"10px",padding:"2px 6px",cursor:"pointer"},children:"3:4"}),m.jsx("button",{onClick:()=>Z({...L,aspectRatio:1}),style:{fontSize:"10px",padding:"2px 6px",cursor:"pointer"},children:"1:1"}),m.jsx("button",{onClick:()=>Z({...L,aspectRatio:4/3}),style:{fontSize:"10px",padding:"2px 6px",cursor:"pointer"},children:"4:3"}),m.jsx("button",{onClick:()=>Z({...L,aspectRatio:16/9}),style:{fontSize:"10px",padding:"2px 6px",cursor:"pointer"},children:"16:9"})]})]})]})]}),i.length===0?m.jsx("p",{style:{textAlign:"center",color:"#666",marginTop:"40px"},children:"暂无物品"}):m.jsx("div",{className:"dashboard-grid",style:{"--card-min-width":`${L.minWidth}px`,"--card-aspect-ratio":L.aspectRatio},children:i.map(J=>m.jsxs("div",{className:"dashboard-card",onClick:()=>M(J),children:[m.jsx("div",{className:"card-bg-layer",children:J.image_path?m.jsx("img",{src:`${jo}${J.image_path}`,alt:J.name,loading:"lazy"}):m.jsx("div",{className:"no-image-gradient",style:{background:Dm(J.id)}})}),m.jsxs("div",{className:"card-overlay",children:[m.jsxs("div",{className:"overlay-left",children:[m.jsx("span",{className:"overlay-text-name",children:J.name}),m.jsx(Mm,{status:J.status})]}),m.jsxs("span",{className:"overlay-text-owner",children:["@",J.owner]})]})]},J.id))}),R&&m.jsx("div",{className:"modal-backdrop",onClick:()=>M(null),children:m.jsxs("div",{className:"modal-container",onClick:J=>J.stopPropagation(),children:[m.jsx("button",{className:"modal-close-btn",onClick:()=>M(null),children:m.jsxs("svg",{width:"20",height:"20",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2.5",strokeLinecap:"round",strokeLinejoin:"round",children:[m.jsx("line",{x1:"18",y1:"6",x2:"6",y2:"18"}),m.jsx("line",{x1:"6",y1:"6",x2:"18",y2:"18"})]})}),oe()]})})]})};var qo=function(l,r){return qo=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(i,o){i.__proto__=o}||function(i,o){for(var c in o)Object.prototype.hasOwnProperty.call(o,c)&&(i[c]=o[c])},qo(l,r)};function b1(l,r){if(typeof r!="function"&&r!==null)throw new TypeError("Class extends value "+String(r)+" is not a constructor or null");qo(l,r);function i(){this.constructor=l}l.prototype=r===null?Object.create(r):(i.prototype=r.prototype,new i)}var Ie=function(){return Ie=Object.assign||function(r){for(var i,o=1,c=arguments.length;o<c;o++){i=arguments[o];for(var d in i)Object.prototype.hasOwnProperty.call(i,d)&&(r[d]=i[d])}return r},Ie.apply(this,arguments)};var _o,Um;function S1(){if(Um)return _o;Um=1;var l=!1,r,i,o,c,d,h,v,y,p,S,b,R,M,T,D;function j(){if(!l){l=!0;var Z=navigator.userAgent,Q=/(?:MSIE.(\d+\.\d+))|(?:(?:Firefox|GranParadiso|Iceweasel).(\d+\.\d+))|(?:Opera(?:.+Version.|.)(\d+\.\d+))|(?:AppleWebKit.(\d+(?:\.\d+)?))|(?:Trident\/\d+\.\d+.*rv:(\d+\.\d+))/.exec(Z),P=/(Mac OS X)|(Windows)|(Linux)/.exec(Z);if(R=/\b(iPhone|iP[ao]d)/.exec(Z),M=/\b(iP[ao]d)/.exec(Z),S=/Android/i.exec(Z),T=/FBAN\/\w+;/i.exec(Z),D=/Mobile/i.exec(Z),b=!!/Win64/.exec(Z),Q){r=Q[1]?parseFloat(Q[1]):Q[5]?parseFloat(Q[5]):NaN,r&&document&&document.documentMode&&(r=document.documentMode);var ee=/(?:Trident\/(\d+.\d+))/.exec(Z);h=ee?parseFloat(ee[1])+4:r,i=Q[2]?parseFloat(Q[2]):NaN,o=Q[3]?parseFloat(Q[3]):NaN,c=Q[4]?parseFloat(Q[4]):NaN,c?(Q=/(?:Chrome\/(\d+\.\d+))/.exec(Z),d=Q&&Q[1]?parseFloat(Q[1]):NaN):d=NaN}else r=i=o=d=c=NaN;if(P){if(P[1]){var ae=/(?:Mac OS X (\d+(?:[._]\d+)?))/.exec(Z);v=ae?parseFloat(ae[1].replace("_",".")):!0}else v=!1;y=!!P[2],p=!!P[3]}else v=y=p=!1}}var L={ie:function(){return j()||r},ieCompatibilityMode:function(){return j()||h>r},ie64:function(){return L.ie()&&b},firefox:function(){return j()||i},opera:function(){return j()||o},webkit:function(){return j()||c},safari:function(){return L.webkit()},chrome:function(){return j()||d},windows:function(){return j()||y},osx:function(){return j()||v},linux:function(){return j()||p},iphone:function(){return j()||R},mobile:function(){return j()||R||M||S||D},nativeApp:function(){return j()||T},android:function(){return j()||S},ipad:function(){return j()||M}};return _o=L,_o}var No,Hm;function x1(){if(Hm)return No;Hm=1;var l=!!(typeof window<"u"&&window.document&&window.document.createElement),r={canUseDOM:l,canUseWorkers:typeof Worker<"u",canUseEventListeners:l&&!!(window.addEventListener||window.attachEvent),canUseViewport:l&&!!window.screen,isInWorker:!l};return No=r,No}var zo,Bm;function E1(){if(Bm)return zo;Bm=1;var l=x1(),r;l.canUseDOM&&(r=document.implementation&&document.implementation.hasFeature&&document.implementation.hasFeature("","")!==!0);/**
+`+d):o.stack=d}catch{}}throw o}}_request(r,i){typeof r=="string"?(i=i||{},i.url=r):i=r||{},i=ha(this.defaults,i);const{transitional:o,paramsSerializer:c,headers:d}=i;o!==void 0&&Lu.assertOptions(o,{silentJSONParsing:$t.transitional($t.boolean),forcedJSONParsing:$t.transitional($t.boolean),clarifyTimeoutError:$t.transitional($t.boolean)},!1),c!=null&&(U.isFunction(c)?i.paramsSerializer={serialize:c}:Lu.assertOptions(c,{encode:$t.function,serialize:$t.function},!0)),i.allowAbsoluteUrls!==void 0||(this.defaults.allowAbsoluteUrls!==void 0?i.allowAbsoluteUrls=this.defaults.allowAbsoluteUrls:i.allowAbsoluteUrls=!0),Lu.assertOptions(i,{baseUrl:$t.spelling("baseURL"),withXsrfToken:$t.spelling("withXSRFToken")},!0),i.method=(i.method||this.defaults.method||"get").toLowerCase();let h=d&&U.merge(d.common,d[i.method]);d&&U.forEach(["delete","get","head","post","put","patch","common"],T=>{delete d[T]}),i.headers=yt.concat(h,d);const v=[];let y=!0;this.interceptors.request.forEach(function(D){typeof D.runWhen=="function"&&D.runWhen(i)===!1||(y=y&&D.synchronous,v.unshift(D.fulfilled,D.rejected))});const p=[];this.interceptors.response.forEach(function(D){p.push(D.fulfilled,D.rejected)});let S,b=0,R;if(!y){const T=[wm.bind(this),void 0];for(T.unshift(...v),T.push(...p),R=T.length,S=Promise.resolve(i);b<R;)S=S.then(T[b++],T[b++]);return S}R=v.length;let M=i;for(;b<R;){const T=v[b++],D=v[b++];try{M=T(M)}catch(j){D.call(this,j);break}}try{S=wm.call(this,M)}catch(T){return Promise.reject(T)}for(b=0,R=p.length;b<R;)S=S.then(p[b++],p[b++]);return S}getUri(r){r=ha(this.defaults,r);const i=Ep(r.baseURL,r.url,r.allowAbsoluteUrls);return vp(i,r.params,r.paramsSerializer)}};U.forEach(["delete","get","head","options"],function(r){da.prototype[r]=function(i,o){return this.request(ha(o||{},{method:r,url:i,data:(o||{}).data}))}});U.forEach(["post","put","patch"],function(r){function i(o){return function(d,h,v){return this.request(ha(v||{},{method:r,headers:o?{"Content-Type":"multipart/form-data"}:{},url:d,data:h}))}}da.prototype[r]=i(),da.prototype[r+"Form"]=i(!0)});let d1=class jp{constructor(r){if(typeof r!="function")throw new TypeError("executor must be a function.");let i;this.promise=new Promise(function(d){i=d});const o=this;this.promise.then(c=>{if(!o._listeners)return;let d=o._listeners.length;for(;d-- >0;)o._listeners[d](c);o._listeners=null}),this.promise.then=c=>{let d;const h=new Promise(v=>{o.subscribe(v),d=v}).then(c);return h.cancel=function(){o.unsubscribe(d)},h},r(function(d,h,v){o.reason||(o.reason=new ul(d,h,v),i(o.reason))})}throwIfRequested(){if(this.reason)throw this.reason}subscribe(r){if(this.reason){r(this.reason);return}this._listeners?this._listeners.push(r):this._listeners=[r]}unsubscribe(r){if(!this._listeners)return;const i=this._listeners.indexOf(r);i!==-1&&this._listeners.splice(i,1)}toAbortSignal(){const r=new AbortController,i=o=>{r.abort(o)};return this.subscribe(i),r.signal.unsubscribe=()=>this.unsubscribe(i),r.signal}static source(){let r;return{token:new jp(function(c){r=c}),cancel:r}}};function h1(l){return function(i){return l.apply(null,i)}}function m1(l){return U.isObject(l)&&l.isAxiosError===!0}const Lo={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511,WebServerIsDown:521,ConnectionTimedOut:522,OriginIsUnreachable:523,TimeoutOccurred:524,SslHandshakeFailed:525,InvalidSslCertificate:526};Object.entries(Lo).forEach(([l,r])=>{Lo[r]=l});function _p(l){const r=new da(l),i=ip(da.prototype.request,r);return U.extend(i,da.prototype,r,{allOwnKeys:!0}),U.extend(i,r,null,{allOwnKeys:!0}),i.create=function(c){return _p(ha(l,c))},i}const Ze=_p(fi);Ze.Axios=da;Ze.CanceledError=ul;Ze.CancelToken=d1;Ze.isCancel=Sp;Ze.VERSION=Ap;Ze.toFormData=Ju;Ze.AxiosError=he;Ze.Cancel=Ze.CanceledError;Ze.all=function(r){return Promise.all(r)};Ze.spread=h1;Ze.isAxiosError=m1;Ze.mergeConfig=ha;Ze.AxiosHeaders=yt;Ze.formToJSON=l=>bp(U.isHTMLForm(l)?new FormData(l):l);Ze.getAdapter=Tp.getAdapter;Ze.HttpStatusCode=Lo;Ze.default=Ze;const{Axios:lS,AxiosError:iS,CanceledError:uS,isCancel:rS,CancelToken:sS,VERSION:oS,all:cS,Cancel:fS,isAxiosError:dS,spread:hS,toFormData:mS,AxiosHeaders:pS,HttpStatusCode:yS,formToJSON:vS,getAdapter:gS,mergeConfig:bS}=Ze,Ce=Ze.create({baseURL:"http://localhost:5000"}),waitForJob=async(l,r=1e3)=>{for(;;){const i=(await Ce.get(`/jobs/${l}`)).data;if(i.status==="done")return i;if(i.status==="failed"||i.status==="cancelled")throw new Error(i.message||`任务${i.status==="failed"?"执行失败":"已取消"}`);await new Promise(o=>setTimeout(o,r))}};Ce.interceptors.request.use(l=>{const r=sessionStorage.getItem("token");return r&&l.headers&&(l.headers.Authorization=`Bearer ${r}`),l},l=>Promise.reject(l));Ce.interceptors.response.use(l=>l,async l=>{const r=l.config;if(l.response&&l.response.status===401&&!r._retry){if(r.url==="/refresh")return sessionStorage.clear(),window.location.href="/login",Promise.reject(l);r._retry=!0;try{const i=sessionStorage.getItem("refresh_token");if(!i)throw new Error("No refresh token available");const o=await Ze.post("http://localhost:5000/refresh",{},{headers:{Authorization:`Bearer ${i}`}}),{token:c}=o.data;return sessionStorage.setItem("token",c),r.headers&&(r.headers.Authorization=`Bearer ${c}`),Ce(r)}catch(i){return console.error("Token refresh failed:",i),sessionStorage.clear(),window.location.pathname!=="/login"&&(alert("登录已过期，请重新登录"),window.location.href="/login"),Promise.reject(i)}}return Promise.reject(l)});const p1=()=>{const l=gn.c(17);let r;l[0]===Symbol.for("react.memo_cache_sentinel")?(r={username:"",password:""},l[0]=r):r=l[0];const[i,o]=A.useState(r),{login:c}=A.useContext(pa),d=ma();let h;l[1]!==i||l[2]!==c||l[3]!==d?(h=async D=>{D.preventDefault();try{const j=await Ce.post("/login",i);c(j.data),j.data.role==="admin"?d("/admin"):d("/")}catch(j){alert(j.response?.data?.msg||"Login failed")}},l[1]=i,l[2]=c,l[3]=d,l[4]=h):h=l[4];const v=h;let y;l[5]===Symbol.for("react.memo_cache_sentinel")?(y=m.jsx("h3",{children:"用户登录"}),l[5]=y):y=l[5];let p;l[6]===Symbol.for("react.memo_cache_sentinel")?(p=m.jsx("label",{children:"用户名/邮箱:"}),l[6]=p):p=l[6];let S;l[7]!==i?(S=m.jsxs("div",{className:"form-group",children:[p,m.jsx("input",{type:"text",className:"form-control",onChange:D=>o({...i,username:D.target.value})})]}),l[7]=i,l[8]=S):S=l[8];let b;l[9]===Symbol.for("react.memo_cache_sentinel")?(b=m.jsx("label",{children:"密码:"}),l[9]=b):b=l[9];let R;l[10]!==i?(R=m.jsxs("div",{className:"form-group",children:[b,m.jsx("input",{type:"password",className:"form-control",onChange:D=>o({...i,password:D.target.value})})]}),l[10]=i,l[11]=R):R=l[11];let M;l[12]===Symbol.for("react.memo_cache_sentinel")?(M=m.jsx("button",{type:"submit",style:{marginTop:"10px"},children:"登录"}),l[12]=M):M=l[12];let T;return l[13]!==v||l[14]!==S||l[15]!==R?(T=m.jsxs("form",{onSubmit:v,className:"page-container-narrow",children:[y,S,R,M]}),l[13]=v,l[14]=S,l[15]=R,l[16]=T):T=l[16],T},y1=()=>{const l=gn.c(30),r=ma();let i;l[0]===Symbol.for("react.memo_cache_sentinel")?(i={username:"",password:"",email:"",phone:"",address:""},l[0]=i):i=l[0];const[o,c]=A.useState(i);let d;l[1]!==o||l[2]!==r?(d=async ae=>{ae.preventDefault();try{await Ce.post("/register",o),alert("注册成功，请等待管理员审核"),r("/login")}catch(V){alert(V.response?.data?.msg||"Registration failed")}},l[1]=o,l[2]=r,l[3]=d):d=l[3];const h=d;let v;l[4]!==o?(v=ae=>{c({...o,[ae.target.name]:ae.target.value})},l[4]=o,l[5]=v):v=l[5];const y=v;let p;l[6]===Symbol.for("react.memo_cache_sentinel")?(p=m.jsx("h3",{children:"新用户注册"}),l[6]=p):p=l[6];let S;l[7]===Symbol.for("react.memo_cache_sentinel")?(S=m.jsx("label",{children:"用户名:"}),l[7]=S):S=l[7];let b;l[8]!==y?(b=m.jsxs("div",{className:"form-group",children:[S,m.jsx("input",{required:!0,name:"username",type:"text",onChange:y})]}),l[8]=y,l[9]=b):b=l[9];let R;l[10]===Symbol.for("react.memo_cache_sentinel")?(R=m.jsx("label",{children:"邮箱:"}),l[10]=R):R=l[10];let M;l[11]!==y?(M=m.jsxs("div",{className:"form-group",children:[R,m.jsx("input",{required:!0,name:"email",type:"email",onChange:y})]}),l[11]=y,l[12]=M):M=l[12];let T;l[13]===Symbol.for("react.memo_cache_sentinel")?(T=m.jsx("label",{children:"密码:"}),l[13]=T):T=l[13];let D;l[14]!==y?(D=m.jsxs("div",{className:"form-group",children:[T,m.jsx("input",{required:!0,name:"password",type:"password",onChange:y})]}),l[14]=y,l[15]=D):D=l[15];let j;l[16]===Symbol.for("react.memo_cache_sentinel")?(j=m.jsx("label",{children:"手机号:"}),l[16]=j):j=l[16];let L;l[17]!==y?(L=m.jsxs("div",{className:"form-group",children:[j,m.jsx("input",{name:"phone",type:"text",onChange:y})]}),l[17]=y,l[18]=L):L=l[18];let Z;l[19]===Symbol.for("react.memo_cache_sentinel")?(Z=m.jsx("label",{children:"住址:"}),l[19]=Z):Z=l[19];let Q;l[20]!==y?(Q=m.jsxs("div",{className:"form-group",children:[Z,m.jsx("input",{name:"address",type:"text",onChange:y})]}),l[20]=y,l[21]=Q):Q=l[21];let P;l[22]===Symbol.for("react.memo_cache_sentinel")?(P=m.jsx("button",{type:"submit",style:{marginTop:"20px"},children:"提交注册"}),l[22]=P):P=l[22];let ee;return l[23]!==h||l[24]!==L||l[25]!==Q||l[26]!==b||l[27]!==M||l[28]!==D?(ee=m.jsxs("form",{onSubmit:h,className:"page-container-narrow",children:[p,b,M,D,L,Q,P]}),l[23]=h,l[24]=L,l[25]=Q,l[26]=b,l[27]=M,l[28]=D,l[29]=ee):ee=l[29],ee},di=()=>{const l=gn.c(1);let r;return l[0]===Symbol.for("react.memo_cache_sentinel")?(r=m.jsxs("div",{className:"loading-container",children:[m.jsx("div",{className:"spinner"}),m.jsx("p",{children:"加载中，请稍候..."})]}),l[0]=r):r=l[0],r},jo="http://localhost:5000",Dm=l=>{const r=y=>{const p=Math.sin(l*9999*y)*1e4;return p-Math.floor(p)},i=Math.floor(r(1)*360),o=Math.floor(r(2)*20)+15,c=Math.floor(r(3)*13)+75,d=(i+45)%360,h=o+5,v=c+5;return`linear-gradient(135deg, hsl(${i}, ${o}%, ${c}%), hsl(${d}, ${h}%, ${v}%))`},Mm=l=>{const r=gn.c(3),{status:i}=l,o=i==="available",c=`status-tag ${o?"tag-available":"tag-taken"}`,d=o?"待领取":"已领走";let h;return r[0]!==c||r[1]!==d?(h=m.jsx("span",{className:c,children:d}),r[0]=c,r[1]=d,r[2]=h):h=r[2],h},v1=l=>new Promise(r=>{const i=new Image;i.src=l,i.onload=()=>r(!0),i.onerror=()=>r(!1)}),g1=()=>{const{user:l}=A.useContext(pa),r=ma(),[i,o]=A.useState([]),[c,d]=A.useState([]),[h,v]=A.useState({type_id:"",keyword:"",status:"available"}),[y,p]=A.useState(!1),[S,b]=A.useState(!0),[R,M]=A.useState(null);A.useEffect(()=>{(async()=>{b(!0);try{await Promise.all([T(),D(!1)])}catch(le){console.error("Initialization failed",le)}finally{b(!1)}})()},[]),A.useEffect(()=>{D(!0)},[y]);const T=async()=>{try{const J=await Ce.get("/types");d(J.data)}catch(J){console.error(J)}},D=async(J=!0)=>{J&&b(!0);try{const le={};h.type_id&&(le.type_id=h.type_id),h.keyword&&(le.keyword=h.keyword),h.status&&(le.status=h.status),y&&l?.id&&(le.owner_id=l.id);const me=await Ce.get("/items",{params:le});o(me.data);const ge=me.data.filter(Le=>Le.image_path).map(Le=>v1(`${jo}${Le.image_path}`));ge.length>0&&await Promise.all(ge)}catch(le){console.error(le)}finally{J&&b(!1)}},j=()=>{v({type_id:"",keyword:"",status:""}),p(!1)};A.useEffect(()=>{D(!0)},[h.type_id,h.status,y]);const[L,Z]=A.useState({minWidth:360,aspectRatio:1.33}),[Q,P]=A.useState(!1),ee=()=>D(!0),ae=async J=>{if(window.confirm("确认删除?"))try{await Ce.delete(`/items/${J}`),M(null),D(!0)}catch{alert("删除失败")}},V=J=>c.find(le=>le.name===J),oe=()=>{if(!R)return null;const J=V(R.type_name);return m.jsxs("div",{className:"modal-body-layout",children:[m.jsx("div",{className:"modal-left-col",children:R.image_path?m.jsx("img",{src:`${jo}${R.image_path}`,alt:R.name,className:"modal-image"}):m.jsx("div",{className:"modal-no-image",style:{background:Dm(R.id)}})}),m.jsxs("div",{className:"modal-right-col",children:[m.jsx("div",{className:"modal-header",children:m.jsxs("div",{className:"header-title-group",children:[m.jsx("h2",{children:R.name}),m.jsx(Mm,{status:R.status})]})}),m.jsxs("p",{className:"modal-category",children:["分类: ",R.type_name]}),m.jsx("div",{className:"modal-desc",children:R.description||"暂无描述"}),m.jsxs("div",{className:"modal-attributes",children:[J?J.attributes.map(le=>{const me=R.attributes[le.key];return me==null||me===""?null:m.jsxs("div",{className:"attr-row",children:[m.jsx("span",{className:"attr-label",children:le.label}),m.jsx("span",{className:"attr-value",children:String(me)})]},le.key)}):Object.entries(R.attributes).map(([le,me])=>m.jsxs("div",{className:"attr-row",children:[m.jsx("span",{className:"attr-label",children:le}),m.jsx("span",{className:"attr-value",children:String(me)})]},le)),m.jsxs("div",{className:"attr-row",children:[m.jsx("span",{className:"attr-label",children:"发布人"}),m.jsx("span",{className:"attr-value",children:R.owner})]}),m.jsxs("div",{className:"attr-row",children:[m.jsx("span",{className:"attr-label",children:"地址"}),m.jsx("span",{className:"attr-value",children:R.address})]}),m.jsxs("div",{className:"attr-row",children:[m.jsx("span",{className:"attr-label",children:"时间"}),m.jsx("span",{className:"attr-value",children:new Date(R.created_at).toLocaleDateString()})]})]}),l&&(l.username===R.owner||l.role==="admin")&&m.jsxs("div",{className:"modal-actions",children:[m.jsx("button",{onClick:()=>r(`/edit-item/${R.id}`),className:"btn-action btn-secondary",style:{flex:1},children:"编辑"}),m.jsx("button",{onClick:()=>ae(R.id),className:"btn-danger-outline",style:{flex:1},children:"删除"})]})]})]})};return S?m.jsx(di,{}):m.jsxs("div",{className:"page-container",children:[m.jsxs("div",{className:"filter-bar",children:[m.jsxs("select",{onChange:J=>v({...h,type_id:J.target.value}),className:"control-input",value:h.type_id,children:[m.jsx("option",{value:"",children:"所有分类"}),c.map(J=>m.jsx("option",{value:J.id,children:J.name},J.id))]}),m.jsxs("select",{onChange:J=>v({...h,status:J.target.value}),className:"control-input",value:h.status,style:{minWidth:"110px"},children:[m.jsx("option",{value:"",children:"全部状态"}),m.jsx("option",{value:"available",children:"待领取"}),m.jsx("option",{value:"taken",children:"已领走"})]}),m.jsx("div",{className:"search-group flex-grow",children:m.jsx("input",{type:"text",placeholder:"搜索物品名称、描述...",onChange:J=>v({...h,keyword:J.target.value}),onKeyDown:J=>J.key==="Enter"&&ee(),className:"control-input search-input",style:{width:"100%",margin:0},value:h.keyword})}),m.jsxs("div",{className:"filter-actions",children:[m.jsx("button",{onClick:ee,className:"btn-action btn-primary",children:"搜索"}),(h.type_id||h.status||h.keyword||y)&&m.jsx("button",{onClick:j,className:"btn-action btn-secondary",title:"重置所有筛选",children:"↺"}),l&&m.jsx("button",{onClick:()=>p(!y),className:`btn-action ${y?"btn-primary":"btn-secondary"}`,title:"只看我发布的",children:y?"我的物品":"全部物品"}),m.jsx("button",{onClick:()=>P(!Q),className:`btn-action ${Q?"btn-primary":"btn-secondary"}`,title:"调整视图布局",style:{padding:"0 10px"},children:m.jsx("svg",{width:"20",height:"20",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",children:m.jsx("path",{d:"M4 21v-7M4 10V3M12 21v-9M12 8V3M20 21v-5M20 12V3M1 14h6M9 8h6M17 16h6"})})})]})]}),Q&&m.jsxs("div",{style:{background:"#fff",padding:"15px 20px",marginBottom:"20px",borderRadius:"8px",boxShadow:"0 2px 8px rgba(0,0,0,0.05)",display:"flex",flexWrap:"wrap",gap:"30px",alignItems:"center",border:"1px solid #eee"},children:[m.jsxs("div",{style:{display:"flex",flexDirection:"column",gap:"5px"},children:[m.jsxs("label",{style:{fontSize:"12px",color:"#666",fontWeight:600},children:["卡片大小 (最小宽度): ",L.minWidth,"px"]}),m.jsx("input",{type:"range",min:"150",max:"500",step:"10",value:L.minWidth,onChange:J=>Z({...L,minWidth:Number(J.target.value)}),style:{width:"200px",cursor:"pointer"}})]}),m.jsxs("div",{style:{display:"flex",flexDirection:"column",gap:"5px"},children:[m.jsxs("label",{style:{fontSize:"12px",color:"#666",fontWeight:600},children:["长宽比 (Aspect Ratio): ",L.aspectRatio.toFixed(2)]}),m.jsxs("div",{style:{display:"flex",alignItems:"center",gap:"10px"},children:[m.jsx("input",{type:"range",min:"0.5",max:"2.0",step:"0.01",value:L.aspectRatio,onChange:J=>Z({...L,aspectRatio:Number(J.target.value)}),style:{width:"200px",cursor:"pointer"}}),m.jsxs("div",{style:{display:"flex",gap:"5px"},children:[m.jsx("button",{onClick:()=>Z({...L,aspectRatio:9/16}),style:{fontSize:"10px",padding:"2px 6px",cursor:"pointer"},children:"9:16"}),m.jsx("button",{onClick:()=>Z({...L,aspectRatio:3/4}),style:{fontSize:"10px",padding:"2px 6px",cursor:"pointer"},children:"3:4"}),m.jsx("button",{onClick:()=>Z({...L,aspectRatio:1}),style:{fontSize:"10px",padding:"2px 6px",cursor:"pointer"},children:"1:1"}),m.jsx("button",{onClick:()=>Z({...L,aspectRatio:4/3}),style:{fontSize:"10px",padding:"2px 6px",cursor:"pointer"},children:"4:3"}),m.jsx("button",{onClick:()=>Z({...L,aspectRatio:16/9}),style:{fontSize:"10px",padding:"2px 6px",cursor:"pointer"},children:"16:9"})]})]})]})]}),i.length===0?m.jsx("p",{style:{textAlign:"center",color:"#666",marginTop:"40px"},children:"暂无物品"}):m.jsx("div",{className:"dashboard-grid",style:{"--card-min-width":`${L.minWidth}px`,"--card-aspect-ratio":L.aspectRatio},children:i.map(J=>m.jsxs("div",{className:"dashboard-card",onClick:()=>M(J),children:[m.jsx("div",{className:"card-bg-layer",children:J.image_path?m.jsx("img",{src:`${jo}${J.image_path}`,alt:J.name,loading:"lazy"}):m.jsx("div",{className:"no-image-gradient",style:{background:Dm(J.id)}})}),m.jsxs("div",{className:"card-overlay",children:[m.jsxs("div",{className:"overlay-left",children:[m.jsx("span",{className:"overlay-text-name",children:J.name}),m.jsx(Mm,{status:J.status})]}),m.jsxs("span",{className:"overlay-text-owner",children:["@",J.owner]})]})]},J.id))}),R&&m.jsx("div",{className:"modal-backdrop",onClick:()=>M(null),children:m.jsxs("div",{className:"modal-container",onClick:J=>J.stopPropagation(),children:[m.jsx("button",{className:"modal-close-btn",onClick:()=>M(null),children:m.jsxs("svg",{width:"20",height:"20",viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2.5",strokeLinecap:"round",strokeLinejoin:"round",children:[m.jsx("line",{x1:"18",y1:"6",x2:"6",y2:"18"}),m.jsx("line",{x1:"6",y1:"6",x2:"18",y2:"18"})]})}),oe()]})})]})};var qo=function(l,r){return qo=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(i,o){i.__proto__=o}||function(i,o){for(var c in o)Object.prototype.hasOwnProperty.call(o,c)&&(i[c]=o[c])},qo(l,r)};function b1(l,r){if(typeof r!="function"&&r!==null)throw new TypeError("Class extends value "+String(r)+" is not a constructor or null");qo(l,r);function i(){this.constructor=l}l.prototype=r===null?Object.create(r):(i.prototype=r.prototype,new i)}var Ie=function(){return Ie=Object.assign||function(r){for(var i,o=1,c=arguments.length;o<c;o++){i=arguments[o];for(var d in i)Object.prototype.hasOwnProperty.call(i,d)&&(r[d]=i[d])}return r},Ie.apply(this,arguments)};var _o,Um;function S1(){if(Um)return _o;Um=1;var l=!1,r,i,o,c,d,h,v,y,p,S,b,R,M,T,D;function j(){if(!l){l=!0;var Z=navigator.userAgent,Q=/(?:MSIE.(\d+\.\d+))|(?:(?:Firefox|GranParadiso|Iceweasel).(\d+\.\d+))|(?:Opera(?:.+Version.|.)(\d+\.\d+))|(?:AppleWebKit.(\d+(?:\.\d+)?))|(?:Trident\/\d+\.\d+.*rv:(\d+\.\d+))/.exec(Z),P=/(Mac OS X)|(Windows)|(Linux)/.exec(Z);if(R=/\b(iPhone|iP[ao]d)/.exec(Z),M=/\b(iP[ao]d)/.exec(Z),S=/Android/i.exec(Z),T=/FBAN\/\w+;/i.exec(Z),D=/Mobile/i.exec(Z),b=!!/Win64/.exec(Z),Q){r=Q[1]?parseFloat(Q[1]):Q[5]?parseFloat(Q[5]):NaN,r&&document&&document.documentMode&&(r=document.documentMode);var ee=/(?:Trident\/(\d+.\d+))/.exec(Z);h=ee?parseFloat(ee[1])+4:r,i=Q[2]?parseFloat(Q[2]):NaN,o=Q[3]?parseFloat(Q[3]):NaN,c=Q[4]?parseFloat(Q[4]):NaN,c?(Q=/(?:Chrome\/(\d+\.\d+))/.exec(Z),d=Q&&Q[1]?parseFloat(Q[1]):NaN):d=NaN}else r=i=o=d=c=NaN;if(P){if(P[1]){var ae=/(?:Mac OS X (\d+(?:[._]\d+)?))/.exec(Z);v=ae?parseFloat(ae[1].replace("_",".")):!0}else v=!1;y=!!P[2],p=!!P[3]}else v=y=p=!1}}var L={ie:function(){return j()||r},ieCompatibilityMode:function(){return j()||h>r},ie64:function(){return L.ie()&&b},firefox:function(){return j()||i},opera:function(){return j()||o},webkit:function(){return j()||c},safari:function(){return L.webkit()},chrome:function(){return j()||d},windows:function(){return j()||y},osx:function(){return j()||v},linux:function(){return j()||p},iphone:function(){return j()||R},mobile:function(){return j()||R||M||S||D},nativeApp:function(){return j()||T},android:function(){return j()||S},ipad:function(){return j()||M}};return _o=L,_o}var No,Hm;function x1(){if(Hm)return No;Hm=1;var l=!!(typeof window<"u"&&window.document&&window.document.createElement),r={canUseDOM:l,canUseWorkers:typeof Worker<"u",canUseEventListeners:l&&!!(window.addEventListener||window.attachEvent),canUseViewport:l&&!!window.screen,isInWorker:!l};return No=r,No}var zo,Bm;function E1(){if(Bm)return zo;Bm=1;var l=x1(),r;l.canUseDOM&&(r=document.implementation&&document.implementation.hasFeature&&document.implementation.hasFeature("","")!==!0);/**
  * Checks if an event is supported in the current execution environment.
  *
  * NOTE: This will not work correctly for non-generic events such as `change`,
@@ -163,7 +163,7 @@ Please change the parent <Route path="${Z}"> to <Route path="${Z==="/"?"*":`${Z}
   border-left: 0;
   border-right: 0;
 }
-`,B1=1,L1=3,q1=1,Y1=(function(l){b1(r,l);function r(){var i=l!==null&&l.apply(this,arguments)||this;return i.cropperRef=A.createRef(),i.imageRef=A.createRef(),i.videoRef=A.createRef(),i.containerPosition={x:0,y:0},i.containerRef=null,i.styleRef=null,i.containerRect=null,i.mediaSize={width:0,height:0,naturalWidth:0,naturalHeight:0},i.dragStartPosition={x:0,y:0},i.dragStartCrop={x:0,y:0},i.gestureZoomStart=0,i.gestureRotationStart=0,i.isTouching=!1,i.lastPinchDistance=0,i.lastPinchRotation=0,i.rafDragTimeout=null,i.rafPinchTimeout=null,i.wheelTimer=null,i.currentDoc=typeof document<"u"?document:null,i.currentWindow=typeof window<"u"?window:null,i.resizeObserver=null,i.previousCropSize=null,i.isInitialized=!1,i.state={cropSize:null,hasWheelJustStarted:!1,mediaObjectFit:void 0},i.initResizeObserver=function(){if(!(typeof window.ResizeObserver>"u"||!i.containerRef)){var o=!0;i.resizeObserver=new window.ResizeObserver(function(c){if(o){o=!1;return}i.computeSizes()}),i.resizeObserver.observe(i.containerRef)}},i.preventZoomSafari=function(o){return o.preventDefault()},i.cleanEvents=function(){i.currentDoc&&(i.currentDoc.removeEventListener("mousemove",i.onMouseMove),i.currentDoc.removeEventListener("mouseup",i.onDragStopped),i.currentDoc.removeEventListener("touchmove",i.onTouchMove),i.currentDoc.removeEventListener("touchend",i.onDragStopped),i.currentDoc.removeEventListener("gesturechange",i.onGestureChange),i.currentDoc.removeEventListener("gestureend",i.onGestureEnd),i.currentDoc.removeEventListener("scroll",i.onScroll))},i.clearScrollEvent=function(){i.containerRef&&i.containerRef.removeEventListener("wheel",i.onWheel),i.wheelTimer&&clearTimeout(i.wheelTimer)},i.onMediaLoad=function(){var o=i.computeSizes();o&&(i.previousCropSize=o,i.emitCropData(),i.setInitialCrop(o),i.isInitialized=!0),i.props.onMediaLoaded&&i.props.onMediaLoaded(i.mediaSize)},i.setInitialCrop=function(o){if(i.props.initialCroppedAreaPercentages){var c=O1(i.props.initialCroppedAreaPercentages,i.mediaSize,i.props.rotation,o,i.props.minZoom,i.props.maxZoom),d=c.crop,h=c.zoom;i.props.onCropChange(d),i.props.onZoomChange&&i.props.onZoomChange(h)}else if(i.props.initialCroppedAreaPixels){var v=M1(i.props.initialCroppedAreaPixels,i.mediaSize,i.props.rotation,o,i.props.minZoom,i.props.maxZoom),d=v.crop,h=v.zoom;i.props.onCropChange(d),i.props.onZoomChange&&i.props.onZoomChange(h)}},i.computeSizes=function(){var o,c,d,h,v,y,p=i.imageRef.current||i.videoRef.current;if(p&&i.containerRef){i.containerRect=i.containerRef.getBoundingClientRect(),i.saveContainerPosition();var S=i.containerRect.width/i.containerRect.height,b=((o=i.imageRef.current)===null||o===void 0?void 0:o.naturalWidth)||((c=i.videoRef.current)===null||c===void 0?void 0:c.videoWidth)||0,R=((d=i.imageRef.current)===null||d===void 0?void 0:d.naturalHeight)||((h=i.videoRef.current)===null||h===void 0?void 0:h.videoHeight)||0,M=p.offsetWidth<b||p.offsetHeight<R,T=b/R,D=void 0;if(M)switch(i.state.mediaObjectFit){default:case"contain":D=S>T?{width:i.containerRect.height*T,height:i.containerRect.height}:{width:i.containerRect.width,height:i.containerRect.width/T};break;case"horizontal-cover":D={width:i.containerRect.width,height:i.containerRect.width/T};break;case"vertical-cover":D={width:i.containerRect.height*T,height:i.containerRect.height};break}else D={width:p.offsetWidth,height:p.offsetHeight};i.mediaSize=Ie(Ie({},D),{naturalWidth:b,naturalHeight:R}),i.props.setMediaSize&&i.props.setMediaSize(i.mediaSize);var j=i.props.cropSize?i.props.cropSize:j1(i.mediaSize.width,i.mediaSize.height,i.containerRect.width,i.containerRect.height,i.props.aspect,i.props.rotation);return(((v=i.state.cropSize)===null||v===void 0?void 0:v.height)!==j.height||((y=i.state.cropSize)===null||y===void 0?void 0:y.width)!==j.width)&&i.props.onCropSizeChange&&i.props.onCropSizeChange(j),i.setState({cropSize:j},i.recomputeCropPosition),i.props.setCropSize&&i.props.setCropSize(j),j}},i.saveContainerPosition=function(){if(i.containerRef){var o=i.containerRef.getBoundingClientRect();i.containerPosition={x:o.left,y:o.top}}},i.onMouseDown=function(o){i.currentDoc&&(o.preventDefault(),i.currentDoc.addEventListener("mousemove",i.onMouseMove),i.currentDoc.addEventListener("mouseup",i.onDragStopped),i.saveContainerPosition(),i.onDragStart(r.getMousePoint(o)))},i.onMouseMove=function(o){return i.onDrag(r.getMousePoint(o))},i.onScroll=function(o){i.currentDoc&&(o.preventDefault(),i.saveContainerPosition())},i.onTouchStart=function(o){i.currentDoc&&(i.isTouching=!0,!(i.props.onTouchRequest&&!i.props.onTouchRequest(o))&&(i.currentDoc.addEventListener("touchmove",i.onTouchMove,{passive:!1}),i.currentDoc.addEventListener("touchend",i.onDragStopped),i.saveContainerPosition(),o.touches.length===2?i.onPinchStart(o):o.touches.length===1&&i.onDragStart(r.getTouchPoint(o.touches[0]))))},i.onTouchMove=function(o){o.preventDefault(),o.touches.length===2?i.onPinchMove(o):o.touches.length===1&&i.onDrag(r.getTouchPoint(o.touches[0]))},i.onGestureStart=function(o){i.currentDoc&&(o.preventDefault(),i.currentDoc.addEventListener("gesturechange",i.onGestureChange),i.currentDoc.addEventListener("gestureend",i.onGestureEnd),i.gestureZoomStart=i.props.zoom,i.gestureRotationStart=i.props.rotation)},i.onGestureChange=function(o){if(o.preventDefault(),!i.isTouching){var c=r.getMousePoint(o),d=i.gestureZoomStart-1+o.scale;if(i.setNewZoom(d,c,{shouldUpdatePosition:!0}),i.props.onRotationChange){var h=i.gestureRotationStart+o.rotation;i.props.onRotationChange(h)}}},i.onGestureEnd=function(o){i.cleanEvents()},i.onDragStart=function(o){var c,d,h=o.x,v=o.y;i.dragStartPosition={x:h,y:v},i.dragStartCrop=Ie({},i.props.crop),(d=(c=i.props).onInteractionStart)===null||d===void 0||d.call(c)},i.onDrag=function(o){var c=o.x,d=o.y;i.currentWindow&&(i.rafDragTimeout&&i.currentWindow.cancelAnimationFrame(i.rafDragTimeout),i.rafDragTimeout=i.currentWindow.requestAnimationFrame(function(){if(i.state.cropSize&&!(c===void 0||d===void 0)){var h=c-i.dragStartPosition.x,v=d-i.dragStartPosition.y,y={x:i.dragStartCrop.x+h,y:i.dragStartCrop.y+v},p=i.props.restrictPosition?li(y,i.mediaSize,i.state.cropSize,i.props.zoom,i.props.rotation):y;i.props.onCropChange(p)}}))},i.onDragStopped=function(){var o,c;i.isTouching=!1,i.cleanEvents(),i.emitCropData(),(c=(o=i.props).onInteractionEnd)===null||c===void 0||c.call(o)},i.onWheel=function(o){if(i.currentWindow&&!(i.props.onWheelRequest&&!i.props.onWheelRequest(o))){o.preventDefault();var c=r.getMousePoint(o),d=A1(o).pixelY,h=i.props.zoom-d*i.props.zoomSpeed/200;i.setNewZoom(h,c,{shouldUpdatePosition:!0}),i.state.hasWheelJustStarted||i.setState({hasWheelJustStarted:!0},function(){var v,y;return(y=(v=i.props).onInteractionStart)===null||y===void 0?void 0:y.call(v)}),i.wheelTimer&&clearTimeout(i.wheelTimer),i.wheelTimer=i.currentWindow.setTimeout(function(){return i.setState({hasWheelJustStarted:!1},function(){var v,y;return(y=(v=i.props).onInteractionEnd)===null||y===void 0?void 0:y.call(v)})},250)}},i.getPointOnContainer=function(o,c){var d=o.x,h=o.y;if(!i.containerRect)throw new Error("The Cropper is not mounted");return{x:i.containerRect.width/2-(d-c.x),y:i.containerRect.height/2-(h-c.y)}},i.getPointOnMedia=function(o){var c=o.x,d=o.y,h=i.props,v=h.crop,y=h.zoom;return{x:(c+v.x)/y,y:(d+v.y)/y}},i.setNewZoom=function(o,c,d){var h=d===void 0?{}:d,v=h.shouldUpdatePosition,y=v===void 0?!0:v;if(!(!i.state.cropSize||!i.props.onZoomChange)){var p=$u(o,i.props.minZoom,i.props.maxZoom);if(y){var S=i.getPointOnContainer(c,i.containerPosition),b=i.getPointOnMedia(S),R={x:b.x*p-S.x,y:b.y*p-S.y},M=i.props.restrictPosition?li(R,i.mediaSize,i.state.cropSize,p,i.props.rotation):R;i.props.onCropChange(M)}i.props.onZoomChange(p)}},i.getCropData=function(){if(!i.state.cropSize)return null;var o=i.props.restrictPosition?li(i.props.crop,i.mediaSize,i.state.cropSize,i.props.zoom,i.props.rotation):i.props.crop;return N1(o,i.mediaSize,i.state.cropSize,i.getAspect(),i.props.zoom,i.props.rotation,i.props.restrictPosition)},i.emitCropData=function(){var o=i.getCropData();if(o){var c=o.croppedAreaPercentages,d=o.croppedAreaPixels;i.props.onCropComplete&&i.props.onCropComplete(c,d),i.props.onCropAreaChange&&i.props.onCropAreaChange(c,d)}},i.emitCropAreaChange=function(){var o=i.getCropData();if(o){var c=o.croppedAreaPercentages,d=o.croppedAreaPixels;i.props.onCropAreaChange&&i.props.onCropAreaChange(c,d)}},i.recomputeCropPosition=function(){var o,c;if(i.state.cropSize){var d=i.props.crop;if(i.isInitialized&&(!((o=i.previousCropSize)===null||o===void 0)&&o.width)&&(!((c=i.previousCropSize)===null||c===void 0)&&c.height)){var h=Math.abs(i.previousCropSize.width-i.state.cropSize.width)>1e-6||Math.abs(i.previousCropSize.height-i.state.cropSize.height)>1e-6;if(h){var v=i.state.cropSize.width/i.previousCropSize.width,y=i.state.cropSize.height/i.previousCropSize.height;d={x:i.props.crop.x*v,y:i.props.crop.y*y}}}var p=i.props.restrictPosition?li(d,i.mediaSize,i.state.cropSize,i.props.zoom,i.props.rotation):d;i.previousCropSize=i.state.cropSize,i.props.onCropChange(p),i.emitCropData()}},i.onKeyDown=function(o){var c,d,h=i.props,v=h.crop,y=h.onCropChange,p=h.keyboardStep,S=h.zoom,b=h.rotation,R=p;if(i.state.cropSize){o.shiftKey&&(R*=.2);var M=Ie({},v);switch(o.key){case"ArrowUp":M.y-=R,o.preventDefault();break;case"ArrowDown":M.y+=R,o.preventDefault();break;case"ArrowLeft":M.x-=R,o.preventDefault();break;case"ArrowRight":M.x+=R,o.preventDefault();break;default:return}i.props.restrictPosition&&(M=li(M,i.mediaSize,i.state.cropSize,S,b)),o.repeat||(d=(c=i.props).onInteractionStart)===null||d===void 0||d.call(c),y(M)}},i.onKeyUp=function(o){var c,d;switch(o.key){case"ArrowUp":case"ArrowDown":case"ArrowLeft":case"ArrowRight":o.preventDefault();break;default:return}i.emitCropData(),(d=(c=i.props).onInteractionEnd)===null||d===void 0||d.call(c)},i}return r.prototype.componentDidMount=function(){!this.currentDoc||!this.currentWindow||(this.containerRef&&(this.containerRef.ownerDocument&&(this.currentDoc=this.containerRef.ownerDocument),this.currentDoc.defaultView&&(this.currentWindow=this.currentDoc.defaultView),this.initResizeObserver(),typeof window.ResizeObserver>"u"&&this.currentWindow.addEventListener("resize",this.computeSizes),this.props.zoomWithScroll&&this.containerRef.addEventListener("wheel",this.onWheel,{passive:!1}),this.containerRef.addEventListener("gesturestart",this.onGestureStart)),this.currentDoc.addEventListener("scroll",this.onScroll),this.props.disableAutomaticStylesInjection||(this.styleRef=this.currentDoc.createElement("style"),this.styleRef.setAttribute("type","text/css"),this.props.nonce&&this.styleRef.setAttribute("nonce",this.props.nonce),this.styleRef.innerHTML=H1,this.currentDoc.head.appendChild(this.styleRef)),this.imageRef.current&&this.imageRef.current.complete&&this.onMediaLoad(),this.props.setImageRef&&this.props.setImageRef(this.imageRef),this.props.setVideoRef&&this.props.setVideoRef(this.videoRef),this.props.setCropperRef&&this.props.setCropperRef(this.cropperRef))},r.prototype.componentWillUnmount=function(){var i,o;!this.currentDoc||!this.currentWindow||(typeof window.ResizeObserver>"u"&&this.currentWindow.removeEventListener("resize",this.computeSizes),(i=this.resizeObserver)===null||i===void 0||i.disconnect(),this.containerRef&&this.containerRef.removeEventListener("gesturestart",this.preventZoomSafari),this.styleRef&&((o=this.styleRef.parentNode)===null||o===void 0||o.removeChild(this.styleRef)),this.cleanEvents(),this.props.zoomWithScroll&&this.clearScrollEvent())},r.prototype.componentDidUpdate=function(i){var o,c,d,h,v,y,p,S,b;i.rotation!==this.props.rotation?(this.computeSizes(),this.recomputeCropPosition()):i.aspect!==this.props.aspect?this.computeSizes():i.objectFit!==this.props.objectFit?this.computeSizes():i.zoom!==this.props.zoom?this.recomputeCropPosition():((o=i.cropSize)===null||o===void 0?void 0:o.height)!==((c=this.props.cropSize)===null||c===void 0?void 0:c.height)||((d=i.cropSize)===null||d===void 0?void 0:d.width)!==((h=this.props.cropSize)===null||h===void 0?void 0:h.width)?this.computeSizes():(((v=i.crop)===null||v===void 0?void 0:v.x)!==((y=this.props.crop)===null||y===void 0?void 0:y.x)||((p=i.crop)===null||p===void 0?void 0:p.y)!==((S=this.props.crop)===null||S===void 0?void 0:S.y))&&this.emitCropAreaChange(),i.zoomWithScroll!==this.props.zoomWithScroll&&this.containerRef&&(this.props.zoomWithScroll?this.containerRef.addEventListener("wheel",this.onWheel,{passive:!1}):this.clearScrollEvent()),i.video!==this.props.video&&((b=this.videoRef.current)===null||b===void 0||b.load());var R=this.getObjectFit();R!==this.state.mediaObjectFit&&this.setState({mediaObjectFit:R},this.computeSizes)},r.prototype.getAspect=function(){var i=this.props,o=i.cropSize,c=i.aspect;return o?o.width/o.height:c},r.prototype.getObjectFit=function(){var i,o,c,d;if(this.props.objectFit==="cover"){var h=this.imageRef.current||this.videoRef.current;if(h&&this.containerRef){this.containerRect=this.containerRef.getBoundingClientRect();var v=this.containerRect.width/this.containerRect.height,y=((i=this.imageRef.current)===null||i===void 0?void 0:i.naturalWidth)||((o=this.videoRef.current)===null||o===void 0?void 0:o.videoWidth)||0,p=((c=this.imageRef.current)===null||c===void 0?void 0:c.naturalHeight)||((d=this.videoRef.current)===null||d===void 0?void 0:d.videoHeight)||0,S=y/p;return S<v?"horizontal-cover":"vertical-cover"}return"horizontal-cover"}return this.props.objectFit},r.prototype.onPinchStart=function(i){var o=r.getTouchPoint(i.touches[0]),c=r.getTouchPoint(i.touches[1]);this.lastPinchDistance=Gm(o,c),this.lastPinchRotation=Xm(o,c),this.onDragStart(Zm(o,c))},r.prototype.onPinchMove=function(i){var o=this;if(!(!this.currentDoc||!this.currentWindow)){var c=r.getTouchPoint(i.touches[0]),d=r.getTouchPoint(i.touches[1]),h=Zm(c,d);this.onDrag(h),this.rafPinchTimeout&&this.currentWindow.cancelAnimationFrame(this.rafPinchTimeout),this.rafPinchTimeout=this.currentWindow.requestAnimationFrame(function(){var v=Gm(c,d),y=o.props.zoom*(v/o.lastPinchDistance);o.setNewZoom(y,h,{shouldUpdatePosition:!1}),o.lastPinchDistance=v;var p=Xm(c,d),S=o.props.rotation+(p-o.lastPinchRotation);o.props.onRotationChange&&o.props.onRotationChange(S),o.lastPinchRotation=p})}},r.prototype.render=function(){var i=this,o,c=this.props,d=c.image,h=c.video,v=c.mediaProps,y=c.cropperProps,p=c.transform,S=c.crop,b=S.x,R=S.y,M=c.rotation,T=c.zoom,D=c.cropShape,j=c.showGrid,L=c.roundCropAreaPixels,Z=c.style,Q=Z.containerStyle,P=Z.cropAreaStyle,ee=Z.mediaStyle,ae=c.classes,V=ae.containerClassName,oe=ae.cropAreaClassName,J=ae.mediaClassName,le=(o=this.state.mediaObjectFit)!==null&&o!==void 0?o:this.getObjectFit();return A.createElement("div",{onMouseDown:this.onMouseDown,onTouchStart:this.onTouchStart,ref:function(ge){return i.containerRef=ge},"data-testid":"container",style:Q,className:Ou("reactEasyCrop_Container",V)},d?A.createElement("img",Ie({alt:"",className:Ou("reactEasyCrop_Image",le==="contain"&&"reactEasyCrop_Contain",le==="horizontal-cover"&&"reactEasyCrop_Cover_Horizontal",le==="vertical-cover"&&"reactEasyCrop_Cover_Vertical",J)},v,{src:d,ref:this.imageRef,style:Ie(Ie({},ee),{transform:p||"translate(".concat(b,"px, ").concat(R,"px) rotate(").concat(M,"deg) scale(").concat(T,")")}),onLoad:this.onMediaLoad})):h&&A.createElement("video",Ie({autoPlay:!0,playsInline:!0,loop:!0,muted:!0,className:Ou("reactEasyCrop_Video",le==="contain"&&"reactEasyCrop_Contain",le==="horizontal-cover"&&"reactEasyCrop_Cover_Horizontal",le==="vertical-cover"&&"reactEasyCrop_Cover_Vertical",J)},v,{ref:this.videoRef,onLoadedMetadata:this.onMediaLoad,style:Ie(Ie({},ee),{transform:p||"translate(".concat(b,"px, ").concat(R,"px) rotate(").concat(M,"deg) scale(").concat(T,")")}),controls:!1}),(Array.isArray(h)?h:[{src:h}]).map(function(me){return A.createElement("source",Ie({key:me.src},me))})),this.state.cropSize&&A.createElement("div",Ie({ref:this.cropperRef,style:Ie(Ie({},P),{width:L?Math.round(this.state.cropSize.width):this.state.cropSize.width,height:L?Math.round(this.state.cropSize.height):this.state.cropSize.height}),tabIndex:0,onKeyDown:this.onKeyDown,onKeyUp:this.onKeyUp,"data-testid":"cropper",className:Ou("reactEasyCrop_CropArea",D==="round"&&"reactEasyCrop_CropAreaRound",j&&"reactEasyCrop_CropAreaGrid",oe)},y)))},r.defaultProps={zoom:1,rotation:0,aspect:4/3,maxZoom:L1,minZoom:B1,cropShape:"rect",objectFit:"contain",showGrid:!0,style:{},classes:{},mediaProps:{},cropperProps:{},zoomSpeed:1,restrictPosition:!0,zoomWithScroll:!0,keyboardStep:q1},r.getMousePoint=function(i){return{x:Number(i.clientX),y:Number(i.clientY)}},r.getTouchPoint=function(i){return{x:Number(i.clientX),y:Number(i.clientY)}},r})(A.Component);const G1=l=>new Promise((r,i)=>{const o=new Image;o.addEventListener("load",()=>r(o)),o.addEventListener("error",c=>i(c)),o.setAttribute("crossOrigin","anonymous"),o.src=l});function Np(l){return l*Math.PI/180}function X1(l,r,i){const o=Np(i);return{width:Math.abs(Math.cos(o)*l)+Math.abs(Math.sin(o)*r),height:Math.abs(Math.sin(o)*l)+Math.abs(Math.cos(o)*r)}}async function Z1(l,r,i=0,o={horizontal:!1,vertical:!1}){const c=await G1(l),d=document.createElement("canvas"),h=d.getContext("2d");if(!h)return null;const v=Np(i),{width:y,height:p}=X1(c.width,c.height,i);d.width=y,d.height=p,h.translate(y/2,p/2),h.rotate(v),h.scale(o.horizontal?-1:1,o.vertical?-1:1),h.translate(-c.width/2,-c.height/2),h.drawImage(c,0,0);const S=h.getImageData(r.x,r.y,r.width,r.height);return d.width=r.width,d.height=r.height,h.putImageData(S,0,0),new Promise(b=>{d.toBlob(R=>{b(R)},"image/jpeg",.9)})}const zp=({onImageUploaded:l})=>{const[r,i]=A.useState(null),[o,c]=A.useState({x:0,y:0}),[d,h]=A.useState(1),[v,y]=A.useState(null),[p,S]=A.useState(!1),[b,R]=A.useState(!1),M=A.useRef(null),T=async V=>{if(V&&V.type.startsWith("image/")){const oe=await Q(V);i(oe)}else alert("请上传图片文件")},D=V=>{V.target.files&&V.target.files.length>0&&T(V.target.files[0])},j=V=>{V.preventDefault(),V.stopPropagation(),V.type==="dragenter"||V.type==="dragover"?R(!0):V.type==="dragleave"&&R(!1)},L=V=>{V.preventDefault(),V.stopPropagation(),R(!1),V.dataTransfer.files&&V.dataTransfer.files[0]&&T(V.dataTransfer.files[0])},Z=()=>{M.current?.click()},Q=V=>new Promise(oe=>{const J=new FileReader;J.addEventListener("load",()=>oe(J.result),!1),J.readAsDataURL(V)}),P=A.useCallback((V,oe)=>{y(oe)},[]),ee=async()=>{if(!(!r||!v)){S(!0);try{const V=await Z1(r,v);if(!V)return;const oe=new FormData;oe.append("file",V,"item-image.jpg");const le=(await Ce.post("/upload",oe,{headers:{"Content-Type":"multipart/form-data"}})).data.path;l(le),i(null)}catch(V){console.error(V),alert("图片上传失败")}finally{S(!1)}}},ae=()=>{i(null),h(1)};return m.jsx("div",{className:"image-uploader-container",children:r?m.jsxs("div",{className:"cropper-wrapper",children:[m.jsx("div",{className:"cropper-area",children:m.jsx(Y1,{image:r,crop:o,zoom:d,aspect:4/3,onCropChange:c,onCropComplete:P,onZoomChange:h})}),m.jsxs("div",{className:"cropper-controls",children:[m.jsxs("div",{className:"zoom-slider",children:[m.jsx("label",{children:"缩放:"}),m.jsx("input",{type:"range",value:d,min:1,max:3,step:.1,onChange:V=>h(Number(V.target.value))})]}),m.jsxs("div",{className:"cropper-buttons",children:[m.jsx("button",{type:"button",onClick:ae,disabled:p,className:"btn-secondary",children:"取消"}),m.jsx("button",{type:"button",onClick:ee,disabled:p,className:"btn-primary",children:p?"上传中...":"确认裁剪并上传"})]})]})]}):m.jsxs("div",{className:`upload-drop-zone ${b?"active":""}`,onDragEnter:j,onDragLeave:j,onDragOver:j,onDrop:L,onClick:Z,children:[m.jsx("input",{ref:M,type:"file",accept:"image/*",onChange:D,className:"hidden-input"}),m.jsx("div",{className:"upload-icon",children:m.jsxs("svg",{viewBox:"0 0 24 24",width:"48",height:"48",fill:"none",stroke:"currentColor",strokeWidth:"1.5",strokeLinecap:"round",strokeLinejoin:"round",children:[m.jsx("rect",{x:"3",y:"3",width:"18",height:"18",rx:"2",ry:"2"}),m.jsx("circle",{cx:"8.5",cy:"8.5",r:"1.5"}),m.jsx("polyline",{points:"21 15 16 10 5 21"})]})}),m.jsx("p",{className:"upload-text",children:"点击或拖拽上传"}),m.jsx("span",{className:"upload-hint",children:"支持 JPG, PNG (自动裁剪 4:3)"})]})})},Q1=()=>{const l=gn.c(39),r=ma();let i;l[0]===Symbol.for("react.memo_cache_sentinel")?(i=[],l[0]=i):i=l[0];const[o,c]=A.useState(i),[d,h]=A.useState(null);let v;l[1]===Symbol.for("react.memo_cache_sentinel")?(v={name:"",description:"",address:"",phone:"",email:"",image_path:""},l[1]=v):v=l[1];const[y,p]=A.useState(v);let S;l[2]===Symbol.for("react.memo_cache_sentinel")?(S={},l[2]=S):S=l[2];const[b,R]=A.useState(S);let M,T;l[3]===Symbol.for("react.memo_cache_sentinel")?(M=()=>{Ce.get("/types").then(re=>c(re.data))},T=[],l[3]=M,l[4]=T):(M=l[3],T=l[4]),A.useEffect(M,T);let D;l[5]!==o?(D=re=>{const we=parseInt(re.target.value),H=o.find(k=>k.id===we)||null;h(H),R({})},l[5]=o,l[6]=D):D=l[6];const j=D;let L;l[7]!==b||l[8]!==y||l[9]!==r||l[10]!==d?(L=async re=>{if(re.preventDefault(),!!d)try{await Ce.post("/items",{type_id:d.id,...y,attributes:b}),alert("发布成功"),r("/")}catch(we){console.error(we),alert("发布失败")}},l[7]=b,l[8]=y,l[9]=r,l[10]=d,l[11]=L):L=l[11];const Z=L;let Q;l[12]===Symbol.for("react.memo_cache_sentinel")?(Q=m.jsx("h2",{children:"发布新物品"}),l[12]=Q):Q=l[12];let P;l[13]===Symbol.for("react.memo_cache_sentinel")?(P=m.jsxs("label",{children:["物品类型 ",m.jsx("span",{style:{color:"red"},children:"*"}),":"]}),l[13]=P):P=l[13];let ee;l[14]===Symbol.for("react.memo_cache_sentinel")?(ee=m.jsx("option",{value:"",children:"-- 请选择 --"}),l[14]=ee):ee=l[14];let ae;l[15]!==o?(ae=o.map(V1),l[15]=o,l[16]=ae):ae=l[16];let V;l[17]!==j||l[18]!==ae?(V=m.jsxs("div",{className:"form-group",children:[P,m.jsxs("select",{required:!0,onChange:j,defaultValue:"",children:[ee,ae]})]}),l[17]=j,l[18]=ae,l[19]=V):V=l[19];let oe;l[20]!==y||l[21]!==d?(oe=d&&m.jsxs(m.Fragment,{children:[m.jsxs("div",{className:"form-group",children:[m.jsxs("label",{children:["物品名称 ",m.jsx("span",{style:{color:"red"},children:"*"}),":"]}),m.jsx("input",{required:!0,type:"text",value:y.name,onChange:re=>p({...y,name:re.target.value})})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"描述:"}),m.jsx("textarea",{value:y.description,onChange:re=>p({...y,description:re.target.value})})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"地址:"}),m.jsx("input",{type:"text",value:y.address,onChange:re=>p({...y,address:re.target.value})})]})]}),l[20]=y,l[21]=d,l[22]=oe):oe=l[22];let J;l[23]!==V||l[24]!==oe?(J=m.jsxs("div",{className:"form-left",children:[V,oe]}),l[23]=V,l[24]=oe,l[25]=J):J=l[25];let le;l[26]!==b||l[27]!==d?(le=d&&m.jsxs("div",{className:"form-right",children:[m.jsxs("h4",{children:[d.name," 特有属性"]}),d.attributes.map(re=>m.jsxs("div",{className:"form-group",children:[m.jsxs("label",{children:[re.label,re.required&&m.jsx("span",{style:{color:"red"},children:" *"}),":"]}),re.type==="select"&&re.options?m.jsxs("select",{required:re.required,value:b[re.key]||"",onChange:we=>R(H=>({...H,[re.key]:we.target.value})),children:[m.jsx("option",{value:"",children:"-- 请选择 --"}),re.options.map(K1)]}):m.jsx("input",{type:re.type==="number"?"number":re.type==="date"?"date":"text",required:re.required,value:b[re.key]||"",onChange:we=>R(H=>({...H,[re.key]:we.target.value}))})]},re.key))]}),l[26]=b,l[27]=d,l[28]=le):le=l[28];let me;l[29]!==J||l[30]!==le?(me=m.jsxs("div",{className:"form-content",children:[J,le]}),l[29]=J,l[30]=le,l[31]=me):me=l[31];let ge;l[32]!==y||l[33]!==d?(ge=d&&m.jsxs(m.Fragment,{children:[m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"物品示意图:"}),m.jsxs("div",{className:`form-content image-upload-section ${y.image_path?"has-image":""}`,children:[m.jsx("div",{className:"form-left",style:{display:"flex",alignItems:"center"},children:m.jsx(zp,{onImageUploaded:re=>p({...y,image_path:re})})}),y.image_path&&m.jsx("div",{className:"form-right preview-wrapper",children:m.jsx("div",{className:"uploaded-preview-container",children:m.jsx("img",{src:`http://localhost:5000${y.image_path}`,alt:"已上传预览",className:"uploaded-preview-img"})})})]})]}),m.jsx("button",{type:"submit",children:"提交物品"})]}),l[32]=y,l[33]=d,l[34]=ge):ge=l[34];let Le;return l[35]!==Z||l[36]!==me||l[37]!==ge?(Le=m.jsx("div",{className:"page-container",children:m.jsxs("div",{className:"add-item-container",children:[Q,m.jsxs("form",{onSubmit:Z,className:"add-item-form",children:[me,ge]})]})}),l[35]=Z,l[36]=me,l[37]=ge,l[38]=Le):Le=l[38],Le};function V1(l){return m.jsx("option",{value:l.id,children:l.name},l.id)}function K1(l,r){return m.jsx("option",{value:l,children:l},r)}const Qm=()=>"attr_"+Math.random().toString(36).substr(2,9),J1=()=>{const{user:l,logout:r}=A.useContext(pa),[i,o]=A.useState([]),[c,d]=A.useState([]),[h,v]=A.useState(""),[y,p]=A.useState({name:"",attributes:[]}),[S,b]=A.useState({}),[R,M]=A.useState([]),[T,D]=A.useState(""),[j,L]=A.useState({name:"",attributes:[]}),[Z,Q]=A.useState({}),[P,ee]=A.useState(!0);A.useEffect(()=>{(async()=>{ee(!0);try{const[K,W,ce]=await Promise.all([Ce.get("/admin/users?status=pending"),Ce.get(`/admin/users?status=approved&keyword=${h}`),Ce.get("/types")]);o(K.data),d(W.data),M(ce.data)}catch(K){console.error("Failed to fetch data",K)}finally{ee(!1)}})()},[]);const ae=async(w="")=>{try{const K=`/admin/users?status=approved&keyword=${w}`,W=await Ce.get(K);d(W.data)}catch{console.error("Failed to fetch approved users")}},V=async()=>{try{const w=await Ce.get("/types");M(w.data)}catch{console.error("Failed to fetch types")}},oe=async(w,K)=>{await Ce.post(`/admin/approve/${w}`,{action:K});const[W,ce]=await Promise.all([Ce.get("/admin/users?status=pending"),Ce.get(`/admin/users?status=approved&keyword=${h}`)]);o(W.data),d(ce.data)},J=()=>{ae(h)},le=async(w,K)=>{if(window.confirm(`确定要永久删除用户 "${K}" 及其所有物品吗？`))try{await Ce.delete(`/admin/users/${w}`),alert("用户已删除"),ae(h);const W=await Ce.get("/admin/users?status=pending");o(W.data)}catch{alert("删除失败")}},me=async(w,K)=>{if(window.confirm(`确定将用户 "${K}" 提升为管理员吗？`))try{await Ce.post(`/admin/promote/${w}`),alert(`${K} 已被提升为管理员`),ae(h)}catch{alert("操作失败")}},ge=async(w,K)=>{if(window.confirm(`确定将用户 "${K}" 降为普通用户吗？`))try{await Ce.post(`/admin/demote/${w}`),alert(`${K} 已降为普通用户`),ae(h)}catch{alert("操作失败")}},Le=()=>{p(w=>({...w,attributes:[...w.attributes,{key:Qm(),label:"",type:"text",required:!1}]}))},re=w=>{p(W=>({...W,attributes:W.attributes.filter((ce,Re)=>Re!==w)}));const K={...S};delete K[w],b(K)},we=(w,K,W)=>{const ce=[...y.attributes];ce[w]={...ce[w],[K]:W},p(Re=>({...Re,attributes:ce}))},H=(w,K)=>{b(Re=>({...Re,[w]:K}));const W=K.split(/[,，]/).map(Re=>Re.trim()).filter(Re=>Re!==""),ce=[...y.attributes];ce[w].options=W,p(Re=>({...Re,attributes:ce}))},k=async()=>{if(!y.name)return alert("请输入类型名称");try{await Ce.post("/types",{name:y.name,attributes:y.attributes}),alert("类型添加成功！"),p({name:"",attributes:[]}),b({}),V()}catch(w){alert("添加失败: "+(w.response?.data?.msg||w.message))}},ne=w=>{const K=parseInt(w);if(D(w),!w){L({name:"",attributes:[]}),Q({});return}const W=R.find(ce=>ce.id===K);if(W){const ce=W.attributes.map(Qt=>({...Qt}));L({name:W.name,attributes:ce});const Re={};ce.forEach((Qt,rl)=>{Qt.type==="select"&&Qt.options&&(Re[rl]=Qt.options.join(", "))}),Q(Re)}},Ee=()=>{L(w=>({...w,attributes:[...w.attributes,{key:Qm(),label:"",type:"text",required:!1}]}))},je=w=>{L(W=>({...W,attributes:W.attributes.filter((ce,Re)=>Re!==w)}));const K={...Z};delete K[w],Q(K)},E=(w,K,W)=>{const ce=[...j.attributes];ce[w]={...ce[w],[K]:W},L(Re=>({...Re,attributes:ce}))},Y=(w,K)=>{Q(Re=>({...Re,[w]:K}));const W=K.split(/[,，]/).map(Re=>Re.trim()).filter(Re=>Re!==""),ce=[...j.attributes];ce[w].options=W,L(Re=>({...Re,attributes:ce}))},$=async()=>{if(T){if(!j.name)return alert("类型名称不能为空");for(let w of j.attributes){if(!w.label||!w.key)return alert("所有属性必须包含 Label 和 Key");if(w.type==="select"&&(!w.options||w.options.length===0))return alert(`属性 "${w.label}" 需要至少一个选项`)}try{await Ce.put(`/types/${T}`,j),alert("类型更新成功"),D(""),L({name:"",attributes:[]}),Q({}),V()}catch(w){alert("更新失败: "+(w.response?.data?.msg||w.message))}}},F=async()=>{if(T&&window.confirm("确定删除该类型吗？这将可能影响属于该类型的所有物品！"))try{await Ce.delete(`/types/${T}`),alert("类型已删除"),D(""),L({name:"",attributes:[]}),V()}catch(w){alert("删除失败: "+(w.response?.data?.msg||w.message))}},se=async()=>{if(!window.confirm(`⚠️ 严重警告 ⚠️
+`,B1=1,L1=3,q1=1,Y1=(function(l){b1(r,l);function r(){var i=l!==null&&l.apply(this,arguments)||this;return i.cropperRef=A.createRef(),i.imageRef=A.createRef(),i.videoRef=A.createRef(),i.containerPosition={x:0,y:0},i.containerRef=null,i.styleRef=null,i.containerRect=null,i.mediaSize={width:0,height:0,naturalWidth:0,naturalHeight:0},i.dragStartPosition={x:0,y:0},i.dragStartCrop={x:0,y:0},i.gestureZoomStart=0,i.gestureRotationStart=0,i.isTouching=!1,i.lastPinchDistance=0,i.lastPinchRotation=0,i.rafDragTimeout=null,i.rafPinchTimeout=null,i.wheelTimer=null,i.currentDoc=typeof document<"u"?document:null,i.currentWindow=typeof window<"u"?window:null,i.resizeObserver=null,i.previousCropSize=null,i.isInitialized=!1,i.state={cropSize:null,hasWheelJustStarted:!1,mediaObjectFit:void 0},i.initResizeObserver=function(){if(!(typeof window.ResizeObserver>"u"||!i.containerRef)){var o=!0;i.resizeObserver=new window.ResizeObserver(function(c){if(o){o=!1;return}i.computeSizes()}),i.resizeObserver.observe(i.containerRef)}},i.preventZoomSafari=function(o){return o.preventDefault()},i.cleanEvents=function(){i.currentDoc&&(i.currentDoc.removeEventListener("mousemove",i.onMouseMove),i.currentDoc.removeEventListener("mouseup",i.onDragStopped),i.currentDoc.removeEventListener("touchmove",i.onTouchMove),i.currentDoc.removeEventListener("touchend",i.onDragStopped),i.currentDoc.removeEventListener("gesturechange",i.onGestureChange),i.currentDoc.removeEventListener("gestureend",i.onGestureEnd),i.currentDoc.removeEventListener("scroll",i.onScroll))},i.clearScrollEvent=function(){i.containerRef&&i.containerRef.removeEventListener("wheel",i.onWheel),i.wheelTimer&&clearTimeout(i.wheelTimer)},i.onMediaLoad=function(){var o=i.computeSizes();o&&(i.previousCropSize=o,i.emitCropData(),i.setInitialCrop(o),i.isInitialized=!0),i.props.onMediaLoaded&&i.props.onMediaLoaded(i.mediaSize)},i.setInitialCrop=function(o){if(i.props.initialCroppedAreaPercentages){var c=O1(i.props.initialCroppedAreaPercentages,i.mediaSize,i.props.rotation,o,i.props.minZoom,i.props.maxZoom),d=c.crop,h=c.zoom;i.props.onCropChange(d),i.props.onZoomChange&&i.props.onZoomChange(h)}else if(i.props.initialCroppedAreaPixels){var v=M1(i.props.initialCroppedAreaPixels,i.mediaSize,i.props.rotation,o,i.props.minZoom,i.props.maxZoom),d=v.crop,h=v.zoom;i.props.onCropChange(d),i.props.onZoomChange&&i.props.onZoomChange(h)}},i.computeSizes=function(){var o,c,d,h,v,y,p=i.imageRef.current||i.videoRef.current;if(p&&i.containerRef){i.containerRect=i.containerRef.getBoundingClientRect(),i.saveContainerPosition();var S=i.containerRect.width/i.containerRect.height,b=((o=i.imageRef.current)===null||o===void 0?void 0:o.naturalWidth)||((c=i.videoRef.current)===null||c===void 0?void 0:c.videoWidth)||0,R=((d=i.imageRef.current)===null||d===void 0?void 0:d.naturalHeight)||((h=i.videoRef.current)===null||h===void 0?void 0:h.videoHeight)||0,M=p.offsetWidth<b||p.offsetHeight<R,T=b/R,D=void 0;if(M)switch(i.state.mediaObjectFit){default:case"contain":D=S>T?{width:i.containerRect.height*T,height:i.containerRect.height}:{width:i.containerRect.width,height:i.containerRect.width/T};break;case"horizontal-cover":D={width:i.containerRect.width,height:i.containerRect.width/T};break;case"vertical-cover":D={width:i.containerRect.height*T,height:i.containerRect.height};break}else D={width:p.offsetWidth,height:p.offsetHeight};i.mediaSize=Ie(Ie({},D),{naturalWidth:b,naturalHeight:R}),i.props.setMediaSize&&i.props.setMediaSize(i.mediaSize);var j=i.props.cropSize?i.props.cropSize:j1(i.mediaSize.width,i.mediaSize.height,i.containerRect.width,i.containerRect.height,i.props.aspect,i.props.rotation);return(((v=i.state.cropSize)===null||v===void 0?void 0:v.height)!==j.height||((y=i.state.cropSize)===null||y===void 0?void 0:y.width)!==j.width)&&i.props.onCropSizeChange&&i.props.onCropSizeChange(j),i.setState({cropSize:j},i.recomputeCropPosition),i.props.setCropSize&&i.props.setCropSize(j),j}},i.saveContainerPosition=function(){if(i.containerRef){var o=i.containerRef.getBoundingClientRect();i.containerPosition={x:o.left,y:o.top}}},i.onMouseDown=function(o){i.currentDoc&&(o.preventDefault(),i.currentDoc.addEventListener("mousemove",i.onMouseMove),i.currentDoc.addEventListener("mouseup",i.onDragStopped),i.saveContainerPosition(),i.onDragStart(r.getMousePoint(o)))},i.onMouseMove=function(o){return i.onDrag(r.getMousePoint(o))},i.onScroll=function(o){i.currentDoc&&(o.preventDefault(),i.saveContainerPosition())},i.onTouchStart=function(o){i.currentDoc&&(i.isTouching=!0,!(i.props.onTouchRequest&&!i.props.onTouchRequest(o))&&(i.currentDoc.addEventListener("touchmove",i.onTouchMove,{passive:!1}),i.currentDoc.addEventListener("touchend",i.onDragStopped),i.saveContainerPosition(),o.touches.length===2?i.onPinchStart(o):o.touches.length===1&&i.onDragStart(r.getTouchPoint(o.touches[0]))))},i.onTouchMove=function(o){o.preventDefault(),o.touches.length===2?i.onPinchMove(o):o.touches.length===1&&i.onDrag(r.getTouchPoint(o.touches[0]))},i.onGestureStart=function(o){i.currentDoc&&(o.preventDefault(),i.currentDoc.addEventListener("gesturechange",i.onGestureChange),i.currentDoc.addEventListener("gestureend",i.onGestureEnd),i.gestureZoomStart=i.props.zoom,i.gestureRotationStart=i.props.rotation)},i.onGestureChange=function(o){if(o.preventDefault(),!i.isTouching){var c=r.getMousePoint(o),d=i.gestureZoomStart-1+o.scale;if(i.setNewZoom(d,c,{shouldUpdatePosition:!0}),i.props.onRotationChange){var h=i.gestureRotationStart+o.rotation;i.props.onRotationChange(h)}}},i.onGestureEnd=function(o){i.cleanEvents()},i.onDragStart=function(o){var c,d,h=o.x,v=o.y;i.dragStartPosition={x:h,y:v},i.dragStartCrop=Ie({},i.props.crop),(d=(c=i.props).onInteractionStart)===null||d===void 0||d.call(c)},i.onDrag=function(o){var c=o.x,d=o.y;i.currentWindow&&(i.rafDragTimeout&&i.currentWindow.cancelAnimationFrame(i.rafDragTimeout),i.rafDragTimeout=i.currentWindow.requestAnimationFrame(function(){if(i.state.cropSize&&!(c===void 0||d===void 0)){var h=c-i.dragStartPosition.x,v=d-i.dragStartPosition.y,y={x:i.dragStartCrop.x+h,y:i.dragStartCrop.y+v},p=i.props.restrictPosition?li(y,i.mediaSize,i.state.cropSize,i.props.zoom,i.props.rotation):y;i.props.onCropChange(p)}}))},i.onDragStopped=function(){var o,c;i.isTouching=!1,i.cleanEvents(),i.emitCropData(),(c=(o=i.props).onInteractionEnd)===null||c===void 0||c.call(o)},i.onWheel=function(o){if(i.currentWindow&&!(i.props.onWheelRequest&&!i.props.onWheelRequest(o))){o.preventDefault();var c=r.getMousePoint(o),d=A1(o).pixelY,h=i.props.zoom-d*i.props.zoomSpeed/200;i.setNewZoom(h,c,{shouldUpdatePosition:!0}),i.state.hasWheelJustStarted||i.setState({hasWheelJustStarted:!0},function(){var v,y;return(y=(v=i.props).onInteractionStart)===null||y===void 0?void 0:y.call(v)}),i.wheelTimer&&clearTimeout(i.wheelTimer),i.wheelTimer=i.currentWindow.setTimeout(function(){return i.setState({hasWheelJustStarted:!1},function(){var v,y;return(y=(v=i.props).onInteractionEnd)===null||y===void 0?void 0:y.call(v)})},250)}},i.getPointOnContainer=function(o,c){var d=o.x,h=o.y;if(!i.containerRect)throw new Error("The Cropper is not mounted");return{x:i.containerRect.width/2-(d-c.x),y:i.containerRect.height/2-(h-c.y)}},i.getPointOnMedia=function(o){var c=o.x,d=o.y,h=i.props,v=h.crop,y=h.zoom;return{x:(c+v.x)/y,y:(d+v.y)/y}},i.setNewZoom=function(o,c,d){var h=d===void 0?{}:d,v=h.shouldUpdatePosition,y=v===void 0?!0:v;if(!(!i.state.cropSize||!i.props.onZoomChange)){var p=$u(o,i.props.minZoom,i.props.maxZoom);if(y){var S=i.getPointOnContainer(c,i.containerPosition),b=i.getPointOnMedia(S),R={x:b.x*p-S.x,y:b.y*p-S.y},M=i.props.restrictPosition?li(R,i.mediaSize,i.state.cropSize,p,i.props.rotation):R;i.props.onCropChange(M)}i.props.onZoomChange(p)}},i.getCropData=function(){if(!i.state.cropSize)return null;var o=i.props.restrictPosition?li(i.props.crop,i.mediaSize,i.state.cropSize,i.props.zoom,i.props.rotation):i.props.crop;return N1(o,i.mediaSize,i.state.cropSize,i.getAspect(),i.props.zoom,i.props.rotation,i.props.restrictPosition)},i.emitCropData=function(){var o=i.getCropData();if(o){var c=o.croppedAreaPercentages,d=o.croppedAreaPixels;i.props.onCropComplete&&i.props.onCropComplete(c,d),i.props.onCropAreaChange&&i.props.onCropAreaChange(c,d)}},i.emitCropAreaChange=function(){var o=i.getCropData();if(o){var c=o.croppedAreaPercentages,d=o.croppedAreaPixels;i.props.onCropAreaChange&&i.props.onCropAreaChange(c,d)}},i.recomputeCropPosition=function(){var o,c;if(i.state.cropSize){var d=i.props.crop;if(i.isInitialized&&(!((o=i.previousCropSize)===null||o===void 0)&&o.width)&&(!((c=i.previousCropSize)===null||c===void 0)&&c.height)){var h=Math.abs(i.previousCropSize.width-i.state.cropSize.width)>1e-6||Math.abs(i.previousCropSize.height-i.state.cropSize.height)>1e-6;if(h){var v=i.state.cropSize.width/i.previousCropSize.width,y=i.state.cropSize.height/i.previousCropSize.height;d={x:i.props.crop.x*v,y:i.props.crop.y*y}}}var p=i.props.restrictPosition?li(d,i.mediaSize,i.state.cropSize,i.props.zoom,i.props.rotation):d;i.previousCropSize=i.state.cropSize,i.props.onCropChange(p),i.emitCropData()}},i.onKeyDown=function(o){var c,d,h=i.props,v=h.crop,y=h.onCropChange,p=h.keyboardStep,S=h.zoom,b=h.rotation,R=p;if(i.state.cropSize){o.shiftKey&&(R*=.2);var M=Ie({},v);switch(o.key){case"ArrowUp":M.y-=R,o.preventDefault();break;case"ArrowDown":M.y+=R,o.preventDefault();break;case"ArrowLeft":M.x-=R,o.preventDefault();break;case"ArrowRight":M.x+=R,o.preventDefault();break;default:return}i.props.restrictPosition&&(M=li(M,i.mediaSize,i.state.cropSize,S,b)),o.repeat||(d=(c=i.props).onInteractionStart)===null||d===void 0||d.call(c),y(M)}},i.onKeyUp=function(o){var c,d;switch(o.key){case"ArrowUp":case"ArrowDown":case"ArrowLeft":case"ArrowRight":o.preventDefault();break;default:return}i.emitCropData(),(d=(c=i.props).onInteractionEnd)===null||d===void 0||d.call(c)},i}return r.prototype.componentDidMount=function(){!this.currentDoc||!this.currentWindow||(this.containerRef&&(this.containerRef.ownerDocument&&(this.currentDoc=this.containerRef.ownerDocument),this.currentDoc.defaultView&&(this.currentWindow=this.currentDoc.defaultView),this.initResizeObserver(),typeof window.ResizeObserver>"u"&&this.currentWindow.addEventListener("resize",this.computeSizes),this.props.zoomWithScroll&&this.containerRef.addEventListener("wheel",this.onWheel,{passive:!1}),this.containerRef.addEventListener("gesturestart",this.onGestureStart)),this.currentDoc.addEventListener("scroll",this.onScroll),this.props.disableAutomaticStylesInjection||(this.styleRef=this.currentDoc.createElement("style"),this.styleRef.setAttribute("type","text/css"),this.props.nonce&&this.styleRef.setAttribute("nonce",this.props.nonce),this.styleRef.innerHTML=H1,this.currentDoc.head.appendChild(this.styleRef)),this.imageRef.current&&this.imageRef.current.complete&&this.onMediaLoad(),this.props.setImageRef&&this.props.setImageRef(this.imageRef),this.props.setVideoRef&&this.props.setVideoRef(this.videoRef),this.props.setCropperRef&&this.props.setCropperRef(this.cropperRef))},r.prototype.componentWillUnmount=function(){var i,o;!this.currentDoc||!this.currentWindow||(typeof window.ResizeObserver>"u"&&this.currentWindow.removeEventListener("resize",this.computeSizes),(i=this.resizeObserver)===null||i===void 0||i.disconnect(),this.containerRef&&this.containerRef.removeEventListener("gesturestart",this.preventZoomSafari),this.styleRef&&((o=this.styleRef.parentNode)===null||o===void 0||o.removeChild(this.styleRef)),this.cleanEvents(),this.props.zoomWithScroll&&this.clearScrollEvent())},r.prototype.componentDidUpdate=function(i){var o,c,d,h,v,y,p,S,b;i.rotation!==this.props.rotation?(this.computeSizes(),this.recomputeCropPosition()):i.aspect!==this.props.aspect?this.computeSizes():i.objectFit!==this.props.objectFit?this.computeSizes():i.zoom!==this.props.zoom?this.recomputeCropPosition():((o=i.cropSize)===null||o===void 0?void 0:o.height)!==((c=this.props.cropSize)===null||c===void 0?void 0:c.height)||((d=i.cropSize)===null||d===void 0?void 0:d.width)!==((h=this.props.cropSize)===null||h===void 0?void 0:h.width)?this.computeSizes():(((v=i.crop)===null||v===void 0?void 0:v.x)!==((y=this.props.crop)===null||y===void 0?void 0:y.x)||((p=i.crop)===null||p===void 0?void 0:p.y)!==((S=this.props.crop)===null||S===void 0?void 0:S.y))&&this.emitCropAreaChange(),i.zoomWithScroll!==this.props.zoomWithScroll&&this.containerRef&&(this.props.zoomWithScroll?this.containerRef.addEventListener("wheel",this.onWheel,{passive:!1}):this.clearScrollEvent()),i.video!==this.props.video&&((b=this.videoRef.current)===null||b===void 0||b.load());var R=this.getObjectFit();R!==this.state.mediaObjectFit&&this.setState({mediaObjectFit:R},this.computeSizes)},r.prototype.getAspect=function(){var i=this.props,o=i.cropSize,c=i.aspect;return o?o.width/o.height:c},r.prototype.getObjectFit=function(){var i,o,c,d;if(this.props.objectFit==="cover"){var h=this.imageRef.current||this.videoRef.current;if(h&&this.containerRef){this.containerRect=this.containerRef.getBoundingClientRect();var v=this.containerRect.width/this.containerRect.height,y=((i=this.imageRef.current)===null||i===void 0?void 0:i.naturalWidth)||((o=this.videoRef.current)===null||o===void 0?void 0:o.videoWidth)||0,p=((c=this.imageRef.current)===null||c===void 0?void 0:c.naturalHeight)||((d=this.videoRef.current)===null||d===void 0?void 0:d.videoHeight)||0,S=y/p;return S<v?"horizontal-cover":"vertical-cover"}return"horizontal-cover"}return this.props.objectFit},r.prototype.onPinchStart=function(i){var o=r.getTouchPoint(i.touches[0]),c=r.getTouchPoint(i.touches[1]);this.lastPinchDistance=Gm(o,c),this.lastPinchRotation=Xm(o,c),this.onDragStart(Zm(o,c))},r.prototype.onPinchMove=function(i){var o=this;if(!(!this.currentDoc||!this.currentWindow)){var c=r.getTouchPoint(i.touches[0]),d=r.getTouchPoint(i.touches[1]),h=Zm(c,d);this.onDrag(h),this.rafPinchTimeout&&this.currentWindow.cancelAnimationFrame(this.rafPinchTimeout),this.rafPinchTimeout=this.currentWindow.requestAnimationFrame(function(){var v=Gm(c,d),y=o.props.zoom*(v/o.lastPinchDistance);o.setNewZoom(y,h,{shouldUpdatePosition:!1}),o.lastPinchDistance=v;var p=Xm(c,d),S=o.props.rotation+(p-o.lastPinchRotation);o.props.onRotationChange&&o.props.onRotationChange(S),o.lastPinchRotation=p})}},r.prototype.render=function(){var i=this,o,c=this.props,d=c.image,h=c.video,v=c.mediaProps,y=c.cropperProps,p=c.transform,S=c.crop,b=S.x,R=S.y,M=c.rotation,T=c.zoom,D=c.cropShape,j=c.showGrid,L=c.roundCropAreaPixels,Z=c.style,Q=Z.containerStyle,P=Z.cropAreaStyle,ee=Z.mediaStyle,ae=c.classes,V=ae.containerClassName,oe=ae.cropAreaClassName,J=ae.mediaClassName,le=(o=this.state.mediaObjectFit)!==null&&o!==void 0?o:this.getObjectFit();return A.createElement("div",{onMouseDown:this.onMouseDown,onTouchStart:this.onTouchStart,ref:function(ge){return i.containerRef=ge},"data-testid":"container",style:Q,className:Ou("reactEasyCrop_Container",V)},d?A.createElement("img",Ie({alt:"",className:Ou("reactEasyCrop_Image",le==="contain"&&"reactEasyCrop_Contain",le==="horizontal-cover"&&"reactEasyCrop_Cover_Horizontal",le==="vertical-cover"&&"reactEasyCrop_Cover_Vertical",J)},v,{src:d,ref:this.imageRef,style:Ie(Ie({},ee),{transform:p||"translate(".concat(b,"px, ").concat(R,"px) rotate(").concat(M,"deg) scale(").concat(T,")")}),onLoad:this.onMediaLoad})):h&&A.createElement("video",Ie({autoPlay:!0,playsInline:!0,loop:!0,muted:!0,className:Ou("reactEasyCrop_Video",le==="contain"&&"reactEasyCrop_Contain",le==="horizontal-cover"&&"reactEasyCrop_Cover_Horizontal",le==="vertical-cover"&&"reactEasyCrop_Cover_Vertical",J)},v,{ref:this.videoRef,onLoadedMetadata:this.onMediaLoad,style:Ie(Ie({},ee),{transform:p||"translate(".concat(b,"px, ").concat(R,"px) rotate(").concat(M,"deg) scale(").concat(T,")")}),controls:!1}),(Array.isArray(h)?h:[{src:h}]).map(function(me){return A.createElement("source",Ie({key:me.src},me))})),this.state.cropSize&&A.createElement("div",Ie({ref:this.cropperRef,style:Ie(Ie({},P),{width:L?Math.round(this.state.cropSize.width):this.state.cropSize.width,height:L?Math.round(this.state.cropSize.height):this.state.cropSize.height}),tabIndex:0,onKeyDown:this.onKeyDown,onKeyUp:this.onKeyUp,"data-testid":"cropper",className:Ou("reactEasyCrop_CropArea",D==="round"&&"reactEasyCrop_CropAreaRound",j&&"reactEasyCrop_CropAreaGrid",oe)},y)))},r.defaultProps={zoom:1,rotation:0,aspect:4/3,maxZoom:L1,minZoom:B1,cropShape:"rect",objectFit:"contain",showGrid:!0,style:{},classes:{},mediaProps:{},cropperProps:{},zoomSpeed:1,restrictPosition:!0,zoomWithScroll:!0,keyboardStep:q1},r.getMousePoint=function(i){return{x:Number(i.clientX),y:Number(i.clientY)}},r.getTouchPoint=function(i){return{x:Number(i.clientX),y:Number(i.clientY)}},r})(A.Component);const G1=l=>new Promise((r,i)=>{const o=new Image;o.addEventListener("load",()=>r(o)),o.addEventListener("error",c=>i(c)),o.setAttribute("crossOrigin","anonymous"),o.src=l});function Np(l){return l*Math.PI/180}function X1(l,r,i){const o=Np(i);return{width:Math.abs(Math.cos(o)*l)+Math.abs(Math.sin(o)*r),height:Math.abs(Math.sin(o)*l)+Math.abs(Math.cos(o)*r)}}async function Z1(l,r,i=0,o={horizontal:!1,vertical:!1}){const c=await G1(l),d=document.createElement("canvas"),h=d.getContext("2d");if(!h)return null;const v=Np(i),{width:y,height:p}=X1(c.width,c.height,i);d.width=y,d.height=p,h.translate(y/2,p/2),h.rotate(v),h.scale(o.horizontal?-1:1,o.vertical?-1:1),h.translate(-c.width/2,-c.height/2),h.drawImage(c,0,0);const S=h.getImageData(r.x,r.y,r.width,r.height);return d.width=r.width,d.height=r.height,h.putImageData(S,0,0),new Promise(b=>{d.toBlob(R=>{b(R)},"image/jpeg",.9)})}const zp=({onImageUploaded:l})=>{const[r,i]=A.useState(null),[o,c]=A.useState({x:0,y:0}),[d,h]=A.useState(1),[v,y]=A.useState(null),[p,S]=A.useState(!1),[b,R]=A.useState(!1),M=A.useRef(null),T=async V=>{if(V&&V.type.startsWith("image/")){const oe=await Q(V);i(oe)}else alert("请上传图片文件")},D=V=>{V.target.files&&V.target.files.length>0&&T(V.target.files[0])},j=V=>{V.preventDefault(),V.stopPropagation(),V.type==="dragenter"||V.type==="dragover"?R(!0):V.type==="dragleave"&&R(!1)},L=V=>{V.preventDefault(),V.stopPropagation(),R(!1),V.dataTransfer.files&&V.dataTransfer.files[0]&&T(V.dataTransfer.files[0])},Z=()=>{M.current?.click()},Q=V=>new Promise(oe=>{const J=new FileReader;J.addEventListener("load",()=>oe(J.result),!1),J.readAsDataURL(V)}),P=A.useCallback((V,oe)=>{y(oe)},[]),ee=async()=>{if(!(!r||!v)){S(!0);try{const V=await Z1(r,v);if(!V)return;const oe=new FormData;oe.append("file",V,"item-image.jpg");const le=(await Ce.post("/upload",oe,{headers:{"Content-Type":"multipart/form-data"}})).data.path;l(le),i(null)}catch(V){console.error(V),alert("图片上传失败")}finally{S(!1)}}},ae=()=>{i(null),h(1)};return m.jsx("div",{className:"image-uploader-container",children:r?m.jsxs("div",{className:"cropper-wrapper",children:[m.jsx("div",{className:"cropper-area",children:m.jsx(Y1,{image:r,crop:o,zoom:d,aspect:4/3,onCropChange:c,onCropComplete:P,onZoomChange:h})}),m.jsxs("div",{className:"cropper-controls",children:[m.jsxs("div",{className:"zoom-slider",children:[m.jsx("label",{children:"缩放:"}),m.jsx("input",{type:"range",value:d,min:1,max:3,step:.1,onChange:V=>h(Number(V.target.value))})]}),m.jsxs("div",{className:"cropper-buttons",children:[m.jsx("button",{type:"button",onClick:ae,disabled:p,className:"btn-secondary",children:"取消"}),m.jsx("button",{type:"button",onClick:ee,disabled:p,className:"btn-primary",children:p?"上传中...":"确认裁剪并上传"})]})]})]}):m.jsxs("div",{className:`upload-drop-zone ${b?"active":""}`,onDragEnter:j,onDragLeave:j,onDragOver:j,onDrop:L,onClick:Z,children:[m.jsx("input",{ref:M,type:"file",accept:"image/*",onChange:D,className:"hidden-input"}),m.jsx("div",{className:"upload-icon",children:m.jsxs("svg",{viewBox:"0 0 24 24",width:"48",height:"48",fill:"none",stroke:"currentColor",strokeWidth:"1.5",strokeLinecap:"round",strokeLinejoin:"round",children:[m.jsx("rect",{x:"3",y:"3",width:"18",height:"18",rx:"2",ry:"2"}),m.jsx("circle",{cx:"8.5",cy:"8.5",r:"1.5"}),m.jsx("polyline",{points:"21 15 16 10 5 21"})]})}),m.jsx("p",{className:"upload-text",children:"点击或拖拽上传"}),m.jsx("span",{className:"upload-hint",children:"支持 JPG, PNG (自动裁剪 4:3)"})]})})},Q1=()=>{const l=gn.c(39),r=ma();let i;l[0]===Symbol.for("react.memo_cache_sentinel")?(i=[],l[0]=i):i=l[0];const[o,c]=A.useState(i),[d,h]=A.useState(null);let v;l[1]===Symbol.for("react.memo_cache_sentinel")?(v={name:"",description:"",address:"",phone:"",email:"",image_path:""},l[1]=v):v=l[1];const[y,p]=A.useState(v);let S;l[2]===Symbol.for("react.memo_cache_sentinel")?(S={},l[2]=S):S=l[2];const[b,R]=A.useState(S);let M,T;l[3]===Symbol.for("react.memo_cache_sentinel")?(M=()=>{Ce.get("/types").then(re=>c(re.data))},T=[],l[3]=M,l[4]=T):(M=l[3],T=l[4]),A.useEffect(M,T);let D;l[5]!==o?(D=re=>{const we=parseInt(re.target.value),H=o.find(k=>k.id===we)||null;h(H),R({})},l[5]=o,l[6]=D):D=l[6];const j=D;let L;l[7]!==b||l[8]!==y||l[9]!==r||l[10]!==d?(L=async re=>{if(re.preventDefault(),!!d)try{await Ce.post("/items",{type_id:d.id,...y,attributes:b}),alert("发布成功"),r("/")}catch(we){console.error(we),alert("发布失败")}},l[7]=b,l[8]=y,l[9]=r,l[10]=d,l[11]=L):L=l[11];const Z=L;let Q;l[12]===Symbol.for("react.memo_cache_sentinel")?(Q=m.jsx("h2",{children:"发布新物品"}),l[12]=Q):Q=l[12];let P;l[13]===Symbol.for("react.memo_cache_sentinel")?(P=m.jsxs("label",{children:["物品类型 ",m.jsx("span",{style:{color:"red"},children:"*"}),":"]}),l[13]=P):P=l[13];let ee;l[14]===Symbol.for("react.memo_cache_sentinel")?(ee=m.jsx("option",{value:"",children:"-- 请选择 --"}),l[14]=ee):ee=l[14];let ae;l[15]!==o?(ae=o.map(V1),l[15]=o,l[16]=ae):ae=l[16];let V;l[17]!==j||l[18]!==ae?(V=m.jsxs("div",{className:"form-group",children:[P,m.jsxs("select",{required:!0,onChange:j,defaultValue:"",children:[ee,ae]})]}),l[17]=j,l[18]=ae,l[19]=V):V=l[19];let oe;l[20]!==y||l[21]!==d?(oe=d&&m.jsxs(m.Fragment,{children:[m.jsxs("div",{className:"form-group",children:[m.jsxs("label",{children:["物品名称 ",m.jsx("span",{style:{color:"red"},children:"*"}),":"]}),m.jsx("input",{required:!0,type:"text",value:y.name,onChange:re=>p({...y,name:re.target.value})})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"描述:"}),m.jsx("textarea",{value:y.description,onChange:re=>p({...y,description:re.target.value})})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"地址:"}),m.jsx("input",{type:"text",value:y.address,onChange:re=>p({...y,address:re.target.value})})]})]}),l[20]=y,l[21]=d,l[22]=oe):oe=l[22];let J;l[23]!==V||l[24]!==oe?(J=m.jsxs("div",{className:"form-left",children:[V,oe]}),l[23]=V,l[24]=oe,l[25]=J):J=l[25];let le;l[26]!==b||l[27]!==d?(le=d&&m.jsxs("div",{className:"form-right",children:[m.jsxs("h4",{children:[d.name," 特有属性"]}),d.attributes.map(re=>m.jsxs("div",{className:"form-group",children:[m.jsxs("label",{children:[re.label,re.required&&m.jsx("span",{style:{color:"red"},children:" *"}),":"]}),re.type==="select"&&re.options?m.jsxs("select",{required:re.required,value:b[re.key]||"",onChange:we=>R(H=>({...H,[re.key]:we.target.value})),children:[m.jsx("option",{value:"",children:"-- 请选择 --"}),re.options.map(K1)]}):m.jsx("input",{type:re.type==="number"?"number":re.type==="date"?"date":"text",required:re.required,value:b[re.key]||"",onChange:we=>R(H=>({...H,[re.key]:we.target.value}))})]},re.key))]}),l[26]=b,l[27]=d,l[28]=le):le=l[28];let me;l[29]!==J||l[30]!==le?(me=m.jsxs("div",{className:"form-content",children:[J,le]}),l[29]=J,l[30]=le,l[31]=me):me=l[31];let ge;l[32]!==y||l[33]!==d?(ge=d&&m.jsxs(m.Fragment,{children:[m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"物品示意图:"}),m.jsxs("div",{className:`form-content image-upload-section ${y.image_path?"has-image":""}`,children:[m.jsx("div",{className:"form-left",style:{display:"flex",alignItems:"center"},children:m.jsx(zp,{onImageUploaded:re=>p({...y,image_path:re})})}),y.image_path&&m.jsx("div",{className:"form-right preview-wrapper",children:m.jsx("div",{className:"uploaded-preview-container",children:m.jsx("img",{src:`http://localhost:5000${y.image_path}`,alt:"已上传预览",className:"uploaded-preview-img"})})})]})]}),m.jsx("button",{type:"submit",children:"提交物品"})]}),l[32]=y,l[33]=d,l[34]=ge):ge=l[34];let Le;return l[35]!==Z||l[36]!==me||l[37]!==ge?(Le=m.jsx("div",{className:"page-container",children:m.jsxs("div",{className:"add-item-container",children:[Q,m.jsxs("form",{onSubmit:Z,className:"add-item-form",children:[me,ge]})]})}),l[35]=Z,l[36]=me,l[37]=ge,l[38]=Le):Le=l[38],Le};function V1(l){return m.jsx("option",{value:l.id,children:l.name},l.id)}function K1(l,r){return m.jsx("option",{value:l,children:l},r)}const Qm=()=>"attr_"+Math.random().toString(36).substr(2,9),J1=()=>{const{user:l,logout:r}=A.useContext(pa),[i,o]=A.useState([]),[c,d]=A.useState([]),[h,v]=A.useState(""),[y,p]=A.useState({name:"",attributes:[]}),[S,b]=A.useState({}),[R,M]=A.useState([]),[T,D]=A.useState(""),[j,L]=A.useState({name:"",attributes:[]}),[Z,Q]=A.useState({}),[P,ee]=A.useState(!0);A.useEffect(()=>{(async()=>{ee(!0);try{const[K,W,ce]=await Promise.all([Ce.get("/admin/users?status=pending"),Ce.get(`/admin/users?status=approved&keyword=${h}`),Ce.get("/types")]);o(K.data),d(W.data),M(ce.data)}catch(K){console.error("Failed to fetch data",K)}finally{ee(!1)}})()},[]);const ae=async(w="")=>{try{const K=`/admin/users?status=approved&keyword=${w}`,W=await Ce.get(K);d(W.data)}catch{console.error("Failed to fetch approved users")}},V=async()=>{try{const w=await Ce.get("/types");M(w.data)}catch{console.error("Failed to fetch types")}},oe=async(w,K)=>{await Ce.post(`/admin/approve/${w}`,{action:K});const[W,ce]=await Promise.all([Ce.get("/admin/users?status=pending"),Ce.get(`/admin/users?status=approved&keyword=${h}`)]);o(W.data),d(ce.data)},J=()=>{ae(h)},le=async(w,K)=>{if(window.confirm(`确定要永久删除用户 "${K}" 及其所有物品吗？`)){try{const W=await Ce.delete(`/admin/users/${w}`);await waitForJob(W.data.job_id),alert("用户已删除")}catch(W){alert("删除失败: "+(W.response?.data?.msg||W.message))}ae(h);const ce=await Ce.get("/admin/users?status=pending");o(ce.data)}},me=async(w,K)=>{if(window.confirm(`确定将用户 "${K}" 提升为管理员吗？`))try{await Ce.post(`/admin/promote/${w}`),alert(`${K} 已被提升为管理员`),ae(h)}catch{alert("操作失败")}},ge=async(w,K)=>{if(window.confirm(`确定将用户 "${K}" 降为普通用户吗？`))try{await Ce.post(`/admin/demote/${w}`),alert(`${K} 已降为普通用户`),ae(h)}catch{alert("操作失败")}},Le=()=>{p(w=>({...w,attributes:[...w.attributes,{key:Qm(),label:"",type:"text",required:!1}]}))},re=w=>{p(W=>({...W,attributes:W.attributes.filter((ce,Re)=>Re!==w)}));const K={...S};delete K[w],b(K)},we=(w,K,W)=>{const ce=[...y.attributes];ce[w]={...ce[w],[K]:W},p(Re=>({...Re,attributes:ce}))},H=(w,K)=>{b(Re=>({...Re,[w]:K}));const W=K.split(/[,，]/).map(Re=>Re.trim()).filter(Re=>Re!==""),ce=[...y.attributes];ce[w].options=W,p(Re=>({...Re,attributes:ce}))},k=async()=>{if(!y.name)return alert("请输入类型名称");try{await Ce.post("/types",{name:y.name,attributes:y.attributes}),alert("类型添加成功！"),p({name:"",attributes:[]}),b({}),V()}catch(w){alert("添加失败: "+(w.response?.data?.msg||w.message))}},ne=w=>{const K=parseInt(w);if(D(w),!w){L({name:"",attributes:[]}),Q({});return}const W=R.find(ce=>ce.id===K);if(W){const ce=W.attributes.map(Qt=>({...Qt}));L({name:W.name,attributes:ce});const Re={};ce.forEach((Qt,rl)=>{Qt.type==="select"&&Qt.options&&(Re[rl]=Qt.options.join(", "))}),Q(Re)}},Ee=()=>{L(w=>({...w,attributes:[...w.attributes,{key:Qm(),label:"",type:"text",required:!1}]}))},je=w=>{L(W=>({...W,attributes:W.attributes.filter((ce,Re)=>Re!==w)}));const K={...Z};delete K[w],Q(K)},E=(w,K,W)=>{const ce=[...j.attributes];ce[w]={...ce[w],[K]:W},L(Re=>({...Re,attributes:ce}))},Y=(w,K)=>{Q(Re=>({...Re,[w]:K}));const W=K.split(/[,，]/).map(Re=>Re.trim()).filter(Re=>Re!==""),ce=[...j.attributes];ce[w].options=W,L(Re=>({...Re,attributes:ce}))},$=async()=>{if(T){if(!j.name)return alert("类型名称不能为空");for(let w of j.attributes){if(!w.label||!w.key)return alert("所有属性必须包含 Label 和 Key");if(w.type==="select"&&(!w.options||w.options.length===0))return alert(`属性 "${w.label}" 需要至少一个选项`)}try{await Ce.put(`/types/${T}`,j),alert("类型更新成功"),D(""),L({name:"",attributes:[]}),Q({}),V()}catch(w){alert("更新失败: "+(w.response?.data?.msg||w.message))}}},F=async()=>{if(T&&window.confirm("确定删除该类型吗？这将可能影响属于该类型的所有物品！"))try{await Ce.delete(`/types/${T}`),alert("类型已删除"),D(""),L({name:"",attributes:[]}),V()}catch(w){alert("删除失败: "+(w.response?.data?.msg||w.message))}},se=async()=>{if(!window.confirm(`⚠️ 严重警告 ⚠️
 
 您确定要重置整个数据库吗？
 
@@ -171,4 +171,4 @@ Please change the parent <Route path="${Z}"> to <Route path="${Z==="/"?"*":`${Z}
 1. 删除所有用户（除 admin 外）
 2. 删除所有发布的物品
 3. 删除所有自定义类型
-4. 操作不可逆！`))return;if(window.prompt("为了确认您的操作，请在下方输入 'RESET' (大写)：")!=="RESET"){alert("操作已取消：输入不匹配");return}try{ee(!0),await Ce.post("/admin/reset-db"),alert("数据库重置成功！系统将退出登录，请使用初始密码重新登录。"),r()}catch(W){console.error(W),alert("重置失败: "+(W.response?.data?.msg||W.message)),ee(!1)}};return P?m.jsx(di,{}):m.jsxs("div",{className:"page-container",children:[m.jsx("h2",{children:"管理员后台"}),m.jsxs("div",{className:"admin-section",children:[m.jsx("h3",{children:"待审核用户"}),i.length===0?m.jsx("p",{className:"empty-text",children:"当前无待审核用户"}):m.jsxs("table",{className:"admin-table",children:[m.jsx("thead",{children:m.jsxs("tr",{children:[m.jsx("th",{children:"ID"}),m.jsx("th",{children:"用户名"}),m.jsx("th",{children:"邮箱"}),m.jsx("th",{children:"电话"}),m.jsx("th",{children:"地址"}),m.jsx("th",{children:"操作"})]})}),m.jsx("tbody",{children:i.map(w=>m.jsxs("tr",{children:[m.jsxs("td",{children:["#",w.id]}),m.jsx("td",{children:w.username}),m.jsx("td",{children:w.email}),m.jsx("td",{children:w.phone||"-"}),m.jsx("td",{children:w.address||"-"}),m.jsxs("td",{children:[m.jsx("button",{onClick:()=>oe(w.id,"approve"),className:"btn-text approve",children:"通过"}),m.jsx("button",{onClick:()=>oe(w.id,"reject"),className:"btn-text reject",children:"拒绝"})]})]},w.id))})]})]}),m.jsxs("div",{className:"partition",children:[m.jsx("h3",{children:"用户管理 (已通过)"}),m.jsxs("div",{className:"filter-bar",children:[m.jsx("input",{type:"text",placeholder:"搜索用户名、邮箱或电话...",value:h,onChange:w=>v(w.target.value),className:"control-input flex-grow"}),m.jsx("button",{onClick:J,className:"btn-action btn-primary",children:"搜索"}),m.jsx("button",{onClick:()=>{v(""),ae("")},className:"btn-action btn-secondary",children:"重置"})]}),m.jsxs("table",{className:"admin-table",children:[m.jsx("thead",{children:m.jsxs("tr",{children:[m.jsx("th",{children:"ID"}),m.jsx("th",{children:"用户名"}),m.jsx("th",{children:"角色"}),m.jsx("th",{children:"邮箱"}),m.jsx("th",{children:"电话"}),m.jsx("th",{children:"地址"}),m.jsx("th",{children:"删除"}),m.jsx("th",{children:"权限"})]})}),m.jsx("tbody",{children:c.map(w=>m.jsxs("tr",{children:[m.jsxs("td",{children:["#",w.id]}),m.jsx("td",{children:m.jsx("strong",{children:w.username})}),m.jsx("td",{children:m.jsx("span",{className:`role-badge ${w.role==="admin"?"admin":"user"}`,children:w.role==="admin"?"管理员":"用户"})}),m.jsx("td",{children:w.email}),m.jsx("td",{children:w.phone||"-"}),m.jsx("td",{children:w.address||"-"}),m.jsx("td",{children:w.username!=="admin"&&w.username!==l?.username?m.jsx("button",{onClick:()=>le(w.id,w.username),className:"btn-sm btn-delete",children:"删除"}):"-"}),m.jsxs("td",{children:[w.role==="user"&&m.jsx("button",{onClick:()=>me(w.id,w.username),className:"btn-sm btn-promote",children:"提权"}),w.role==="admin"&&w.username!=="admin"&&w.username!==l?.username&&m.jsx("button",{onClick:()=>ge(w.id,w.username),className:"btn-sm btn-demote",children:"降权"}),(w.username==="admin"||w.username===l?.username)&&m.jsx("div",{children:"-"})]})]},w.id))})]})]}),m.jsxs("div",{className:"partition",children:[m.jsx("h3",{children:"添加物品类型 (Create New Type)"}),m.jsxs("div",{style:{marginBottom:"15px"},children:[m.jsx("label",{className:"input-label",children:"类型名称:"}),m.jsx("input",{placeholder:"例如: 电子产品",value:y.name,onChange:w=>p({...y,name:w.target.value}),className:"control-input",style:{width:"100%",maxWidth:"400px"}})]}),m.jsxs("div",{className:"attributes-editor",children:[m.jsx("h4",{children:"属性定义"}),y.attributes.map((w,K)=>m.jsxs("div",{className:"attribute-row",children:[m.jsxs("div",{className:"attr-inputs",children:[m.jsx("input",{placeholder:"名称 (如: 颜色)",value:w.label,onChange:W=>we(K,"label",W.target.value),className:"control-input attr-field"}),m.jsx("input",{placeholder:"Key",value:w.key,onChange:W=>we(K,"key",W.target.value),className:"control-input attr-field",style:{backgroundColor:"#f5f5f5",color:"#666"},title:"自动生成的唯一标识"}),m.jsxs("select",{value:w.type,onChange:W=>we(K,"type",W.target.value),className:"control-input attr-field",children:[m.jsx("option",{value:"text",children:"文本"}),m.jsx("option",{value:"number",children:"数字"}),m.jsx("option",{value:"date",children:"日期"}),m.jsx("option",{value:"select",children:"下拉选项"})]}),m.jsxs("label",{className:"checkbox-label",children:[m.jsx("input",{type:"checkbox",checked:w.required||!1,onChange:W=>we(K,"required",W.target.checked)})," 必填"]}),m.jsx("button",{onClick:()=>re(K),className:"btn-sm btn-delete",children:"×"})]}),w.type==="select"&&m.jsx("div",{className:"options-row",children:m.jsx("input",{placeholder:"选项，逗号分隔",value:S[K]||"",onChange:W=>H(K,W.target.value),className:"control-input full-width"})})]},K)),m.jsxs("div",{className:"action-row",style:{marginTop:"10px"},children:[m.jsx("button",{onClick:Le,className:"btn-action btn-secondary",children:"+ 添加属性"}),m.jsx("button",{onClick:k,className:"btn-action btn-primary",style:{marginLeft:"10px"},children:"保存新类型"})]})]})]}),m.jsxs("div",{className:"partition",style:{marginTop:"30px",borderTop:"2px dashed #eee",paddingTop:"20px"},children:[m.jsx("h3",{children:"管理已有物品类型 (Manage Existing Types)"}),m.jsxs("div",{style:{marginBottom:"20px"},children:[m.jsx("label",{className:"input-label",children:"选择要编辑的类型:"}),m.jsxs("select",{className:"control-input",style:{width:"100%",maxWidth:"400px"},value:T,onChange:w=>ne(w.target.value),children:[m.jsx("option",{value:"",children:"-- 请选择 --"}),R.map(w=>m.jsxs("option",{value:w.id,children:[w.name," (ID: ",w.id,")"]},w.id))]})]}),T&&m.jsxs("div",{className:"attributes-editor edit-mode-box",children:[m.jsxs("div",{style:{marginBottom:"15px"},children:[m.jsx("label",{className:"input-label",children:"修改名称:"}),m.jsx("input",{value:j.name,onChange:w=>L({...j,name:w.target.value}),className:"control-input",style:{width:"100%",maxWidth:"400px"}})]}),m.jsx("h4",{children:"属性配置"}),j.attributes.map((w,K)=>m.jsxs("div",{className:"attribute-row",children:[m.jsxs("div",{className:"attr-inputs",children:[m.jsx("input",{placeholder:"名称 (如: 颜色)",value:w.label,onChange:W=>E(K,"label",W.target.value),className:"control-input attr-field"}),m.jsx("input",{placeholder:"Key",value:w.key,onChange:W=>we(K,"key",W.target.value),className:"control-input attr-field",style:{backgroundColor:"#f5f5f5",color:"#666"},title:"自动生成的唯一标识"}),m.jsxs("select",{value:w.type,onChange:W=>E(K,"type",W.target.value),className:"control-input attr-field",children:[m.jsx("option",{value:"text",children:"文本"}),m.jsx("option",{value:"number",children:"数字"}),m.jsx("option",{value:"date",children:"日期"}),m.jsx("option",{value:"select",children:"下拉选项"})]}),m.jsxs("label",{className:"checkbox-label",children:[m.jsx("input",{type:"checkbox",checked:w.required||!1,onChange:W=>E(K,"required",W.target.checked)})," 必填"]}),m.jsx("button",{onClick:()=>je(K),className:"btn-sm btn-delete",children:"×"})]}),w.type==="select"&&m.jsxs("div",{className:"options-row",children:[m.jsx("input",{placeholder:"选项，逗号分隔 (例如: A, B, C)",value:Z[K]||"",onChange:W=>Y(K,W.target.value),className:"control-input full-width"}),m.jsxs("small",{className:"hint-text",children:["当前解析: ",w.options?.join(" / ")]})]})]},K)),m.jsxs("div",{className:"action-row",style:{marginTop:"20px",display:"flex",gap:"10px"},children:[m.jsx("button",{onClick:Ee,className:"btn-action btn-secondary",children:"+ 增加属性"}),m.jsx("button",{onClick:$,className:"btn-action btn-primary",children:"保存修改"}),m.jsx("div",{style:{flexGrow:1}}),m.jsx("button",{onClick:F,className:"btn-action btn-delete",style:{backgroundColor:"#e74c3c",color:"white"},children:"删除该类型"})]})]})]}),l?.username==="admin"&&m.jsxs("div",{className:"partition danger-zone",children:[m.jsx("h3",{className:"danger-title",children:"⚠️ 危险区域 (DANGER ZONE)"}),m.jsxs("div",{className:"danger-content",children:[m.jsxs("p",{className:"danger-text",children:[m.jsx("strong",{children:"重置数据库："}),"此操作将清除所有数据（用户、物品、图片记录），并将系统恢复到刚安装时的初始状态。 只有超级管理员 ",m.jsx("code",{children:"admin"})," 拥有此权限。"]}),m.jsx("button",{onClick:se,className:"btn-danger-reset",children:"重置数据库 (Reset Database)"})]})]})]})},k1=()=>{const{id:l}=Qg(),r=ma(),[i,o]=A.useState(!0),[c,d]=A.useState(null),[h,v]=A.useState({name:"",description:"",address:"",phone:"",email:"",status:"available",image_path:""}),[y,p]=A.useState({});A.useEffect(()=>{(async()=>{try{const[R,M]=await Promise.all([Ce.get("/types"),Ce.get("/items")]),T=M.data.find(L=>L.id===Number(l));if(!T){alert("物品不存在"),r("/");return}v({name:T.name,description:T.description,address:T.address,phone:"",email:"",status:T.status,image_path:T.image_path||""}),p(T.attributes);const D=T.type_name,j=R.data.find(L=>L.name===D);j&&d(j)}catch(R){console.error(R),alert("加载失败")}finally{o(!1)}})()},[l,r]);const S=async b=>{if(b.preventDefault(),c){for(const R of c.attributes)if(R.required&&(!y[R.key]||y[R.key].trim()==="")){alert(`请填写必填项: ${R.label}`);return}}try{await Ce.put(`/items/${l}`,{...h,attributes:y}),alert("修改成功"),r("/")}catch{alert("修改失败")}};return i?m.jsx(di,{}):m.jsx("div",{className:"page-container-narrow",children:m.jsxs("div",{className:"edit-item-container",children:[m.jsx("h2",{children:"编辑物品 / 更新状态"}),m.jsxs("form",{onSubmit:S,children:[m.jsxs("div",{className:"form-group edit-image-section",children:[m.jsx("label",{children:"物品示意图:"}),m.jsx("div",{className:"upload-wrapper",children:m.jsx(zp,{onImageUploaded:b=>v({...h,image_path:b})})}),h.image_path&&m.jsx("div",{className:"preview-wrapper-vertical",children:m.jsx("div",{className:"uploaded-preview-container",children:m.jsx("img",{src:`http://localhost:5000${h.image_path}`,alt:"当前物品预览",className:"uploaded-preview-img"})})})]}),m.jsxs("div",{className:"form-group",children:[m.jsxs("label",{children:["物品名称 ",m.jsx("span",{style:{color:"red"},children:"*"}),":"]}),m.jsx("input",{required:!0,type:"text",value:h.name,onChange:b=>v({...h,name:b.target.value})})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"状态 (点击切换):"}),m.jsxs("div",{className:"status-toggle-container",children:[m.jsx("button",{type:"button",className:`status-btn available ${h.status==="available"?"active":""}`,onClick:()=>v({...h,status:"available"}),children:"🟢 待领取"}),m.jsx("button",{type:"button",className:`status-btn taken ${h.status==="taken"?"active":""}`,onClick:()=>v({...h,status:"taken"}),children:"🔴 已领走"})]})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"描述:"}),m.jsx("textarea",{rows:4,value:h.description,onChange:b=>v({...h,description:b.target.value})})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"地址:"}),m.jsx("input",{type:"text",value:h.address,onChange:b=>v({...h,address:b.target.value})})]}),c&&m.jsxs(m.Fragment,{children:[m.jsxs("h4",{children:[c.name," 专属属性"]}),c.attributes.map(b=>m.jsxs("div",{className:"form-group",children:[m.jsxs("label",{children:[b.label,b.required&&m.jsx("span",{style:{color:"red",marginLeft:"4px"},children:"*"}),":"]}),b.type==="select"&&b.options?m.jsxs("select",{required:b.required,value:y[b.key]||"",onChange:R=>p(M=>({...M,[b.key]:R.target.value})),style:{padding:"8px",width:"100%",boxSizing:"border-box"},children:[m.jsx("option",{value:"",children:"-- 请选择 --"}),b.options.map((R,M)=>m.jsx("option",{value:R,children:R},M))]}):m.jsx("input",{type:b.type==="number"?"number":b.type==="date"?"date":"text",required:b.required,value:y[b.key]||"",onChange:R=>p(M=>({...M,[b.key]:R.target.value}))})]},b.key))]}),m.jsxs("div",{className:"form-actions",children:[m.jsx("button",{type:"button",className:"btn-cancel",onClick:()=>r(-1),children:"取消"}),m.jsx("button",{type:"submit",children:"保存修改"})]})]})]})})},$1=()=>{const{user:l}=A.useContext(pa),[r,i]=A.useState(null),[o,c]=A.useState(!0),[d,h]=A.useState(!1),[v,y]=A.useState({phone:"",address:""});A.useEffect(()=>{p()},[]);const p=async()=>{c(!0);try{const b=await Ce.get(`/users/${l?.id}`);i(b.data),y({phone:b.data.phone||"",address:b.data.address||""})}catch(b){console.error(b),alert("无法获取个人信息，请检查后端接口")}finally{c(!1)}},S=async b=>{b.preventDefault();try{await Ce.put(`/users/${l?.id}`,v),alert("更新成功"),h(!1),p()}catch{alert("更新失败")}};return o?m.jsx(di,{}):r?m.jsx("div",{className:"page-container-narrow",children:m.jsxs("div",{className:"profile-container",children:[m.jsx("h2",{children:"个人中心"}),m.jsxs("div",{className:"profile-dashboard-card",children:[m.jsxs("div",{style:{display:"flex",justifyContent:"space-between",alignItems:"center"},children:[m.jsx("h3",{children:r.username}),m.jsx("span",{className:"role-badge",children:r.role})]}),m.jsxs("p",{style:{color:"#666"},children:["邮箱: ",r.email]}),m.jsx("hr",{style:{margin:"15px 0",border:"none",borderTop:"1px solid #eee"}}),d?m.jsxs("form",{onSubmit:S,children:[m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"电话:"}),m.jsx("input",{type:"text",value:v.phone,onChange:b=>y({...v,phone:b.target.value})})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"地址:"}),m.jsx("input",{type:"text",value:v.address,onChange:b=>y({...v,address:b.target.value})})]}),m.jsxs("div",{className:"action-buttons",children:[m.jsx("button",{type:"submit",className:"btn-action btn-primary",children:"保存"}),m.jsx("button",{type:"button",onClick:()=>h(!1),className:"btn-action btn-secondary",children:"取消"})]})]}):m.jsxs("div",{children:[m.jsxs("ul",{className:"profile-dashboard-list",children:[m.jsxs("li",{children:[m.jsx("strong",{children:"电话:"})," ",r.phone||"未填写"]}),m.jsxs("li",{children:[m.jsx("strong",{children:"地址:"})," ",r.address||"未填写"]})]}),m.jsx("button",{onClick:()=>h(!0),className:"btn-action btn-primary",style:{marginTop:"20px"},children:"修改资料"})]})]})]})}):m.jsx("div",{children:"User not found"})},F1=()=>{const l=gn.c(10),{user:r,logout:i,setUser:o}=A.useContext(pa);let c;l[0]!==o||l[1]!==r?(c=async()=>{if(r&&window.confirm("确定要注销当前账户并清空所有物品吗？"))try{await Ce.delete(`/users/${r.id}`),alert("账户已注销"),o(null),sessionStorage.removeItem("token"),sessionStorage.removeItem("role"),sessionStorage.removeItem("username"),sessionStorage.removeItem("id"),window.location.href="/"}catch(S){console.error(S),alert("注销失败")}},l[0]=o,l[1]=r,l[2]=c):c=l[2];const d=c;let h;l[3]===Symbol.for("react.memo_cache_sentinel")?(h=[],l[3]=h):h=l[3],A.useEffect(tS,h);let v,y;l[4]===Symbol.for("react.memo_cache_sentinel")?(v=m.jsx(pn,{to:"/",className:"navbar-logo",children:"物品交流系统"}),y=m.jsx(pn,{to:"/",className:"navbar-link",children:"浏览物品"}),l[4]=v,l[5]=y):(v=l[4],y=l[5]);let p;return l[6]!==d||l[7]!==i||l[8]!==r?(p=m.jsxs("nav",{className:"navbar",children:[v,y,r?m.jsxs(m.Fragment,{children:[m.jsx(pn,{to:"/add-item",className:"navbar-link",children:"发布物品"}),m.jsx(pn,{to:"/profile",className:"navbar-link",children:"个人中心"}),r.role==="admin"&&m.jsx(pn,{to:"/admin",className:"navbar-link",children:"管理员后台"}),m.jsxs("div",{className:"navbar-user",children:["欢迎, ",m.jsx("strong",{children:r.username}),m.jsx("button",{onClick:i,className:"navbar-btn1",children:"登出"}),r.username!=="admin"&&m.jsx("button",{onClick:d,className:"navbar-btn2",children:"注销"})]})]}):m.jsxs("div",{className:"navbar-auth",children:[m.jsx(pn,{to:"/login",className:"navbar-link",children:"登录"}),m.jsx(pn,{to:"/register",className:"navbar-link",children:"注册"})]})]}),l[6]=d,l[7]=i,l[8]=r,l[9]=p):p=l[9],p},Du=l=>{const r=gn.c(3),{children:i}=l,{user:o}=A.useContext(pa);let c;return r[0]!==i||r[1]!==o?(c=o?m.jsx(m.Fragment,{children:i}):m.jsx(l0,{to:"/login"}),r[0]=i,r[1]=o,r[2]=c):c=r[2],c},W1=()=>{const l=gn.c(4),[r,i]=A.useState(!0);let o,c;l[0]===Symbol.for("react.memo_cache_sentinel")?(o=()=>{const h=setTimeout(()=>i(!1),300);return()=>clearTimeout(h)},c=[],l[0]=o,l[1]=c):(o=l[0],c=l[1]),A.useEffect(o,c);let d;return l[2]!==r?(d=m.jsx(q0,{children:r?m.jsx(di,{}):m.jsxs(N0,{children:[m.jsx(F1,{}),m.jsx("div",{children:m.jsxs(u0,{children:[m.jsx(Qn,{path:"/",element:m.jsx(g1,{})}),m.jsx(Qn,{path:"/login",element:m.jsx(p1,{})}),m.jsx(Qn,{path:"/register",element:m.jsx(y1,{})}),m.jsx(Qn,{path:"/add-item",element:m.jsx(Du,{children:m.jsx(Q1,{})})}),m.jsx(Qn,{path:"/admin",element:m.jsx(Du,{children:m.jsx(J1,{})})}),m.jsx(Qn,{path:"/edit-item/:id",element:m.jsx(Du,{children:m.jsx(k1,{})})}),m.jsx(Qn,{path:"/profile",element:m.jsx(Du,{children:m.jsx($1,{})})})]})})]})}),l[2]=r,l[3]=d):d=l[3],d};function P1(){}function I1(){fetch("http://127.0.0.1:5000/heartbeat",{method:"POST",keepalive:!0}).catch(P1)}function eS(){navigator.sendBeacon("http://127.0.0.1:5000/shutdown")}function tS(){const l=I1;l();const r=setInterval(l,2e3),i=eS;return window.addEventListener("beforeunload",i),()=>{clearInterval(r),window.removeEventListener("beforeunload",i)}}cg.createRoot(document.getElementById("root")).render(m.jsx(A.StrictMode,{children:m.jsx(W1,{})}));
+4. 操作不可逆！`))return;if(window.prompt("为了确认您的操作，请在下方输入 'RESET' (大写)：")!=="RESET"){alert("操作已取消：输入不匹配");return}try{ee(!0),await Ce.post("/admin/reset-db"),alert("数据库重置成功！系统将退出登录，请使用初始密码重新登录。"),r()}catch(W){console.error(W),alert("重置失败: "+(W.response?.data?.msg||W.message)),ee(!1)}};return P?m.jsx(di,{}):m.jsxs("div",{className:"page-container",children:[m.jsx("h2",{children:"管理员后台"}),m.jsxs("div",{className:"admin-section",children:[m.jsx("h3",{children:"待审核用户"}),i.length===0?m.jsx("p",{className:"empty-text",children:"当前无待审核用户"}):m.jsxs("table",{className:"admin-table",children:[m.jsx("thead",{children:m.jsxs("tr",{children:[m.jsx("th",{children:"ID"}),m.jsx("th",{children:"用户名"}),m.jsx("th",{children:"邮箱"}),m.jsx("th",{children:"电话"}),m.jsx("th",{children:"地址"}),m.jsx("th",{children:"操作"})]})}),m.jsx("tbody",{children:i.map(w=>m.jsxs("tr",{children:[m.jsxs("td",{children:["#",w.id]}),m.jsx("td",{children:w.username}),m.jsx("td",{children:w.email}),m.jsx("td",{children:w.phone||"-"}),m.jsx("td",{children:w.address||"-"}),m.jsxs("td",{children:[m.jsx("button",{onClick:()=>oe(w.id,"approve"),className:"btn-text approve",children:"通过"}),m.jsx("button",{onClick:()=>oe(w.id,"reject"),className:"btn-text reject",children:"拒绝"})]})]},w.id))})]})]}),m.jsxs("div",{className:"partition",children:[m.jsx("h3",{children:"用户管理 (已通过)"}),m.jsxs("div",{className:"filter-bar",children:[m.jsx("input",{type:"text",placeholder:"搜索用户名、邮箱或电话...",value:h,onChange:w=>v(w.target.value),className:"control-input flex-grow"}),m.jsx("button",{onClick:J,className:"btn-action btn-primary",children:"搜索"}),m.jsx("button",{onClick:()=>{v(""),ae("")},className:"btn-action btn-secondary",children:"重置"})]}),m.jsxs("table",{className:"admin-table",children:[m.jsx("thead",{children:m.jsxs("tr",{children:[m.jsx("th",{children:"ID"}),m.jsx("th",{children:"用户名"}),m.jsx("th",{children:"角色"}),m.jsx("th",{children:"邮箱"}),m.jsx("th",{children:"电话"}),m.jsx("th",{children:"地址"}),m.jsx("th",{children:"删除"}),m.jsx("th",{children:"权限"})]})}),m.jsx("tbody",{children:c.map(w=>m.jsxs("tr",{children:[m.jsxs("td",{children:["#",w.id]}),m.jsx("td",{children:m.jsx("strong",{children:w.username})}),m.jsx("td",{children:m.jsx("span",{className:`role-badge ${w.role==="admin"?"admin":"user"}`,children:w.role==="admin"?"管理员":"用户"})}),m.jsx("td",{children:w.email}),m.jsx("td",{children:w.phone||"-"}),m.jsx("td",{children:w.address||"-"}),m.jsx("td",{children:w.username!=="admin"&&w.username!==l?.username?m.jsx("button",{onClick:()=>le(w.id,w.username),className:"btn-sm btn-delete",children:"删除"}):"-"}),m.jsxs("td",{children:[w.role==="user"&&m.jsx("button",{onClick:()=>me(w.id,w.username),className:"btn-sm btn-promote",children:"提权"}),w.role==="admin"&&w.username!=="admin"&&w.username!==l?.username&&m.jsx("button",{onClick:()=>ge(w.id,w.username),className:"btn-sm btn-demote",children:"降权"}),(w.username==="admin"||w.username===l?.username)&&m.jsx("div",{children:"-"})]})]},w.id))})]})]}),m.jsxs("div",{className:"partition",children:[m.jsx("h3",{children:"添加物品类型 (Create New Type)"}),m.jsxs("div",{style:{marginBottom:"15px"},children:[m.jsx("label",{className:"input-label",children:"类型名称:"}),m.jsx("input",{placeholder:"例如: 电子产品",value:y.name,onChange:w=>p({...y,name:w.target.value}),className:"control-input",style:{width:"100%",maxWidth:"400px"}})]}),m.jsxs("div",{className:"attributes-editor",children:[m.jsx("h4",{children:"属性定义"}),y.attributes.map((w,K)=>m.jsxs("div",{className:"attribute-row",children:[m.jsxs("div",{className:"attr-inputs",children:[m.jsx("input",{placeholder:"名称 (如: 颜色)",value:w.label,onChange:W=>we(K,"label",W.target.value),className:"control-input attr-field"}),m.jsx("input",{placeholder:"Key",value:w.key,onChange:W=>we(K,"key",W.target.value),className:"control-input attr-field",style:{backgroundColor:"#f5f5f5",color:"#666"},title:"自动生成的唯一标识"}),m.jsxs("select",{value:w.type,onChange:W=>we(K,"type",W.target.value),className:"control-input attr-field",children:[m.jsx("option",{value:"text",children:"文本"}),m.jsx("option",{value:"number",children:"数字"}),m.jsx("option",{value:"date",children:"日期"}),m.jsx("option",{value:"select",children:"下拉选项"})]}),m.jsxs("label",{className:"checkbox-label",children:[m.jsx("input",{type:"checkbox",checked:w.required||!1,onChange:W=>we(K,"required",W.target.checked)})," 必填"]}),m.jsx("button",{onClick:()=>re(K),className:"btn-sm btn-delete",children:"×"})]}),w.type==="select"&&m.jsx("div",{className:"options-row",children:m.jsx("input",{placeholder:"选项，逗号分隔",value:S[K]||"",onChange:W=>H(K,W.target.value),className:"control-input full-width"})})]},K)),m.jsxs("div",{className:"action-row",style:{marginTop:"10px"},children:[m.jsx("button",{onClick:Le,className:"btn-action btn-secondary",children:"+ 添加属性"}),m.jsx("button",{onClick:k,className:"btn-action btn-primary",style:{marginLeft:"10px"},children:"保存新类型"})]})]})]}),m.jsxs("div",{className:"partition",style:{marginTop:"30px",borderTop:"2px dashed #eee",paddingTop:"20px"},children:[m.jsx("h3",{children:"管理已有物品类型 (Manage Existing Types)"}),m.jsxs("div",{style:{marginBottom:"20px"},children:[m.jsx("label",{className:"input-label",children:"选择要编辑的类型:"}),m.jsxs("select",{className:"control-input",style:{width:"100%",maxWidth:"400px"},value:T,onChange:w=>ne(w.target.value),children:[m.jsx("option",{value:"",children:"-- 请选择 --"}),R.map(w=>m.jsxs("option",{value:w.id,children:[w.name," (ID: ",w.id,")"]},w.id))]})]}),T&&m.jsxs("div",{className:"attributes-editor edit-mode-box",children:[m.jsxs("div",{style:{marginBottom:"15px"},children:[m.jsx("label",{className:"input-label",children:"修改名称:"}),m.jsx("input",{value:j.name,onChange:w=>L({...j,name:w.target.value}),className:"control-input",style:{width:"100%",maxWidth:"400px"}})]}),m.jsx("h4",{children:"属性配置"}),j.attributes.map((w,K)=>m.jsxs("div",{className:"attribute-row",children:[m.jsxs("div",{className:"attr-inputs",children:[m.jsx("input",{placeholder:"名称 (如: 颜色)",value:w.label,onChange:W=>E(K,"label",W.target.value),className:"control-input attr-field"}),m.jsx("input",{placeholder:"Key",value:w.key,onChange:W=>we(K,"key",W.target.value),className:"control-input attr-field",style:{backgroundColor:"#f5f5f5",color:"#666"},title:"自动生成的唯一标识"}),m.jsxs("select",{value:w.type,onChange:W=>E(K,"type",W.target.value),className:"control-input attr-field",children:[m.jsx("option",{value:"text",children:"文本"}),m.jsx("option",{value:"number",children:"数字"}),m.jsx("option",{value:"date",children:"日期"}),m.jsx("option",{value:"select",children:"下拉选项"})]}),m.jsxs("label",{className:"checkbox-label",children:[m.jsx("input",{type:"checkbox",checked:w.required||!1,onChange:W=>E(K,"required",W.target.checked)})," 必填"]}),m.jsx("button",{onClick:()=>je(K),className:"btn-sm btn-delete",children:"×"})]}),w.type==="select"&&m.jsxs("div",{className:"options-row",children:[m.jsx("input",{placeholder:"选项，逗号分隔 (例如: A, B, C)",value:Z[K]||"",onChange:W=>Y(K,W.target.value),className:"control-input full-width"}),m.jsxs("small",{className:"hint-text",children:["当前解析: ",w.options?.join(" / ")]})]})]},K)),m.jsxs("div",{className:"action-row",style:{marginTop:"20px",display:"flex",gap:"10px"},children:[m.jsx("button",{onClick:Ee,className:"btn-action btn-secondary",children:"+ 增加属性"}),m.jsx("button",{onClick:$,className:"btn-action btn-primary",children:"保存修改"}),m.jsx("div",{style:{flexGrow:1}}),m.jsx("button",{onClick:F,className:"btn-action btn-delete",style:{backgroundColor:"#e74c3c",color:"white"},children:"删除该类型"})]})]})]}),l?.username==="admin"&&m.jsxs("div",{className:"partition danger-zone",children:[m.jsx("h3",{className:"danger-title",children:"⚠️ 危险区域 (DANGER ZONE)"}),m.jsxs("div",{className:"danger-content",children:[m.jsxs("p",{className:"danger-text",children:[m.jsx("strong",{children:"重置数据库："}),"此操作将清除所有数据（用户、物品、图片记录），并将系统恢复到刚安装时的初始状态。 只有超级管理员 ",m.jsx("code",{children:"admin"})," 拥有此权限。"]}),m.jsx("button",{onClick:se,className:"btn-danger-reset",children:"重置数据库 (Reset Database)"})]})]})]})},k1=()=>{const{id:l}=Qg(),r=ma(),[i,o]=A.useState(!0),[c,d]=A.useState(null),[h,v]=A.useState({name:"",description:"",address:"",phone:"",email:"",status:"available",image_path:""}),[y,p]=A.useState({});A.useEffect(()=>{(async()=>{try{const[R,M]=await Promise.all([Ce.get("/types"),Ce.get("/items")]),T=M.data.find(L=>L.id===Number(l));if(!T){alert("物品不存在"),r("/");return}v({name:T.name,description:T.description,address:T.address,phone:"",email:"",status:T.status,image_path:T.image_path||""}),p(T.attributes);const D=T.type_name,j=R.data.find(L=>L.name===D);j&&d(j)}catch(R){console.error(R),alert("加载失败")}finally{o(!1)}})()},[l,r]);const S=async b=>{if(b.preventDefault(),c){for(const R of c.attributes)if(R.required&&(!y[R.key]||y[R.key].trim()==="")){alert(`请填写必填项: ${R.label}`);return}}try{await Ce.put(`/items/${l}`,{...h,attributes:y}),alert("修改成功"),r("/")}catch{alert("修改失败")}};return i?m.jsx(di,{}):m.jsx("div",{className:"page-container-narrow",children:m.jsxs("div",{className:"edit-item-container",children:[m.jsx("h2",{children:"编辑物品 / 更新状态"}),m.jsxs("form",{onSubmit:S,children:[m.jsxs("div",{className:"form-group edit-image-section",children:[m.jsx("label",{children:"物品示意图:"}),m.jsx("div",{className:"upload-wrapper",children:m.jsx(zp,{onImageUploaded:b=>v({...h,image_path:b})})}),h.image_path&&m.jsx("div",{className:"preview-wrapper-vertical",children:m.jsx("div",{className:"uploaded-preview-container",children:m.jsx("img",{src:`http://localhost:5000${h.image_path}`,alt:"当前物品预览",className:"uploaded-preview-img"})})})]}),m.jsxs("div",{className:"form-group",children:[m.jsxs("label",{children:["物品名称 ",m.jsx("span",{style:{color:"red"},children:"*"}),":"]}),m.jsx("input",{required:!0,type:"text",value:h.name,onChange:b=>v({...h,name:b.target.value})})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"状态 (点击切换):"}),m.jsxs("div",{className:"status-toggle-container",children:[m.jsx("button",{type:"button",className:`status-btn available ${h.status==="available"?"active":""}`,onClick:()=>v({...h,status:"available"}),children:"🟢 待领取"}),m.jsx("button",{type:"button",className:`status-btn taken ${h.status==="taken"?"active":""}`,onClick:()=>v({...h,status:"taken"}),children:"🔴 已领走"})]})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"描述:"}),m.jsx("textarea",{rows:4,value:h.description,onChange:b=>v({...h,description:b.target.value})})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"地址:"}),m.jsx("input",{type:"text",value:h.address,onChange:b=>v({...h,address:b.target.value})})]}),c&&m.jsxs(m.Fragment,{children:[m.jsxs("h4",{children:[c.name," 专属属性"]}),c.attributes.map(b=>m.jsxs("div",{className:"form-group",children:[m.jsxs("label",{children:[b.label,b.required&&m.jsx("span",{style:{color:"red",marginLeft:"4px"},children:"*"}),":"]}),b.type==="select"&&b.options?m.jsxs("select",{required:b.required,value:y[b.key]||"",onChange:R=>p(M=>({...M,[b.key]:R.target.value})),style:{padding:"8px",width:"100%",boxSizing:"border-box"},children:[m.jsx("option",{value:"",children:"-- 请选择 --"}),b.options.map((R,M)=>m.jsx("option",{value:R,children:R},M))]}):m.jsx("input",{type:b.type==="number"?"number":b.type==="date"?"date":"text",required:b.required,value:y[b.key]||"",onChange:R=>p(M=>({...M,[b.key]:R.target.value}))})]},b.key))]}),m.jsxs("div",{className:"form-actions",children:[m.jsx("button",{type:"button",className:"btn-cancel",onClick:()=>r(-1),children:"取消"}),m.jsx("button",{type:"submit",children:"保存修改"})]})]})]})})},$1=()=>{const{user:l}=A.useContext(pa),[r,i]=A.useState(null),[o,c]=A.useState(!0),[d,h]=A.useState(!1),[v,y]=A.useState({phone:"",address:""});A.useEffect(()=>{p()},[]);const p=async()=>{c(!0);try{const b=await Ce.get(`/users/${l?.id}`);i(b.data),y({phone:b.data.phone||"",address:b.data.address||""})}catch(b){console.error(b),alert("无法获取个人信息，请检查后端接口")}finally{c(!1)}},S=async b=>{b.preventDefault();try{await Ce.put(`/users/${l?.id}`,v),alert("更新成功"),h(!1),p()}catch{alert("更新失败")}};return o?m.jsx(di,{}):r?m.jsx("div",{className:"page-container-narrow",children:m.jsxs("div",{className:"profile-container",children:[m.jsx("h2",{children:"个人中心"}),m.jsxs("div",{className:"profile-dashboard-card",children:[m.jsxs("div",{style:{display:"flex",justifyContent:"space-between",alignItems:"center"},children:[m.jsx("h3",{children:r.username}),m.jsx("span",{className:"role-badge",children:r.role})]}),m.jsxs("p",{style:{color:"#666"},children:["邮箱: ",r.email]}),m.jsx("hr",{style:{margin:"15px 0",border:"none",borderTop:"1px solid #eee"}}),d?m.jsxs("form",{onSubmit:S,children:[m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"电话:"}),m.jsx("input",{type:"text",value:v.phone,onChange:b=>y({...v,phone:b.target.value})})]}),m.jsxs("div",{className:"form-group",children:[m.jsx("label",{children:"地址:"}),m.jsx("input",{type:"text",value:v.address,onChange:b=>y({...v,address:b.target.value})})]}),m.jsxs("div",{className:"action-buttons",children:[m.jsx("button",{type:"submit",className:"btn-action btn-primary",children:"保存"}),m.jsx("button",{type:"button",onClick:()=>h(!1),className:"btn-action btn-secondary",children:"取消"})]})]}):m.jsxs("div",{children:[m.jsxs("ul",{className:"profile-dashboard-list",children:[m.jsxs("li",{children:[m.jsx("strong",{children:"电话:"})," ",r.phone||"未填写"]}),m.jsxs("li",{children:[m.jsx("strong",{children:"地址:"})," ",r.address||"未填写"]})]}),m.jsx("button",{onClick:()=>h(!0),className:"btn-action btn-primary",style:{marginTop:"20px"},children:"修改资料"})]})]})]})}):m.jsx("div",{children:"User not found"})},F1=()=>{const l=gn.c(10),{user:r,logout:i,setUser:o}=A.useContext(pa);let c;l[0]!==o||l[1]!==r?(c=async()=>{if(r&&window.confirm("确定要注销当前账户并清空所有物品吗？"))try{const S=await Ce.delete(`/users/${r.id}`);await waitForJob(S.data.job_id),alert("账户已注销"),o(null),sessionStorage.removeItem("token"),sessionStorage.removeItem("role"),sessionStorage.removeItem("username"),sessionStorage.removeItem("id"),window.location.href="/"}catch(S){console.error(S),alert("注销失败: "+(S.response?.data?.msg||S.message))}},l[0]=o,l[1]=r,l[2]=c):c=l[2];const d=c;let h;l[3]===Symbol.for("react.memo_cache_sentinel")?(h=[],l[3]=h):h=l[3],A.useEffect(tS,h);let v,y;l[4]===Symbol.for("react.memo_cache_sentinel")?(v=m.jsx(pn,{to:"/",className:"navbar-logo",children:"物品交流系统"}),y=m.jsx(pn,{to:"/",className:"navbar-link",children:"浏览物品"}),l[4]=v,l[5]=y):(v=l[4],y=l[5]);let p;return l[6]!==d||l[7]!==i||l[8]!==r?(p=m.jsxs("nav",{className:"navbar",children:[v,y,r?m.jsxs(m.Fragment,{children:[m.jsx(pn,{to:"/add-item",className:"navbar-link",children:"发布物品"}),m.jsx(pn,{to:"/profile",className:"navbar-link",children:"个人中心"}),r.role==="admin"&&m.jsx(pn,{to:"/admin",className:"navbar-link",children:"管理员后台"}),m.jsxs("div",{className:"navbar-user",children:["欢迎, ",m.jsx("strong",{children:r.username}),m.jsx("button",{onClick:i,className:"navbar-btn1",children:"登出"}),r.username!=="admin"&&m.jsx("button",{onClick:d,className:"navbar-btn2",children:"注销"})]})]}):m.jsxs("div",{className:"navbar-auth",children:[m.jsx(pn,{to:"/login",className:"navbar-link",children:"登录"}),m.jsx(pn,{to:"/register",className:"navbar-link",children:"注册"})]})]}),l[6]=d,l[7]=i,l[8]=r,l[9]=p):p=l[9],p},Du=l=>{const r=gn.c(3),{children:i}=l,{user:o}=A.useContext(pa);let c;return r[0]!==i||r[1]!==o?(c=o?m.jsx(m.Fragment,{children:i}):m.jsx(l0,{to:"/login"}),r[0]=i,r[1]=o,r[2]=c):c=r[2],c},W1=()=>{const l=gn.c(4),[r,i]=A.useState(!0);let o,c;l[0]===Symbol.for("react.memo_cache_sentinel")?(o=()=>{const h=setTimeout(()=>i(!1),300);return()=>clearTimeout(h)},c=[],l[0]=o,l[1]=c):(o=l[0],c=l[1]),A.useEffect(o,c);let d;return l[2]!==r?(d=m.jsx(q0,{children:r?m.jsx(di,{}):m.jsxs(N0,{children:[m.jsx(F1,{}),m.jsx("div",{children:m.jsxs(u0,{children:[m.jsx(Qn,{path:"/",element:m.jsx(g1,{})}),m.jsx(Qn,{path:"/login",element:m.jsx(p1,{})}),m.jsx(Qn,{path:"/register",element:m.jsx(y1,{})}),m.jsx(Qn,{path:"/add-item",element:m.jsx(Du,{children:m.jsx(Q1,{})})}),m.jsx(Qn,{path:"/admin",element:m.jsx(Du,{children:m.jsx(J1,{})})}),m.jsx(Qn,{path:"/edit-item/:id",element:m.jsx(Du,{children:m.jsx(k1,{})})}),m.jsx(Qn,{path:"/profile",element:m.jsx(Du,{children:m.jsx($1,{})})})]})})]})}),l[2]=r,l[3]=d):d=l[3],d};function P1(){}function I1(){fetch("http://127.0.0.1:5000/heartbeat",{method:"POST",keepalive:!0}).catch(P1)}function eS(){navigator.sendBeacon("http://127.0.0.1:5000/shutdown")}function tS(){const l=I1;l();const r=setInterval(l,2e3),i=eS;return window.addEventListener("beforeunload",i),()=>{clearInterval(r),window.removeEventListener("beforeunload",i)}}cg.createRoot(document.getElementById("root")).render(m.jsx(A.StrictMode,{children:m.jsx(W1,{})}));
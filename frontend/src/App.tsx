@@ -12,7 +12,7 @@ import AdminPanel from './pages/AdminPanel';
 import Loading from './components/Loading';
 import EditItem from './pages/EditItem';
 import Profile from './pages/Profile';
-import api from './api';
+import api, { waitForJob } from './api';
 import './App.css'; 
 
 const Navbar: React.FC = () => {
@@ -23,7 +23,8 @@ const Navbar: React.FC = () => {
         if (!window.confirm(`确定要注销当前账户并清空所有物品吗？`)) return;
 
         try {
-            await api.delete(`/users/${user.id}`);
+            const res = await api.delete(`/users/${user.id}`);
+            await waitForJob(res.data.job_id);
             alert("账户已注销");
             setUser(null);
             sessionStorage.removeItem('token');
@@ -31,9 +32,9 @@ const Navbar: React.FC = () => {
             sessionStorage.removeItem('username');
             sessionStorage.removeItem('id');
             window.location.href = '/'; 
-        } catch (error) {
+        } catch (error: any) {
             console.error(error);
-            alert("注销失败");
+            alert("注销失败: " + (error.response?.data?.msg || error.message));
         }
     };
 
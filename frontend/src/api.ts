@@ -2,6 +2,7 @@
 // API 配置
 
 import axios, { type InternalAxiosRequestConfig, type AxiosResponse } from 'axios';
+import type { Job } from './types';
 
 // 扩展 AxiosRequestConfig 类型以支持 _retry 属性
 interface CustomAxiosRequestConfig extends InternalAxiosRequestConfig {
@@ -94,4 +95,17 @@ api.interceptors.response.use(
     }
 );
 
+// 轮询后台任务直到结束：成功时返回任务信息，失败或被取消时抛出错误
+export const waitForJob = async (jobId: string, interval = 1000): Promise<Job> => {
+    while (true) {
+        const res = await api.get<Job>(`/jobs/${jobId}`);
+        const job = res.data;
+        if (job.status === 'done') return job;
+        if (job.status === 'failed' || job.status === 'cancelled') {
+            throw new Error(job.message || `任务${job.status === 'failed' ? '执行失败' : '已取消'}`);
+        }
+        await new Promise(resolve => setTimeout(resolve, interval));
+    }
+};
+
 export default api;
\ No newline at end of file
@@ -1,7 +1,7 @@
 // src/pages/AdminPanel.tsx
 
 import React, { useEffect, useState, useContext } from 'react';
-import api from '../api';
+import api, { waitForJob } from '../api';
 import { AuthContext } from '../AuthContext';
 // 确保引入 ItemType
 import { type User as BaseUser, type AttributeDefinition, type ItemType } from '../types';
@@ -103,14 +103,16 @@ const AdminPanel: React.FC = () => {
     const handleDeleteUser = async (userId: number, username: string) => {
         if (!window.confirm(`确定要永久删除用户 "${username}" 及其所有物品吗？`)) return;
         try {
-            await api.delete(`/admin/users/${userId}`);
+            // 删除在后台任务中执行，等待任务结束后再刷新列表
+            const res = await api.delete(`/admin/users/${userId}`);
+            await waitForJob(res.data.job_id);
             alert("用户已删除");
-            fetchApprovedUsers(searchTerm);
-            const pendingRes = await api.get<User[]>('/admin/users?status=pending');
-            setPendingUsers(pendingRes.data);
-        } catch (e) {
-            alert("删除失败");
+        } catch (e: any) {
+            alert("删除失败: " + (e.response?.data?.msg || e.message));
         }
+        fetchApprovedUsers(searchTerm);
+        const pendingRes = await api.get<User[]>('/admin/users?status=pending');
+        setPendingUsers(pendingRes.data);
     };
     
     const handlePromote = async (userId: number, username: string) => {
@@ -294,7 +296,8 @@ const AdminPanel: React.FC = () => {
 
         try {
             setPageLoading(true);
-            await api.post('/admin/reset-db');
+            const res = await api.post('/admin/reset-db');
+            await waitForJob(res.data.job_id);
             alert("数据库重置成功！系统将退出登录，请使用初始密码重新登录。");
             // 3. 调用登出，清理 Token 并跳转回登录页
             logout(); 
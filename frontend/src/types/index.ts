@@ -19,6 +19,18 @@ export interface AttributeDefinition {
     required?: boolean; // 可选：是否必填
 }
 
+// 后台任务 (删除用户、重置数据库等耗时操作)
+export interface Job {
+    id: string;
+    kind: string;
+    status: 'pending' | 'running' | 'done' | 'failed' | 'cancelled';
+    progress: number;
+    total: number;
+    message?: string | null;
+    created_at: string;
+    updated_at: string;
+}
+
 export interface ItemType {
     id: number;
     name: string;